@@ -0,0 +1,150 @@
+"""
+Registro de localizadores de los page objects con creación perezosa y memorizada por instancia.
+
+Los localizadores declarados con `@locator_cacheado` se construyen la primera vez que se acceden y
+se reutilizan en los accesos siguientes sobre la misma instancia (una por página). Un `Locator` de
+Playwright es perezoso (no apunta a un nodo concreto hasta que se usa), así que reutilizarlo es seguro.
+
+Cada localizador puede declarar un selector alternativo más barato (ej: anclado a un encabezado en
+lugar de filtrar todos los `div` de la página). Las alternativas solo se usan si la variable de entorno
+`LOCATORS_ALTERNATIVOS` está activa, y `verificar_equivalencias` comprueba que resuelven el mismo nodo.
+"""
+import os
+import time
+import logging
+from typing import Callable, Dict, List, Any, Optional
+
+from playwright.sync_api import Locator
+
+from utils.config import LOGGER_DIR
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='registro_locators',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+VARIABLE_ENTORNO_ALTERNATIVOS = "LOCATORS_ALTERNATIVOS"
+
+
+def usar_alternativos() -> bool:
+    """Indica si los selectores alternativos están activados por la variable de entorno `LOCATORS_ALTERNATIVOS`."""
+    return os.getenv(VARIABLE_ENTORNO_ALTERNATIVOS, "").strip().lower() in ("1", "true", "si", "sí", "yes")
+
+
+class LocatorCacheado:
+    """
+    Descriptor que sustituye a `@property` en los page objects: construye el localizador una sola vez
+    por instancia y lo guarda en `instancia._locators_cacheados`.
+    """
+
+    def __init__(self, fabrica: Callable[[Any], Locator], alternativo: Optional[Callable[[Any], Locator]] = None):
+        self.fabrica = fabrica
+        self.alternativo = alternativo
+        self.nombre = fabrica.__name__
+        self.__doc__ = fabrica.__doc__
+
+    def __set_name__(self, propietario: type, nombre: str) -> None:
+        self.nombre = nombre
+        # Cada clase lleva su propio registro (sin heredar el de la clase padre por referencia).
+        if "_registro_locators" not in propietario.__dict__:
+            propietario._registro_locators = dict(getattr(propietario, "_registro_locators", {}))
+        propietario._registro_locators[nombre] = self
+
+    def __get__(self, instancia: Any, propietario: type = None):
+        if instancia is None:
+            return self
+        cache = instancia.__dict__.setdefault("_locators_cacheados", {})
+        locator = cache.get(self.nombre)
+        if locator is None:
+            locator = self.construir(instancia, alternativo=usar_alternativos())
+            cache[self.nombre] = locator
+        return locator
+
+    def construir(self, instancia: Any, alternativo: bool = False) -> Locator:
+        """Construye el localizador sin pasar por la caché (el alternativo solo si existe y se pide)."""
+        if alternativo and self.alternativo is not None:
+            return self.alternativo(instancia)
+        return self.fabrica(instancia)
+
+
+def locator_cacheado(alternativo: Optional[Callable[[Any], Locator]] = None):
+    """
+    Decorador para declarar un localizador memorizado por instancia.
+
+    Args:
+        alternativo (Optional[Callable[[Any], Locator]]): Función que recibe la instancia del page object
+                                                          y devuelve un selector equivalente más barato.
+    """
+    def decorador(fabrica: Callable[[Any], Locator]) -> LocatorCacheado:
+        return LocatorCacheado(fabrica, alternativo)
+    return decorador
+
+
+def limpiar_cache(instancia: Any) -> None:
+    """Descarta los localizadores memorizados de una instancia (ej: tras cambiar de página)."""
+    instancia.__dict__.pop("_locators_cacheados", None)
+
+
+def verificar_equivalencias(instancia: Any) -> Dict[str, bool]:
+    """
+    Comprueba, sobre la página ya cargada, que cada selector alternativo resuelve el mismo nodo que el original.
+
+    Returns:
+        Dict[str, bool]: Nombre del localizador -> `True` si ambos apuntan al mismo elemento.
+    """
+    resultados: Dict[str, bool] = {}
+    for nombre, descriptor in type(instancia)._registro_locators.items():
+        if descriptor.alternativo is None:
+            continue
+        try:
+            original = descriptor.construir(instancia)
+            alternativo = descriptor.construir(instancia, alternativo=True)
+            handle = original.element_handle(timeout=5000)
+            equivalente = alternativo.count() == original.count() and alternativo.evaluate("(e, o) => e === o", handle)
+            resultados[nombre] = bool(equivalente)
+            if equivalente:
+                logger.info(f"\n✅ El selector alternativo de '{nombre}' es equivalente al original.")
+            else:
+                logger.warning(f"\n⚠️ El selector alternativo de '{nombre}' NO resuelve el mismo elemento que el original.")
+        except Exception as e:
+            resultados[nombre] = False
+            logger.error(f"\n❌ No se pudo verificar la equivalencia del localizador '{nombre}'. Detalles: {e}")
+    return resultados
+
+
+def informe_resolucion(instancia: Any, incluir_alternativos: bool = True) -> List[Dict[str, Any]]:
+    """
+    Mide el tiempo de resolución (`count()`) de cada localizador registrado sobre la página actual,
+    para detectar los selectores costosos.
+
+    Args:
+        instancia (Any): Instancia del page object (ej: `HomeLocatorsPage`).
+        incluir_alternativos (bool): Si es `True`, mide también el selector alternativo cuando exista.
+
+    Returns:
+        List[Dict[str, Any]]: Entradas {"locator", "variante", "coincidencias", "segundos"} ordenadas de mayor a menor tiempo.
+    """
+    informe: List[Dict[str, Any]] = []
+    for nombre, descriptor in type(instancia)._registro_locators.items():
+        variantes = [("original", False)]
+        if incluir_alternativos and descriptor.alternativo is not None:
+            variantes.append(("alternativo", True))
+        for variante, alternativo in variantes:
+            try:
+                locator = descriptor.construir(instancia, alternativo=alternativo)
+                start_time_resolucion = time.time()
+                coincidencias = locator.count()
+                duration_resolucion = time.time() - start_time_resolucion
+            except Exception as e:
+                logger.error(f"\n❌ No se pudo resolver el localizador '{nombre}' ({variante}). Detalles: {e}")
+                continue
+            informe.append({"locator": nombre, "variante": variante, "coincidencias": coincidencias, "segundos": round(duration_resolucion, 4)})
+
+    informe.sort(key=lambda entrada: -entrada["segundos"])
+    for entrada in informe:
+        logger.info(f"PERFORMANCE: Resolución del localizador '{entrada['locator']}' ({entrada['variante']}): "
+                    f"{entrada['segundos']:.4f} segundos, {entrada['coincidencias']} coincidencias.")
+    return informe
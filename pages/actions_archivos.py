@@ -1,14 +1,21 @@
 import os
 import time
 import csv
+import itertools
 import json
 import xml.etree.ElementTree as ET
-from typing import Union, Optional, Dict, Any, List
+from typing import Union, Optional, Dict, Any, List, Tuple, Iterable, Iterator
 import openpyxl
 from zipfile import BadZipFile
 from openpyxl.utils.exceptions import InvalidFileException
 import pandas as pd
-from playwright.sync_api import Page, Locator, expect, Error, TimeoutError
+from utils.cache_archivos_datos import obtener_hoja_excel, encabezados_csv, normalizar_encabezado
+from utils.indice_filas_csv import obtener_indice_csv
+from utils.fuente_datos import cargar_fuente_datos, cargar_registros
+from utils.gestor_descargas import GestorDescargas, ResultadoDescarga
+from utils.generador_archivos import preparar_para_set_input_files
+from utils.escritores_datos import es_json_lines, anexar_lineas_json, iterar_lineas_json, SesionEscrituraExcel, SesionEscrituraCSV
+from playwright.sync_api import Page, Locator, FilePayload, expect, Error, TimeoutError
 
 class FileActions:
     def __init__(self, base_page):
@@ -83,9 +90,11 @@ class FileActions:
             expect(locator).to_be_visible()
             expect(locator).to_be_enabled() # También se puede usar to_be_editable() si es un input
             self.logger.info(f"\nEl selector '{selector}' está visible y habilitado.")
+            duration_espera_selector = time.time() - start_time_file_upload
+            self.logger.info(f"PERFORMANCE: Tiempo de espera del selector '{selector}' (visible y habilitado): {duration_espera_selector:.4f} segundos.")
 
             # 2. Opcional: Resaltar el elemento para depuración visual
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             self.logger.debug(f"\nElemento con selector '{selector}' resaltado.")
             self.base.tomar_captura(f"{nombre_base}_antes_cargar_archivos", directorio) # Captura antes de adjuntar los archivos.
 
@@ -93,7 +102,10 @@ class FileActions:
             # Playwright maneja la interacción con el diálogo de carga de archivos.
             # Se le pasa una lista de rutas completas de los archivos a adjuntar.
             self.logger.info(f"\nAdjuntando archivo(s) {file_names_list} al selector '{selector}'.")
+            start_time_set_input_files = time.time()
             locator.set_input_files(full_file_paths)
+            duration_set_input_files = time.time() - start_time_set_input_files
+            self.logger.info(f"PERFORMANCE: Tiempo de transferencia (set_input_files) del archivo(s) '{file_names_list}': {duration_set_input_files:.4f} segundos.")
 
             # --- Medición de rendimiento: Fin de la operación de carga de archivos ---
             # Registra el tiempo una vez que Playwright ha adjuntado los archivos.
@@ -150,6 +162,94 @@ class FileActions:
             self.base.tomar_captura(f"{nombre_base}_error_inesperado_cargar_archivo", directorio)
             raise # Re-lanza la excepción.
         
+    def cargar_archivo_desde_memoria(self, selector: Union[str, Locator], nombre_base: str, directorio: str, archivos: Union[FilePayload, List[FilePayload]], tiempo: Union[int, float] = 0.5) -> bool:
+        """
+        Carga uno o varios archivos en memoria en un elemento de entrada de tipo 'file', sin escribirlos en disco.
+        Los archivos se describen como `FilePayload` ({"name", "mimeType", "buffer"}); para archivos sintéticos
+        de un tamaño y tipo concretos usar `utils.generador_archivos.generar_archivo_sintetico`, que reutiliza
+        el buffer de una misma especificación durante toda la sesión.
+        Playwright no acepta buffers de más de 50 MB: esos archivos se adjuntan desde un archivo temporal que se
+        escribe una sola vez por sesión (ver `utils.generador_archivos.preparar_para_set_input_files`).
+        El tiempo de espera del selector y el de transferencia de los archivos se registran por separado.
+
+        Args:
+            selector (Union[str, Locator]): El selector del elemento de entrada de archivo (input[type="file"]).
+            nombre_base (str): Nombre base utilizado para las capturas de pantalla.
+            directorio (str): Ruta del directorio donde se guardarán las capturas de pantalla.
+            archivos (Union[FilePayload, List[FilePayload]]): El archivo o la lista de archivos en memoria.
+            tiempo (Union[int, float]): Tiempo máximo de espera (en segundos) para que el elemento esté
+                                        visible y habilitado.
+
+        Returns:
+            bool: `True` si los archivos se cargan exitosamente; `False` si el elemento no estuvo listo a tiempo.
+
+        Raises:
+            Error: Si ocurre un problema específico de Playwright (ej., el elemento no es un input de tipo file).
+            Exception: Para cualquier otro error inesperado.
+        """
+        archivos_list = [archivos] if isinstance(archivos, dict) else list(archivos)
+        nombres = [archivo["name"] for archivo in archivos_list]
+        total_bytes = sum(len(archivo["buffer"]) for archivo in archivos_list)
+        locator = self.page.locator(selector) if isinstance(selector, str) else selector
+
+        self.logger.info(f"\nIntentando cargar desde memoria el/los archivo(s) {nombres} ({total_bytes} bytes) en el selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+
+        # --- Medición de rendimiento: Inicio de la espera del selector ---
+        start_time_espera_selector = time.time()
+        try:
+            # 1. Esperar a que el elemento de entrada de archivo esté visible y habilitado.
+            expect(locator).to_be_visible(timeout=tiempo * 1000)
+            expect(locator).to_be_enabled(timeout=tiempo * 1000)
+            duration_espera_selector = time.time() - start_time_espera_selector
+            self.logger.info(f"PERFORMANCE: Tiempo de espera del selector '{selector}' (visible y habilitado): {duration_espera_selector:.4f} segundos.")
+
+            self.base.resaltar_elemento(locator)
+            self.base.tomar_captura(f"{nombre_base}_antes_cargar_archivos_memoria", directorio)
+
+            # 2. Adjuntar los buffers. Playwright los envía al navegador sin pasar por el sistema de archivos,
+            #    salvo los que superan su límite de 50 MB, que se adjuntan desde un archivo temporal.
+            start_time_set_input_files = time.time()
+            locator.set_input_files(preparar_para_set_input_files(archivos_list))
+            duration_set_input_files = time.time() - start_time_set_input_files
+            mb_por_segundo = (total_bytes / (1024 * 1024)) / duration_set_input_files if duration_set_input_files > 0 else 0.0
+            self.logger.info(f"PERFORMANCE: Tiempo de transferencia (set_input_files) de {nombres} ({total_bytes} bytes): {duration_set_input_files:.4f} segundos ({mb_por_segundo:.2f} MB/s).")
+
+            self.logger.info(f"\n✅ Archivo(s) {nombres} cargado(s) exitosamente desde memoria en el selector '{selector}'.")
+            self.base.tomar_captura(f"{nombre_base}_archivos_memoria_cargados", directorio)
+            return True
+
+        except (TimeoutError, AssertionError) as e:
+            duration_fail = time.time() - start_time_espera_selector
+            error_msg = (
+                f"\n❌ FALLO (Timeout): El elemento '{selector}' no estuvo visible o habilitado "
+                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s) para cargar {nombres}. "
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_cargar_archivo_memoria", directorio)
+            return False
+
+        except Error as e:
+            error_msg = (
+                f"\n❌ FALLO (Playwright): Error de Playwright al cargar desde memoria {nombres} "
+                f"en el selector '{selector}'. Esto puede deberse a un selector incorrecto o que el elemento "
+                f"no es un input de tipo archivo válido.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_cargar_archivo_memoria", directorio)
+            raise
+
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al cargar desde memoria {nombres} "
+                f"en el selector '{selector}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_cargar_archivo_memoria", directorio)
+            raise
+
     def remover_carga_de_archivo(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Remueve la carga de archivo(s) de un elemento de entrada de tipo 'file'
@@ -198,7 +298,7 @@ class FileActions:
             self.logger.info(f"\nEl selector '{selector}' está visible y habilitado.")
 
             # 2. Resaltar el elemento para depuración visual
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             self.logger.debug(f"\nElemento con selector '{selector}' resaltado.")
             self.base.tomar_captura(f"{nombre_base}_antes_remover_carga", directorio) # Captura antes de remover.
 
@@ -348,6 +448,47 @@ class FileActions:
             self.base.tomar_captura(f"{nombre_base}_error_inesperado_descarga", directorio_capturas)
             raise # Re-lanzar la excepción.
         
+    def descargar_archivos(self, selectores: List[Union[str, Locator]], nombre_base: str, directorio_capturas: str, directorio_descargas: str, tiempo: Union[int, float] = 30.0, sha256_esperados: Optional[Dict[str, str]] = None, tamanos_esperados: Optional[Dict[str, int]] = None) -> Optional[List[ResultadoDescarga]]:
+        """
+        Descarga varios archivos en paralelo con `utils.gestor_descargas.GestorDescargas`: hace clic en cada
+        selector esperando solo el inicio de su descarga, y después espera a que terminen todas.
+        Cada archivo se verifica por tamaño y sha256 (leyéndolo por bloques) y los duplicados se guardan una sola vez.
+
+        Args:
+            selectores (List[Union[str, Locator]]): Elementos que inician cada descarga.
+            nombre_base (str): Nombre base para las capturas de pantalla.
+            directorio_capturas (str): Ruta del directorio donde se guardarán las capturas de pantalla.
+            directorio_descargas (str): Directorio de destino de los archivos descargados.
+            tiempo (Union[int, float], opcional): Segundos máximos para que cada descarga se inicie. Por defecto, 30.0.
+            sha256_esperados (Optional[Dict[str, str]]): Nombre sugerido del archivo -> sha256 esperado.
+            tamanos_esperados (Optional[Dict[str, int]]): Nombre sugerido del archivo -> tamaño esperado en bytes.
+
+        Returns:
+            Optional[List[ResultadoDescarga]]: Un resultado (ruta, bytes, sha256, segundos, MB/s, errores) por descarga,
+                                               o `None` si alguna descarga no se pudo iniciar.
+        """
+        self.logger.info(f"\nIniciando {len(selectores)} descargas en paralelo hacia '{directorio_descargas}'. Tiempo máximo de inicio por descarga: {tiempo}s.")
+        gestor = GestorDescargas(self.page, directorio_descargas)
+        try:
+            gestor.disparar(selectores, tiempo=tiempo)
+            resultados = gestor.esperar_todas(sha256_esperados=sha256_esperados, tamanos_esperados=tamanos_esperados)
+        except TimeoutError as e:
+            self.logger.error(f"\n❌ FALLO (Timeout): Alguna de las descargas no se inició en {tiempo} segundos.\nDetalles: {e}", exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_descargar_archivos", directorio_capturas)
+            return None
+        except Error as e:
+            self.logger.error(f"\n❌ FALLO (Playwright): Error de Playwright al descargar los archivos.\nDetalles: {e}", exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_descargas", directorio_capturas)
+            raise
+
+        fallidas = [resultado.nombre for resultado in resultados if not resultado.exitosa]
+        if fallidas:
+            self.logger.error(f"\n❌ {len(fallidas)} de {len(resultados)} descargas no superaron la verificación: {fallidas}.")
+        else:
+            self.logger.info(f"\n✅ {len(resultados)} descargas completadas y verificadas en '{directorio_descargas}'.")
+        self.base.tomar_captura(f"{nombre_base}_archivos_descargados", directorio_capturas)
+        return resultados
+
     def num_Filas_excel(self, archivo_excel_path: str, hoja: str, has_header: bool = False, nombre_paso: str = "") -> int:
         """
         Detecta y devuelve el número total de filas ocupadas en una hoja específica de un archivo Excel.
@@ -376,13 +517,11 @@ class FileActions:
         num_data_rows = 0
 
         try:
-            self.logger.info(f"\n⏳ Cargando el libro de trabajo Excel: '{archivo_excel_path}'...")
-            workbook = openpyxl.load_workbook(archivo_excel_path) # Carga el libro de trabajo Excel
-            self.logger.info(f"\n✅ Libro de trabajo cargado. Seleccionando la hoja '{hoja}'...")
-            sheet = workbook[hoja] # Selecciona la hoja específica del libro
+            self.logger.info(f"\n⏳ Obteniendo la hoja '{hoja}' del libro Excel '{archivo_excel_path}' (caché de libros en modo solo lectura)...")
+            sheet = obtener_hoja_excel(archivo_excel_path, hoja) # Solo se parsea el archivo si no está en caché o cambió en disco
             
             # Obtiene el número total de filas con contenido.
-            # openpyxl.worksheet.max_row devuelve el índice de la última fila no vacía.
+            # max_row es el número de filas materializadas de la hoja.
             num_physical_rows = sheet.max_row 
 
             if has_header and num_physical_rows > 0:
@@ -418,9 +557,7 @@ class FileActions:
             end_time_total_operation = time.time()
             duration_total_operation = end_time_total_operation - start_time_total_operation
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (num_Filas_excel): {duration_total_operation:.4f} segundos.")
-            # Es importante cerrar el workbook si se ha abierto explícitamente y no con 'with open()'
-            # Sin embargo, openpyxl.load_workbook no requiere un cierre explícito en la mayoría de los casos
-            # ya que maneja el archivo internamente. Aun así, se puede añadir un log de depuración.
+            # El libro se abre en modo read_only y se cierra tras materializar sus filas (ver utils/cache_archivos_datos.py).
             self.logger.debug("\nFinalizada la operación de lectura de Excel.")
 
     def dato_Columna_excel(self, archivo_excel_path: str, hoja: str, numero_fila_logica: int, nombre_o_indice_columna: Union[str, int], has_header_excel: bool = False, nombre_paso: str = "") -> Union[str, int, float, None]:
@@ -459,10 +596,8 @@ class FileActions:
         try:
             # --- Medición de rendimiento: Carga del Workbook y selección de hoja ---
             start_time_load_workbook = time.time()
-            self.logger.info(f"\n⏳ Cargando el libro de trabajo Excel: '{archivo_excel_path}'...")
-            workbook = openpyxl.load_workbook(archivo_excel_path)
-            self.logger.info(f"\n✅ Libro de trabajo cargado. Seleccionando la hoja '{hoja}'...")
-            sheet = workbook[hoja]
+            self.logger.info(f"\n⏳ Obteniendo la hoja '{hoja}' del libro Excel '{archivo_excel_path}' (caché de libros en modo solo lectura)...")
+            sheet = obtener_hoja_excel(archivo_excel_path, hoja)
             end_time_load_workbook = time.time()
             duration_load_workbook = end_time_load_workbook - start_time_load_workbook
             self.logger.info(f"PERFORMANCE: Tiempo de carga del workbook y selección de hoja: {duration_load_workbook:.4f} segundos.")
@@ -472,14 +607,12 @@ class FileActions:
             if isinstance(nombre_o_indice_columna, str):
                 # --- Medición de rendimiento: Búsqueda de columna por nombre ---
                 start_time_find_column = time.time()
-                self.logger.info(f"\n🔎 Buscando columna por nombre: '{nombre_o_indice_columna}' en el encabezado de la hoja '{hoja}'...")
-                header_found = False
-                # sheet[1] se refiere a la primera fila física del Excel
-                for col_idx, cell in enumerate(sheet[1], 1):
-                    if cell.value is not None and str(cell.value).strip().lower() == nombre_o_indice_columna.strip().lower():
-                        col_index = col_idx
-                        header_found = True
-                        break
+                self.logger.info(f"\n🔎 Buscando columna por nombre: '{nombre_o_indice_columna}' en el índice de encabezados de la hoja '{hoja}'...")
+                # El índice (nombre normalizado -> columna) se construye una vez por hoja materializada.
+                posicion = sheet.columna_por_nombre(nombre_o_indice_columna)
+                header_found = posicion is not None
+                if header_found:
+                    col_index = posicion
                 end_time_find_column = time.time()
                 duration_find_column = end_time_find_column - start_time_find_column
                 self.logger.info(f"PERFORMANCE: Tiempo de búsqueda de columna por nombre: {duration_find_column:.4f} segundos.")
@@ -513,7 +646,7 @@ class FileActions:
             
             # --- Medición de rendimiento: Lectura de la celda ---
             start_time_read_cell = time.time()
-            cell_value = sheet.cell(row=actual_fila_fisica, column=col_index).value
+            cell_value = sheet.celda(actual_fila_fisica, col_index)
             end_time_read_cell = time.time()
             duration_read_cell = end_time_read_cell - start_time_read_cell
             self.logger.info(f"PERFORMANCE: Tiempo de lectura de la celda: {duration_read_cell:.4f} segundos.")
@@ -551,7 +684,7 @@ class FileActions:
             # Aunque openpyxl maneja la liberación de recursos, un log final es útil.
             self.logger.debug("\nFinalizada la operación de lectura de dato de Excel.")
     
-    def num_Filas_csv(self, archivo_csv_path: str, delimiter: str = ',', has_header: bool = False, nombre_paso: str = "") -> int:
+    def num_Filas_csv(self, archivo_csv_path: str, delimiter: str = ',', has_header: bool = False, usar_indice: bool = False, nombre_paso: str = "") -> int:
         """
         Detecta y devuelve el número total de filas de datos en un archivo CSV.
         Opcionalmente, descuenta una fila para el encabezado si 'has_header' es True.
@@ -566,6 +699,9 @@ class FileActions:
             has_header (bool, opcional): Si es `True`, se descuenta una fila del total
                                          para considerar que la primera fila es un encabezado.
                                          Por defecto es `False`.
+            usar_indice (bool, opcional): Si es `True`, el conteo se obtiene del índice de desplazamientos de filas
+                                          (`utils/indice_filas_csv.py`), que se construye una vez por versión del archivo.
+                                          Recomendado para archivos grandes consultados varias veces. Por defecto es `False`.
             nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs. Por defecto "".
 
         Returns:
@@ -581,15 +717,20 @@ class FileActions:
         row_count = 0 # Inicializamos el contador de filas
 
         try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo CSV: '{archivo_csv_path}'...")
-            with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
-                # Crea un objeto reader para iterar sobre las líneas del CSV, usando el delimitador especificado.
-                # 'newline=''' es crucial para evitar problemas con saltos de línea en diferentes SO.
-                # 'encoding='utf-8'' es una buena práctica para manejar caracteres especiales.
-                csv_reader = csv.reader(csvfile, delimiter=delimiter)
-                
-                # Cuenta todas las filas en el CSV. sum(1 for row in csv_reader) es una forma eficiente.
-                row_count = sum(1 for row in csv_reader)
+            if usar_indice:
+                # El índice se construye en una pasada (mmap) la primera vez; después el conteo es O(1).
+                self.logger.info(f"\n⏳ Obteniendo el número de filas desde el índice de filas del CSV: '{archivo_csv_path}'...")
+                row_count = obtener_indice_csv(archivo_csv_path).num_filas
+            else:
+                self.logger.info(f"\n⏳ Abriendo y leyendo el archivo CSV: '{archivo_csv_path}'...")
+                with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
+                    # Crea un objeto reader para iterar sobre las líneas del CSV, usando el delimitador especificado.
+                    # 'newline=''' es crucial para evitar problemas con saltos de línea en diferentes SO.
+                    # 'encoding='utf-8'' es una buena práctica para manejar caracteres especiales.
+                    csv_reader = csv.reader(csvfile, delimiter=delimiter)
+                    
+                    # Cuenta todas las filas en el CSV. sum(1 for row in csv_reader) es una forma eficiente.
+                    row_count = sum(1 for row in csv_reader)
 
             self.logger.info(f"\n✅ Lectura de archivo CSV completada. Filas totales encontradas: {row_count}.")
 
@@ -627,12 +768,14 @@ class FileActions:
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (num_Filas_csv): {duration_total_operation:.4f} segundos.")
             self.logger.debug("\nFinalizada la operación de lectura de CSV.")
 
-    def dato_Columna_csv(self, archivo_csv_path: str, fila_logica: int, columna_logica: int, delimiter: str = ',', has_header: bool = False, nombre_paso: str = "") -> Optional[str]:
+    def dato_Columna_csv(self, archivo_csv_path: str, fila_logica: int, columna_logica: Union[int, str], delimiter: str = ',', has_header: bool = False, usar_indice: bool = False, nombre_paso: str = "") -> Optional[str]:
         """
         Obtiene el valor de una "celda" específica de un archivo CSV, ajustando el índice de la fila
-        si se indica que la primera fila es un encabezado. Permite especificar el delimitador del CSV.
-        Esta función mide el tiempo que tarda en cargar el archivo CSV, leer todas sus filas
-        y extraer el dato de la celda solicitada, lo cual es crucial para evaluar el rendimiento
+        si se indica que la primera fila es un encabezado. Permite especificar el delimitador del CSV
+        y la columna por su índice o, si hay encabezado, por su nombre (índice de encabezados en caché).
+        La lectura se detiene en cuanto se alcanza la fila solicitada.
+        Esta función mide el tiempo que tarda en leer el archivo CSV hasta la fila solicitada
+        y extraer el dato de la celda, lo cual es crucial para evaluar el rendimiento
         en escenarios de automatización basados en datos de archivos CSV.
 
         Args:
@@ -640,11 +783,15 @@ class FileActions:
             fila_logica (int): El **número de fila lógico** (basado en 1) de la celda a leer.
                                Si `has_header` es `True`, esta es la fila de datos
                                (e.g., `1` para la primera fila después del encabezado).
-            columna_logica (int): El **número de columna lógico** (basado en 1) de la celda a leer.
+            columna_logica (Union[int, str]): El **número de columna lógico** (basado en 1) de la celda a leer,
+                                              o el **nombre del encabezado** de la columna (requiere `has_header=True`).
             delimiter (str, opcional): El **carácter utilizado como separador** de datos en el CSV
                                       (e.g., ',', ';', '\t'). Por defecto es `,`.
             has_header (bool, opcional): Si es `True`, indica que la primera fila del CSV es un encabezado.
                                          Esto ajusta el cálculo de la fila física. Por defecto es `False`.
+            usar_indice (bool, opcional): Si es `True`, la fila se lee saltando directamente a su posición en bytes
+                                          mediante el índice de filas (`utils/indice_filas_csv.py`), sin parsear las
+                                          filas anteriores. Por defecto es `False`.
             nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs. Por defecto "".
 
         Returns:
@@ -666,35 +813,54 @@ class FileActions:
             if has_header:
                 actual_fila_0_indexed += 1 # Ajusta si hay encabezado para saltar la fila 0
 
+            # Si la columna se indica por nombre, se resuelve con el índice de encabezados en caché.
+            if isinstance(columna_logica, str):
+                if not has_header:
+                    self.logger.error(f"\n❌ Error: Para buscar la columna por nombre ('{columna_logica}') el CSV debe tener encabezado (has_header=True).")
+                    return None
+                _, indice_encabezados = encabezados_csv(archivo_csv_path, delimiter)
+                posicion = indice_encabezados.get(normalizar_encabezado(columna_logica))
+                if posicion is None:
+                    self.logger.error(f"\n❌ Error: La columna '{columna_logica}' no fue encontrada en el encabezado del archivo CSV '{archivo_csv_path}'.")
+                    return None
+                columna_logica = posicion
+
             # Convierte el número de columna lógica (1-basada) a un índice 0-basado para Python
             actual_col_0_indexed = columna_logica - 1
 
             self.logger.info(f"\n🔎 Calculando índices físicos: Fila física (0-indexed): {actual_fila_0_indexed}, Columna física (0-indexed): {actual_col_0_indexed}.")
 
-            # --- Medición de rendimiento: Carga del archivo CSV y lectura de todas las filas ---
+            # Validación de límites para la fila (antes de abrir el archivo)
+            if actual_fila_0_indexed < 0:
+                self.logger.error(f"\n❌ Error: La fila lógica {fila_logica} (física 0-indexed: {actual_fila_0_indexed}) está fuera de los límites del archivo CSV '{archivo_csv_path}'.")
+                return None
+
+            # --- Medición de rendimiento: Lectura del archivo CSV hasta la fila solicitada ---
             start_time_load_csv = time.time()
-            self.logger.info(f"\n⏳ Abriendo y leyendo todas las filas del archivo CSV: '{archivo_csv_path}'...")
-            with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
-                csv_reader = csv.reader(csvfile, delimiter=delimiter)
-                rows = list(csv_reader) # Lee todas las filas del CSV en una lista de listas (cada sublista es una fila)
+            if usar_indice:
+                self.logger.info(f"\n⏳ Leyendo la fila física (0-indexed) {actual_fila_0_indexed} del archivo CSV '{archivo_csv_path}' mediante el índice de filas...")
+                row = obtener_indice_csv(archivo_csv_path).leer_fila(actual_fila_0_indexed, delimiter)
+            else:
+                self.logger.info(f"\n⏳ Leyendo el archivo CSV '{archivo_csv_path}' hasta la fila física (0-indexed) {actual_fila_0_indexed}...")
+                with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
+                    csv_reader = csv.reader(csvfile, delimiter=delimiter)
+                    # islice detiene la lectura en la fila solicitada: no se parsea el resto del archivo.
+                    row = next(itertools.islice(csv_reader, actual_fila_0_indexed, None), None)
             end_time_load_csv = time.time()
             duration_load_csv = end_time_load_csv - start_time_load_csv
-            self.logger.info(f"PERFORMANCE: Tiempo de carga del archivo CSV y lectura de todas las filas: {duration_load_csv:.4f} segundos.")
-            
-            self.logger.info(f"\n✅ Archivo CSV leído. Total de filas físicas encontradas: {len(rows)}.")
+            self.logger.info(f"PERFORMANCE: Tiempo de lectura del archivo CSV hasta la fila solicitada: {duration_load_csv:.4f} segundos.")
 
-            # Validación de límites para la fila
-            if actual_fila_0_indexed < 0 or actual_fila_0_indexed >= len(rows):
-                self.logger.error(f"\n❌ Error: La fila lógica {fila_logica} (física 0-indexed: {actual_fila_0_indexed}) está fuera de los límites del archivo CSV '{archivo_csv_path}'. Total filas físicas: {len(rows)}.")
+            if row is None:
+                self.logger.error(f"\n❌ Error: La fila lógica {fila_logica} (física 0-indexed: {actual_fila_0_indexed}) está fuera de los límites del archivo CSV '{archivo_csv_path}'.")
                 return None
 
             # Validación de límites para la columna en la fila específica
-            if actual_col_0_indexed < 0 or actual_col_0_indexed >= len(rows[actual_fila_0_indexed]):
-                self.logger.error(f"\n❌ Error: La columna lógica {columna_logica} (física 0-indexed: {actual_col_0_indexed}) está fuera de los límites de la fila física {actual_fila_0_indexed} del archivo CSV '{archivo_csv_path}'. Total columnas en esa fila: {len(rows[actual_fila_0_indexed])}.")
+            if actual_col_0_indexed < 0 or actual_col_0_indexed >= len(row):
+                self.logger.error(f"\n❌ Error: La columna lógica {columna_logica} (física 0-indexed: {actual_col_0_indexed}) está fuera de los límites de la fila física {actual_fila_0_indexed} del archivo CSV '{archivo_csv_path}'. Total columnas en esa fila: {len(row)}.")
                 return None
 
             # Obtiene el valor de la celda especificada
-            cell_value = rows[actual_fila_0_indexed][actual_col_0_indexed]
+            cell_value = row[actual_col_0_indexed]
             
             self.logger.info(f"\n✅ Dato obtenido de (Fila lógica: {fila_logica}, Columna lógica: {columna_logica}) en '{archivo_csv_path}': '{cell_value}'.")
             return cell_value
@@ -727,20 +893,173 @@ class FileActions:
             duration_total_operation = end_time_total_operation - start_time_total_operation
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (dato_Columna_csv): {duration_total_operation:.4f} segundos.")
             self.logger.debug("\nFinalizada la operación de lectura de dato de CSV.")
+
+    def _es_archivo_excel(self, ruta_archivo: str) -> bool:
+        """Indica si la ruta corresponde a un libro Excel (por extensión); en caso contrario se trata como CSV."""
+        return os.path.splitext(ruta_archivo)[1].lower() in (".xlsx", ".xlsm")
+
+    def obtener_columna_datos(self, ruta_archivo: str, columna: Union[str, int], hoja: Optional[str] = None, delimiter: str = ',', has_header: bool = True, nombre_paso: str = "") -> Optional[List[Any]]:
+        """
+        Devuelve todos los valores de una columna de un archivo Excel o CSV en una sola llamada.
+        La columna puede indicarse por nombre (índice de encabezados en caché) o por índice (basado en 1).
+        Los libros Excel se leen a través de la caché de libros; los CSV se leen en una sola pasada.
+
+        Args:
+            ruta_archivo (str): La **ruta completa al archivo** Excel (`.xlsx`/`.xlsm`) o CSV.
+            columna (Union[str, int]): El **nombre del encabezado** o el **índice numérico** (basado en 1) de la columna.
+            hoja (Optional[str]): El **nombre de la hoja** (obligatorio para Excel).
+            delimiter (str, opcional): Separador del CSV. Por defecto es `,`.
+            has_header (bool, opcional): Si es `True`, la primera fila es el encabezado y no se incluye en el resultado.
+                                         Por defecto es `True`.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs. Por defecto "".
+
+        Returns:
+            Optional[List[Any]]: Los valores de la columna (en Excel se conserva el tipo de cada celda; en CSV son strings).
+                                 Retorna `None` si el archivo, la hoja o la columna no existen, o si ocurre un error.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Obteniendo la columna '{columna}' del archivo '{ruta_archivo}' (hoja: {hoja}, tiene encabezado: {has_header}). ---")
+
+        # --- Medición de rendimiento: Inicio total de la función ---
+        start_time_total_operation = time.time()
+
+        try:
+            if isinstance(columna, str) and not has_header:
+                self.logger.error(f"\n❌ Error: Para buscar la columna por nombre ('{columna}') el archivo debe tener encabezado (has_header=True).")
+                return None
+
+            if self._es_archivo_excel(ruta_archivo):
+                if hoja is None:
+                    self.logger.error(f"\n❌ Error: Debe indicarse la hoja para leer la columna '{columna}' del archivo Excel '{ruta_archivo}'.")
+                    return None
+                sheet = obtener_hoja_excel(ruta_archivo, hoja)
+                posicion = sheet.columna_por_nombre(columna) if isinstance(columna, str) else columna
+                if posicion is None or not (1 <= posicion <= sheet.max_column):
+                    self.logger.error(f"\n❌ Error: La columna '{columna}' no existe en la hoja '{hoja}' del archivo '{ruta_archivo}'.")
+                    return None
+                inicio = 2 if has_header else 1
+                valores = [sheet.celda(numero_fila, posicion) for numero_fila in range(inicio, sheet.max_row + 1)]
+            else:
+                if isinstance(columna, str):
+                    _, indice_encabezados = encabezados_csv(ruta_archivo, delimiter)
+                    posicion = indice_encabezados.get(normalizar_encabezado(columna))
+                else:
+                    posicion = columna
+                if posicion is None or posicion < 1:
+                    self.logger.error(f"\n❌ Error: La columna '{columna}' no existe en el archivo CSV '{ruta_archivo}'.")
+                    return None
+                with open(ruta_archivo, 'r', newline='', encoding='utf-8') as csvfile:
+                    csv_reader = csv.reader(csvfile, delimiter=delimiter)
+                    if has_header:
+                        next(csv_reader, None)
+                    valores = [fila[posicion - 1] if posicion <= len(fila) else None for fila in csv_reader]
+
+            self.logger.info(f"\n✅ Columna '{columna}' obtenida de '{ruta_archivo}': {len(valores)} valores.")
+            return valores
+
+        except FileNotFoundError:
+            self.logger.critical(f"\n❌ FALLO (Archivo no encontrado): El archivo no se encontró en la ruta: '{ruta_archivo}'.")
+            return None
+        except KeyError:
+            self.logger.critical(f"\n❌ FALLO (Hoja no encontrada): La hoja '{hoja}' no se encontró en el archivo Excel: '{ruta_archivo}'.")
+            return None
+        except Exception as e:
+            self.logger.critical(f"\n❌ FALLO (Error Inesperado): Ocurrió un error al obtener la columna '{columna}' del archivo '{ruta_archivo}'.\nDetalles: {e}", exc_info=True)
+            return None
+        finally:
+            # --- Medición de rendimiento: Fin total de la función ---
+            duration_total_operation = time.time() - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener_columna_datos): {duration_total_operation:.4f} segundos.")
+
+    def obtener_fila_datos(self, ruta_archivo: str, numero_fila_logica: int, hoja: Optional[str] = None, delimiter: str = ',', has_header: bool = True, como_diccionario: bool = False, nombre_paso: str = "") -> Union[List[Any], Dict[str, Any], None]:
+        """
+        Devuelve todos los valores de una fila de datos de un archivo Excel o CSV en una sola llamada.
+        En CSV la lectura se detiene en la fila solicitada.
+
+        Args:
+            ruta_archivo (str): La **ruta completa al archivo** Excel (`.xlsx`/`.xlsm`) o CSV.
+            numero_fila_logica (int): El **número de fila lógica** (basado en 1). Si `has_header` es `True`,
+                                      `1` es la primera fila después del encabezado.
+            hoja (Optional[str]): El **nombre de la hoja** (obligatorio para Excel).
+            delimiter (str, opcional): Separador del CSV. Por defecto es `,`.
+            has_header (bool, opcional): Si es `True`, la primera fila es el encabezado. Por defecto es `True`.
+            como_diccionario (bool, opcional): Si es `True` (y hay encabezado), devuelve un diccionario
+                                               {encabezado: valor}. Por defecto es `False`.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs. Por defecto "".
+
+        Returns:
+            Union[List[Any], Dict[str, Any], None]: Los valores de la fila (lista o diccionario).
+                                                    Retorna `None` si la fila está fuera de rango o si ocurre un error.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Obteniendo la fila lógica {numero_fila_logica} del archivo '{ruta_archivo}' (hoja: {hoja}, tiene encabezado: {has_header}). ---")
+
+        # --- Medición de rendimiento: Inicio total de la función ---
+        start_time_total_operation = time.time()
+
+        try:
+            fila_fisica = numero_fila_logica + 1 if has_header else numero_fila_logica
+            if fila_fisica < 1:
+                self.logger.error(f"\n❌ Error: La fila lógica {numero_fila_logica} está fuera de rango.")
+                return None
+
+            encabezados: Tuple[Any, ...] = ()
+            if self._es_archivo_excel(ruta_archivo):
+                if hoja is None:
+                    self.logger.error(f"\n❌ Error: Debe indicarse la hoja para leer la fila {numero_fila_logica} del archivo Excel '{ruta_archivo}'.")
+                    return None
+                sheet = obtener_hoja_excel(ruta_archivo, hoja)
+                if fila_fisica > sheet.max_row:
+                    self.logger.error(f"\n❌ Error: La fila lógica {numero_fila_logica} está fuera de rango en la hoja '{hoja}' (máximo físico: {sheet.max_row}).")
+                    return None
+                fila = list(sheet.fila(fila_fisica))
+                if has_header:
+                    encabezados = sheet.fila(1)
+            else:
+                with open(ruta_archivo, 'r', newline='', encoding='utf-8') as csvfile:
+                    csv_reader = csv.reader(csvfile, delimiter=delimiter)
+                    fila = next(itertools.islice(csv_reader, fila_fisica - 1, None), None)
+                if fila is None:
+                    self.logger.error(f"\n❌ Error: La fila lógica {numero_fila_logica} está fuera de rango en el archivo CSV '{ruta_archivo}'.")
+                    return None
+                if has_header:
+                    encabezados, _ = encabezados_csv(ruta_archivo, delimiter)
+
+            self.logger.info(f"\n✅ Fila lógica {numero_fila_logica} obtenida de '{ruta_archivo}': {len(fila)} valores.")
+            if como_diccionario and has_header:
+                return {str(encabezado): valor for encabezado, valor in zip(encabezados, fila)}
+            return fila
+
+        except FileNotFoundError:
+            self.logger.critical(f"\n❌ FALLO (Archivo no encontrado): El archivo no se encontró en la ruta: '{ruta_archivo}'.")
+            return None
+        except KeyError:
+            self.logger.critical(f"\n❌ FALLO (Hoja no encontrada): La hoja '{hoja}' no se encontró en el archivo Excel: '{ruta_archivo}'.")
+            return None
+        except Exception as e:
+            self.logger.critical(f"\n❌ FALLO (Error Inesperado): Ocurrió un error al obtener la fila {numero_fila_logica} del archivo '{ruta_archivo}'.\nDetalles: {e}", exc_info=True)
+            return None
+        finally:
+            # --- Medición de rendimiento: Fin total de la función ---
+            duration_total_operation = time.time() - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener_fila_datos): {duration_total_operation:.4f} segundos.")
     
-    def leer_json(self, json_file_path: str, nombre_paso: str = "") -> Union[Dict, List, None]:
+    def leer_json(self, json_file_path: str, streaming: bool = False, nombre_paso: str = "") -> Union[Dict, List, Iterator[Any], None]:
         """
         Lee y parsea un archivo JSON, devolviendo su contenido como un diccionario o lista de Python.
+        Los archivos JSON Lines (`.jsonl`/`.ndjson`) se leen como una lista con un registro por línea.
         Esta función mide el tiempo que tarda en abrir, leer y parsear el archivo JSON,
         lo cual es útil para evaluar el rendimiento en escenarios de automatización impulsados por datos.
 
         Args:
             json_file_path (str): La **ruta completa al archivo JSON**.
+            streaming (bool, opcional): Si es `True` y el archivo es JSON Lines, devuelve un **generador** que lee
+                                        un registro por línea sin cargar el archivo completo. Los errores de formato
+                                        se propagan al consumidor del generador. Por defecto es `False`.
             nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
                                          Por defecto es una cadena vacía "".
 
         Returns:
-            Union[Dict, List, None]: El contenido del archivo JSON como un **diccionario** o una **lista**,
+            Union[Dict, List, Iterator[Any], None]: El contenido del archivo JSON como un **diccionario** o una **lista**
+                                     (o un generador en modo `streaming`),
                                      o **None** si el archivo no se encuentra, el formato JSON es inválido,
                                      o si ocurre un error inesperado.
         """
@@ -752,10 +1071,23 @@ class FileActions:
         data_content: Union[Dict, List, None] = None # Inicializamos a None
 
         try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo JSON: '{json_file_path}'...")
-            with open(json_file_path, 'r', encoding='utf-8') as file:
-                # 'encoding='utf-8'' es una buena práctica para manejar caracteres especiales.
-                data_content = json.load(file) # Carga (parsea) el contenido del archivo JSON
+            if es_json_lines(json_file_path):
+                if streaming:
+                    if not os.path.exists(json_file_path):
+                        raise FileNotFoundError(json_file_path)
+                    self.logger.info(f"\n✅ Archivo JSON Lines '{json_file_path}' abierto en modo streaming.")
+                    return iterar_lineas_json(json_file_path)
+                self.logger.info(f"\n⏳ Abriendo y leyendo el archivo JSON Lines: '{json_file_path}'...")
+                data_content = list(iterar_lineas_json(json_file_path))
+            else:
+                if streaming:
+                    self.logger.warning(f"\n⚠️ El modo streaming solo aplica a archivos JSON Lines (.jsonl). '{json_file_path}' se leerá completo.")
+                self.logger.info(f"\n⏳ Abriendo y leyendo el archivo JSON: '{json_file_path}'...")
+                with open(json_file_path, 'r', encoding='utf-8') as file:
+                    # 'encoding='utf-8'' es una buena práctica para manejar caracteres especiales.
+                    data_content = json.load(file) # Carga (parsea) el contenido del archivo JSON
+                if streaming:
+                    return iter(data_content if isinstance(data_content, list) else [data_content])
             
             self.logger.info(f"\n✅ Archivo JSON '{json_file_path}' leído y parseado exitosamente.")
             return data_content
@@ -936,6 +1268,53 @@ class FileActions:
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_excel_diccionario): {duration_total_operation:.4f} segundos.")
             self.logger.debug("\nOperación de lectura de archivo finalizada.")
         
+    def leer_fuente_datos(self, ruta_archivo: str, hoja: Optional[str] = None, delimiter: str = ',', como_dataframe: bool = False, nombre_paso: str = "") -> Union[List[Dict[str, Any]], pd.DataFrame, None]:
+        """
+        Lee un archivo de datos (CSV o Excel) a través de la caché columnar de `utils.fuente_datos`.
+        La primera lectura parsea el archivo y guarda una copia binaria (Feather o pickle) identificada por el
+        hash de su contenido; las siguientes lecturas, de cualquier worker o ejecución, cargan esa copia.
+        Pensado para los datos de parametrización de las suites guiadas por datos.
+
+        Args:
+            ruta_archivo (str): Ruta completa del archivo CSV o Excel (normalmente bajo `SOURCE_FILES_DIR_DATA_SOURCE`).
+            hoja (Optional[str]): Hoja del Excel. Si es `None`, se usa la primera. Se ignora en los CSV.
+            delimiter (str, opcional): Separador del CSV. Por defecto es `,`.
+            como_dataframe (bool, opcional): Si es `True`, devuelve el DataFrame compartido (solo lectura)
+                                             en lugar de una lista de diccionarios.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Returns:
+            Union[List[Dict[str, Any]], pd.DataFrame, None]: Los registros del archivo (los CSV como texto, igual que
+                                                             `leer_csv_diccionario`), o **None** si ocurre un error.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Leyendo la fuente de datos '{ruta_archivo}' (hoja: '{hoja}') a través de la caché columnar. ---")
+
+        # --- Medición de rendimiento: Inicio de la operación total de la función ---
+        start_time_total_operation = time.time()
+
+        try:
+            if como_dataframe:
+                return cargar_fuente_datos(ruta_archivo, hoja=hoja, delimiter=delimiter)
+            return cargar_registros(ruta_archivo, hoja=hoja, delimiter=delimiter)
+
+        except FileNotFoundError:
+            self.logger.critical(f"\n❌ FALLO (Archivo no encontrado): La fuente de datos no se encontró en la ruta: '{ruta_archivo}'.")
+            return None
+        except ValueError as e:
+            self.logger.critical(f"\n❌ FALLO (Fuente no soportada o hoja inexistente): '{ruta_archivo}'.\nDetalles: {e}")
+            return None
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Error Inesperado): Ocurrió un error inesperado al leer la fuente de datos.\n"
+                f"Archivo: '{ruta_archivo}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            return None
+        finally:
+            duration_total_operation = time.time() - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_fuente_datos): {duration_total_operation:.4f} segundos.")
+
     def leer_texto_plano(self, file_path: str, delimiter: Optional[str] = None, nombre_paso: str = "") -> Union[str, List[str], None]:
         """
         Lee el contenido completo de un archivo de texto plano.
@@ -1011,6 +1390,161 @@ class FileActions:
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_texto): {duration_total_operation:.4f} segundos.")
             self.logger.debug("\nOperación de lectura de archivo de texto finalizada.")
 
+    def _agrupar_en_lotes(self, elementos: Iterable[Any], tamano_lote: Optional[int]) -> Iterator[Any]:
+        """Devuelve los elementos uno a uno o, si se indica `tamano_lote`, en listas de hasta ese tamaño."""
+        if not tamano_lote:
+            yield from elementos
+            return
+        iterador = iter(elementos)
+        while True:
+            lote = list(itertools.islice(iterador, tamano_lote))
+            if not lote:
+                return
+            yield lote
+
+    def iterar_csv_diccionario(self, csv_file_path: str, delimiter: str = ',', tamano_lote: Optional[int] = None, nombre_paso: str = "") -> Iterator[Union[Dict[str, str], List[Dict[str, str]]]]:
+        """
+        Versión en streaming de `leer_csv_diccionario`: devuelve un generador que lee el CSV fila a fila
+        con `csv.DictReader`, de modo que la memoria usada no depende del tamaño del archivo.
+        El archivo se abre al consumir el primer elemento y se cierra al agotar (o cerrar) el generador.
+
+        Args:
+            csv_file_path (str): La **ruta completa al archivo CSV**.
+            delimiter (str, opcional): El carácter separador del CSV. Por defecto es `,`.
+            tamano_lote (Optional[int]): Si se indica, el generador devuelve **listas de hasta `tamano_lote` filas**
+                                         en lugar de filas sueltas. Por defecto es `None`.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Yields:
+            Union[Dict[str, str], List[Dict[str, str]]]: Cada fila como diccionario (o un lote de filas).
+
+        Raises:
+            FileNotFoundError, csv.Error: Se registran en el log y se propagan al consumidor del generador.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Iterando el archivo CSV en streaming: '{csv_file_path}' (tamaño de lote: {tamano_lote}). ---")
+
+        # --- Medición de rendimiento: Inicio de la iteración (incluye el tiempo de proceso del consumidor) ---
+        start_time_total_operation = time.time()
+        filas_leidas = 0
+
+        try:
+            with open(csv_file_path, mode='r', newline='', encoding='utf-8') as file:
+                for elemento in self._agrupar_en_lotes(csv.DictReader(file, delimiter=delimiter), tamano_lote):
+                    filas_leidas += len(elemento) if tamano_lote else 1
+                    yield elemento
+            self.logger.info(f"\n✅ Archivo CSV '{csv_file_path}' recorrido completamente: {filas_leidas} filas.")
+        except FileNotFoundError:
+            self.logger.critical(f"\n❌ FALLO (Archivo no encontrado): El archivo CSV no se encontró en la ruta: '{csv_file_path}'.")
+            raise
+        except csv.Error as e:
+            self.logger.critical(f"\n❌ FALLO (Error de formato CSV): Error al procesar el archivo CSV desde '{csv_file_path}' (fila {filas_leidas + 1}).\nDetalles: {e}", exc_info=True)
+            raise
+        finally:
+            # --- Medición de rendimiento: Fin de la iteración ---
+            duration_total_operation = time.time() - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la iteración (iterar_csv_diccionario): {duration_total_operation:.4f} segundos, {filas_leidas} filas.")
+
+    def iterar_excel_diccionario(self, excel_file_path: str, sheet_name: str, has_header: bool = True, headers: Optional[List[str]] = None, tamano_lote: Optional[int] = None, nombre_paso: str = "") -> Iterator[Union[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Versión en streaming de `leer_excel_diccionario`: abre el libro en modo `read_only` y recorre la hoja
+        con `iter_rows(values_only=True)`, sin cargar el libro completo en memoria.
+        El libro se cierra al agotar (o cerrar) el generador.
+
+        Args:
+            excel_file_path (str): La **ruta completa al archivo Excel** (`.xlsx`/`.xlsm`).
+            sheet_name (str): El **nombre de la hoja de cálculo** a leer.
+            has_header (bool): Si es `True` (por defecto), la primera fila se usa como encabezado.
+            headers (Optional[List[str]]): Encabezados a usar; **obligatorio si `has_header` es False**.
+            tamano_lote (Optional[int]): Si se indica, el generador devuelve **listas de hasta `tamano_lote` filas**.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Yields:
+            Union[Dict[str, Any], List[Dict[str, Any]]]: Cada fila como diccionario (o un lote de filas).
+
+        Raises:
+            FileNotFoundError, KeyError, ValueError: Se registran en el log y se propagan al consumidor del generador.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Iterando la hoja '{sheet_name}' del archivo Excel en streaming: '{excel_file_path}' (tamaño de lote: {tamano_lote}). ---")
+
+        # --- Medición de rendimiento: Inicio de la iteración (incluye el tiempo de proceso del consumidor) ---
+        start_time_total_operation = time.time()
+        filas_leidas = 0
+        workbook = None
+
+        try:
+            if not has_header and not headers:
+                raise ValueError("El parámetro 'headers' es obligatorio si 'has_header' es False.")
+
+            workbook = openpyxl.load_workbook(excel_file_path, read_only=True)
+            filas = workbook[sheet_name].iter_rows(values_only=True)
+            if has_header:
+                headers = list(next(filas, ()))
+
+            registros = (
+                {header: valor for header, valor in zip(headers, fila) if header is not None}
+                for fila in filas
+            )
+            for elemento in self._agrupar_en_lotes(registros, tamano_lote):
+                filas_leidas += len(elemento) if tamano_lote else 1
+                yield elemento
+            self.logger.info(f"\n✅ Hoja '{sheet_name}' del archivo '{excel_file_path}' recorrida completamente: {filas_leidas} filas.")
+        except FileNotFoundError:
+            self.logger.critical(f"\n❌ FALLO (Archivo no encontrado): El archivo no se encontró en la ruta: '{excel_file_path}'.")
+            raise
+        except KeyError:
+            self.logger.critical(f"\n❌ FALLO (Hoja no encontrada): La hoja de cálculo '{sheet_name}' no se encontró en el archivo: '{excel_file_path}'.")
+            raise
+        except ValueError as e:
+            self.logger.critical(f"\n❌ FALLO (Parámetros inválidos): {e}")
+            raise
+        finally:
+            # En modo read_only el archivo permanece abierto hasta cerrar el libro.
+            if workbook is not None:
+                workbook.close()
+            # --- Medición de rendimiento: Fin de la iteración ---
+            duration_total_operation = time.time() - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la iteración (iterar_excel_diccionario): {duration_total_operation:.4f} segundos, {filas_leidas} filas.")
+
+    def iterar_texto_plano(self, file_path: str, tamano_lote: Optional[int] = None, nombre_paso: str = "") -> Iterator[Union[str, List[str]]]:
+        """
+        Versión en streaming de `leer_texto_plano`: devuelve un generador que recorre el archivo línea a línea
+        (sin el salto de línea final), sin cargar el contenido completo en memoria.
+
+        Args:
+            file_path (str): La **ruta completa al archivo de texto**.
+            tamano_lote (Optional[int]): Si se indica, el generador devuelve **listas de hasta `tamano_lote` líneas**.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Yields:
+            Union[str, List[str]]: Cada línea (o un lote de líneas).
+
+        Raises:
+            FileNotFoundError, IOError: Se registran en el log y se propagan al consumidor del generador.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Iterando el archivo de texto en streaming: '{file_path}' (tamaño de lote: {tamano_lote}). ---")
+
+        # --- Medición de rendimiento: Inicio de la iteración (incluye el tiempo de proceso del consumidor) ---
+        start_time_total_operation = time.time()
+        lineas_leidas = 0
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                lineas = (linea.rstrip('\r\n') for linea in file)
+                for elemento in self._agrupar_en_lotes(lineas, tamano_lote):
+                    lineas_leidas += len(elemento) if tamano_lote else 1
+                    yield elemento
+            self.logger.info(f"\n✅ Archivo de texto '{file_path}' recorrido completamente: {lineas_leidas} líneas.")
+        except FileNotFoundError:
+            self.logger.critical(f"\n❌ FALLO (Archivo no encontrado): El archivo de texto no se encontró en la ruta: '{file_path}'.")
+            raise
+        except IOError as e:
+            self.logger.critical(f"\n❌ FALLO (Error de E/S): Ocurrió un error de entrada/salida al leer el archivo de texto '{file_path}'.\nDetalles: {e}", exc_info=True)
+            raise
+        finally:
+            # --- Medición de rendimiento: Fin de la iteración ---
+            duration_total_operation = time.time() - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la iteración (iterar_texto_plano): {duration_total_operation:.4f} segundos, {lineas_leidas} líneas.")
+
     def leer_xml(self, xml_file_path: str, nombre_paso: str = "") -> Union[ET.Element, None]:
         """
         Lee y parsea un archivo XML, devolviendo su elemento raíz como un objeto Element.
@@ -1026,6 +1560,9 @@ class FileActions:
             Union[ET.Element, None]: El **elemento raíz del XML** como un objeto `xml.etree.ElementTree.Element`,
                                      o **None** si el archivo no se encuentra, el formato XML es inválido,
                                      o si ocurre un error inesperado.
+
+        Nota: El árbol completo queda en memoria. Para archivos grandes (feeds, sitemaps) usar
+        `iterar_xml` o `extraer_campos_xml`, que procesan el archivo en streaming.
         """
         self.logger.info(f"\n--- {nombre_paso}: Intentando leer el archivo XML: '{xml_file_path}'. ---")
 
@@ -1069,6 +1606,138 @@ class FileActions:
             duration_total_operation = end_time_total_operation - start_time_total_operation
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_xml): {duration_total_operation:.4f} segundos.")
             self.logger.debug("\nOperación de lectura de archivo XML finalizada.")
+
+    def _coincide_etiqueta_xml(self, pila_etiquetas: List[str], etiqueta: str) -> bool:
+        """
+        Indica si el elemento en la cima de la pila coincide con `etiqueta`, que puede ser un nombre local ('url'),
+        un nombre con espacio de nombres ('{http://...}url') o una ruta de nombres locales ('urlset/url').
+        """
+        if etiqueta.startswith("{"):
+            return pila_etiquetas[-1] == etiqueta
+        partes = etiqueta.strip("/").split("/")
+        if len(partes) > len(pila_etiquetas):
+            return False
+        locales = [tag.rsplit("}", 1)[-1] for tag in pila_etiquetas[-len(partes):]]
+        return locales == partes
+
+    def iterar_xml(self, xml_file_path: str, etiqueta: str, tamano_lote: Optional[int] = None, nombre_paso: str = "") -> Iterator[Union[ET.Element, List[ET.Element]]]:
+        """
+        Versión en streaming de `leer_xml`: recorre el archivo con `ET.iterparse` y devuelve, a medida que se
+        cierran, los elementos que coinciden con `etiqueta`. Cada elemento se vacía y se desengancha de su padre
+        después de ser consumido, igual que los elementos que no forman parte de ninguna coincidencia, por lo que
+        la memoria usada es constante aunque el archivo sea muy grande.
+
+        Importante: los datos de cada elemento deben extraerse antes de pedir el siguiente (o el siguiente lote),
+        ya que en ese momento el elemento se vacía. Para obtener solo algunos campos, usar `extraer_campos_xml`.
+
+        Args:
+            xml_file_path (str): La **ruta completa al archivo XML**.
+            etiqueta (str): Nombre local ('url'), nombre con espacio de nombres ('{http://...}url')
+                            o ruta de nombres locales ('urlset/url') de los elementos a devolver.
+            tamano_lote (Optional[int]): Si se indica, el generador devuelve **listas de hasta `tamano_lote` elementos**.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Yields:
+            Union[ET.Element, List[ET.Element]]: Cada elemento coincidente (o un lote de elementos).
+
+        Raises:
+            FileNotFoundError, ET.ParseError: Se registran en el log y se propagan al consumidor del generador.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Iterando el archivo XML en streaming: '{xml_file_path}' (etiqueta: '{etiqueta}', tamaño de lote: {tamano_lote}). ---")
+
+        # --- Medición de rendimiento: Inicio de la iteración (incluye el tiempo de proceso del consumidor) ---
+        start_time_total_operation = time.time()
+        elementos_encontrados = 0
+        pila_elementos: List[ET.Element] = []
+        pila_etiquetas: List[str] = []
+        coincidencias_abiertas = 0  # Coincidencias que contienen al elemento actual: sus hijos deben conservarse.
+        lote: List[ET.Element] = []
+
+        def liberar(elemento: ET.Element) -> None:
+            elemento.clear()
+            if pila_elementos:
+                pila_elementos[-1].remove(elemento)
+
+        try:
+            for evento, elemento in ET.iterparse(xml_file_path, events=("start", "end")):
+                if evento == "start":
+                    pila_elementos.append(elemento)
+                    pila_etiquetas.append(elemento.tag)
+                    if self._coincide_etiqueta_xml(pila_etiquetas, etiqueta):
+                        coincidencias_abiertas += 1
+                    continue
+
+                coincide = self._coincide_etiqueta_xml(pila_etiquetas, etiqueta)
+                pila_elementos.pop()
+                pila_etiquetas.pop()
+
+                if coincide:
+                    coincidencias_abiertas -= 1
+                    elementos_encontrados += 1
+                    if not tamano_lote:
+                        yield elemento
+                        liberar(elemento)
+                        continue
+                    lote.append(elemento)
+                    if len(lote) >= tamano_lote:
+                        yield lote
+                        for procesado in lote:
+                            procesado.clear()
+                        lote = []
+                    # El elemento se desengancha ya del árbol: el lote conserva su referencia hasta ser consumido.
+                    if pila_elementos:
+                        pila_elementos[-1].remove(elemento)
+                elif coincidencias_abiertas == 0:
+                    # Fuera de cualquier coincidencia: el elemento ya no se necesita.
+                    liberar(elemento)
+
+            if lote:
+                yield lote
+            self.logger.info(f"\n✅ Archivo XML '{xml_file_path}' recorrido completamente: {elementos_encontrados} elementos '{etiqueta}'.")
+        except FileNotFoundError:
+            self.logger.critical(f"\n❌ FALLO (Archivo no encontrado): El archivo XML no se encontró en la ruta: '{xml_file_path}'.")
+            raise
+        except ET.ParseError as e:
+            self.logger.critical(f"\n❌ FALLO (Error de formato XML): Ocurrió un error al parsear el archivo XML '{xml_file_path}'.\nDetalles: {e}", exc_info=True)
+            raise
+        finally:
+            # --- Medición de rendimiento: Fin de la iteración ---
+            duration_total_operation = time.time() - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la iteración (iterar_xml): {duration_total_operation:.4f} segundos, {elementos_encontrados} elementos.")
+
+    def extraer_campos_xml(self, xml_file_path: str, etiqueta: str, campos: Dict[str, str], namespaces: Optional[Dict[str, str]] = None, nombre_paso: str = "") -> Iterator[Dict[str, Optional[str]]]:
+        """
+        Recorre en streaming (con `iterar_xml`) los elementos `etiqueta` y devuelve, para cada uno, solo los campos
+        solicitados. Cada campo se expresa con una ruta relativa al elemento al estilo XPath de ElementTree:
+
+        - 'loc' o 'image:image/image:loc': texto del subelemento (con prefijos definidos en `namespaces`).
+        - '@id': atributo del propio elemento.
+        - 'precio/@moneda': atributo de un subelemento.
+        - '.': texto del propio elemento.
+
+        Args:
+            xml_file_path (str): La **ruta completa al archivo XML**.
+            etiqueta (str): Elementos a recorrer (ver `iterar_xml`).
+            campos (Dict[str, str]): Nombre del campo de salida -> ruta relativa del dato.
+            namespaces (Optional[Dict[str, str]]): Prefijo -> URI de los espacios de nombres usados en las rutas.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Yields:
+            Dict[str, Optional[str]]: Un diccionario por elemento con los campos solicitados (`None` si no existen).
+        """
+        for elemento in self.iterar_xml(xml_file_path, etiqueta, nombre_paso=nombre_paso):
+            registro: Dict[str, Optional[str]] = {}
+            for nombre_campo, ruta in campos.items():
+                ruta_elemento, _, atributo = ruta.partition("@")
+                ruta_elemento = ruta_elemento.rstrip("/")
+                if atributo:
+                    objetivo = elemento if ruta_elemento in ("", ".") else elemento.find(ruta_elemento, namespaces)
+                    registro[nombre_campo] = objetivo.get(atributo) if objetivo is not None else None
+                elif ruta_elemento in ("", "."):
+                    registro[nombre_campo] = elemento.text
+                else:
+                    registro[nombre_campo] = elemento.findtext(ruta_elemento, None, namespaces)
+            yield registro
     
     def escribir_texto_plano(self, file_path: str, content: Union[str, List[str]], append: bool = False, delimiter: Optional[str] = None, nombre_paso: str = "") -> bool:
         """
@@ -1169,9 +1838,16 @@ class FileActions:
                                     Por defecto es 4.
             append (bool, opcional): Si es `True`, los datos se añadirán a una lista existente en el archivo.
                                     Si es `False` (por defecto), el archivo se sobrescribirá.
+                                    Nota: en un JSON normal esto implica leer y reescribir la lista completa;
+                                    para añadir registros con frecuencia usar JSON Lines.
             nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
                                         Por defecto es una cadena vacía "".
 
+        Si `file_path` tiene extensión `.jsonl`/`.ndjson` se usa el modo **JSON Lines**: cada registro (cada
+        elemento si `data` es una lista) se escribe en su propia línea y `append` solo añade líneas al final
+        del archivo, sin leer el contenido existente (`indent` se ignora). Para muchos registros individuales,
+        `utils.escritores_datos.EscritorJSONL` además los agrupa en escrituras por lotes.
+
         Returns:
             bool: `True` si la escritura fue exitosa, `False` en caso de error.
         """
@@ -1182,6 +1858,16 @@ class FileActions:
         start_time_total_operation = time.time()
         
         try:
+            if es_json_lines(file_path):
+                # --- Medición de rendimiento: Escritura JSON Lines (append O(1), sin releer el archivo) ---
+                start_time_serialization = time.time()
+                registros = data if isinstance(data, list) else [data]
+                escritos = anexar_lineas_json(file_path, registros, append=append)
+                duration_serialization = time.time() - start_time_serialization
+                self.logger.info(f"PERFORMANCE: Tiempo de serialización y escritura JSON Lines ({escritos} registros): {duration_serialization:.4f} segundos.")
+                self.logger.info(f"\n✅ {escritos} registros JSON Lines {mode_action} exitosamente en '{file_path}'.")
+                return True
+
             final_data = data
             if append:
                 # Comprueba si el archivo existe y tiene contenido
@@ -1258,6 +1944,9 @@ class FileActions:
             nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
                                          Por defecto es una cadena vacía "".
 
+        Nota: Cada llamada con `append=True` vuelve a leer y reescribir el archivo. Para exportar muchos
+        registros en varias llamadas usar `sesion_escritura_excel`.
+
         Returns:
             bool: `True` si la escritura fue exitosa, `False` en caso de error.
         """
@@ -1313,6 +2002,31 @@ class FileActions:
             duration_total_operation = end_time_total_operation - start_time_total_operation
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (escribir_excel): {duration_total_operation:.4f} segundos.")
             self.logger.debug("\nOperación de escritura de archivo Excel finalizada.")
+
+    def sesion_escritura_excel(self, file_path: str, hoja: str = "Sheet1", encabezados: Optional[List[str]] = None, append: bool = True, header: bool = True, tamano_lote: int = 1000, nombre_paso: str = "") -> SesionEscrituraExcel:
+        """
+        Crea una sesión de escritura Excel (`utils.escritores_datos.SesionEscrituraExcel`) para exportar muchos
+        registros sin releer ni reescribir el libro en cada llamada, como ocurre con `escribir_excel(append=True)`.
+        El libro existente se copia una sola vez al abrir la sesión y se guarda una sola vez al cerrarla.
+        En modo `append` solo se conservan los valores de las celdas (se pierden estilos, anchos y fórmulas);
+        para libros con formato usar `escribir_excel(append=True)`.
+
+        Args:
+            file_path (str): La ruta completa al archivo Excel (.xlsx).
+            hoja (str, opcional): Hoja en la que se añaden los registros. Por defecto 'Sheet1' (igual que `escribir_excel`).
+            encabezados (Optional[List[str]]): Orden de las columnas. Si es `None`, se toma del archivo existente
+                                               o de las claves del primer registro.
+            append (bool, opcional): Si es `True` (por defecto), conserva el contenido existente del archivo.
+            header (bool, opcional): Si es `True`, escribe la fila de encabezados en una hoja nueva. Por defecto es `True`.
+            tamano_lote (int, opcional): Registros por lote enviado a la hoja. Por defecto 1000.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Returns:
+            SesionEscrituraExcel: La sesión, para usar como context manager:
+                `with self.file.sesion_escritura_excel(ruta) as sesion: sesion.escribir({...})`.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Creando sesión de escritura Excel para '{file_path}' (hoja: '{hoja}', append: {append}, lote: {tamano_lote}). ---")
+        return SesionEscrituraExcel(file_path, hoja=hoja, encabezados=encabezados, append=append, escribir_encabezado=header, tamano_lote=tamano_lote)
             
     def escribir_csv(self, file_path: str, data: List[Dict], append: bool = False, header: bool = True, nombre_paso: str = "escribir_csv") -> bool:
         """
@@ -1329,6 +2043,9 @@ class FileActions:
             header (bool): Si es True, escribe los encabezados de las columnas.
             nombre_paso (str): Nombre descriptivo para el paso de log.
 
+        Nota: Cada llamada abre y cierra el archivo. Para registrar muchas filas (una a una o desde varios
+        workers de xdist) usar `sesion_escritura_csv`.
+
         Returns:
             bool: True si la escritura fue exitosa, False en caso de error.
         """
@@ -1358,4 +2075,27 @@ class FileActions:
             return False
         except Exception as e:
             self.logger.error(f"❌ {nombre_paso}: Ocurrió un error inesperado: {e}", exc_info=True)
-            return False
\ No newline at end of file
+            return False
+
+    def sesion_escritura_csv(self, file_path: str, encabezados: Optional[List[str]] = None, append: bool = True, header: bool = True, tamano_lote: int = 500, delimiter: str = ',', por_worker: bool = False, nombre_paso: str = "") -> SesionEscrituraCSV:
+        """
+        Crea una sesión de escritura CSV (`utils.escritores_datos.SesionEscrituraCSV`) que resuelve los encabezados
+        una sola vez y mantiene el archivo abierto, escribiendo los registros en lotes.
+
+        Args:
+            file_path (str): Ruta completa del archivo CSV.
+            encabezados (Optional[List[str]]): Orden de las columnas. Si es `None`, se toma del archivo existente
+                                               o de las claves del primer registro.
+            append (bool, opcional): Si es `True` (por defecto), añade al final del archivo existente.
+            header (bool, opcional): Si es `True`, escribe los encabezados en un archivo nuevo. Por defecto es `True`.
+            tamano_lote (int, opcional): Registros por lote escrito. Por defecto 500.
+            delimiter (str, opcional): Separador del CSV. Por defecto es `,`.
+            por_worker (bool, opcional): Si es `True`, cada worker de xdist escribe en '<base>.gwN.csv' y los archivos
+                                         se fusionan en `file_path` al terminar la sesión de pytest.
+            nombre_paso (str, opcional): Nombre descriptivo para el paso de log.
+
+        Returns:
+            SesionEscrituraCSV: La sesión, para usar como context manager o cerrar explícitamente con `cerrar()`.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Creando sesión de escritura CSV para '{file_path}' (append: {append}, lote: {tamano_lote}, por worker: {por_worker}). ---")
+        return SesionEscrituraCSV(file_path, encabezados=encabezados, append=append, escribir_encabezado=header, tamano_lote=tamano_lote, delimiter=delimiter, por_worker=por_worker)
@@ -55,7 +55,7 @@ class DialogActions:
             start_time_element_ready = time.time()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
@@ -232,7 +232,7 @@ class DialogActions:
             start_time_element_ready = time.time()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
@@ -417,7 +417,7 @@ class DialogActions:
             start_time_element_ready = time.time()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
@@ -644,7 +644,7 @@ class DialogActions:
             self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2)
             self.base.tomar_captura(f"{nombre_base}_elemento_listo_para_confirmacion", directorio)
 
@@ -763,7 +763,7 @@ class DialogActions:
             start_time_element_ready = time.time()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
@@ -976,7 +976,7 @@ class DialogActions:
             start_time_element_ready = time.time()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.logger.debug("\n  --> Elemento resaltado.")
             self.base.esperar_fijo(0.2)
             end_time_element_ready = time.time()
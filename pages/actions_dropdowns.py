@@ -41,7 +41,7 @@ class DropdownActions:
             # --- Medición de rendimiento: Inicio validación/espera ---
             start_time_validation = time.time()
             expect(combobox_locator).to_be_visible()
-            combobox_locator.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(combobox_locator) # Para visualización durante la ejecución
             expect(combobox_locator).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
             end_time_validation = time.time()
@@ -154,7 +154,7 @@ class DropdownActions:
             # --- Medición de rendimiento: Inicio validación/espera ---
             start_time_validation = time.time()
             expect(combobox_locator).to_be_visible()
-            combobox_locator.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(combobox_locator) # Para visualización durante la ejecución
             expect(combobox_locator).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
             end_time_validation = time.time()
@@ -269,7 +269,7 @@ class DropdownActions:
             # --- Medición de rendimiento: Inicio validación/espera ---
             start_time_validation = time.time()
             expect(combobox_multiple_locator).to_be_visible()
-            combobox_multiple_locator.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(combobox_multiple_locator) # Para visualización durante la ejecución
             expect(combobox_multiple_locator).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
             end_time_validation = time.time()
@@ -389,7 +389,7 @@ class DropdownActions:
             # --- Medición de rendimiento: Inicio validación/espera ---
             start_time_validation = time.time()
             expect(selector_dropdown).to_be_visible()
-            selector_dropdown.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(selector_dropdown) # Para visualización durante la ejecución
             expect(selector_dropdown).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
             end_time_validation = time.time()
@@ -523,7 +523,7 @@ class DropdownActions:
             # --- Medición de rendimiento: Inicio validación/espera ---
             start_time_validation = time.time()
             expect(dropdown_locator).to_be_visible()
-            dropdown_locator.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(dropdown_locator) # Para visualización durante la ejecución
             expect(dropdown_locator).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
             end_time_validation = time.time()
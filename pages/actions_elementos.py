@@ -3,8 +3,10 @@ import time
 import math
 import logging
 import os
+from urllib.parse import urljoin
 from typing import Union, Optional, Dict, Any, List, Tuple
 from playwright.sync_api import Page, Locator, expect, Error, TimeoutError
+from utils.perfil_red import CABECERA_SIMULADA
 
 class ElementActions:
     def __init__(self, base_page):
@@ -70,7 +72,7 @@ class ElementActions:
 
             if resaltar:
                 # Resalta visualmente el elemento en la página para ayudar en el debugging o demostraciones.
-                locator.highlight()
+                self.base.resaltar_elemento(locator)
                 self.logger.debug(f"Elemento '{selector}' resaltado.")
 
             # Toma una captura de pantalla para documentar que el elemento es visible.
@@ -285,7 +287,7 @@ class ElementActions:
 
             # Opcional: **Resalta visualmente el elemento** en la página del navegador.
             # Esto es extremadamente útil para el debugging o para demos visuales de la prueba.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado actual de la página, antes de verificar el texto,
             # para documentar la visibilidad del elemento.
             self.base.tomar_captura(f"{nombre_base}_antes_verificacion_texto", directorio)
@@ -414,7 +416,7 @@ class ElementActions:
             self.logger.debug(f"Elemento con selector '{selector}' es visible.")
 
             # Resalta el elemento para el debugging visual.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
 
             # Toma una captura de pantalla antes de la validación.
             self.base.tomar_captura(f"{nombre_base}_antes_validacion_mensaje_html5", directorio)
@@ -520,7 +522,7 @@ class ElementActions:
         try:
             # **Resalta visualmente el elemento** en la página del navegador.
             # Esto es extremadamente útil para el debugging o para demos visuales de la prueba.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             
             # Playwright espera implícitamente a que el elemento sea visible y tenga el texto exacto.
             expect(locator).to_have_text(texto_esperado, timeout=tiempo * 1000)
@@ -598,7 +600,7 @@ class ElementActions:
         try:
             # Resalta visualmente el campo de texto en el navegador. Esto es una ayuda visual
             # excelente durante la ejecución de la prueba o el debugging.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado del campo *antes* de introducir el texto.
             self.base.tomar_captura(f"{nombre_base}_antes_de_rellenar_texto", directorio)
 
@@ -726,7 +728,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el campo de texto en el navegador.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado del campo *antes* de rellenarlo.
             self.base.tomar_captura(f"{nombre_base}_antes_de_rellenar_numerico", directorio)
 
@@ -832,7 +834,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de realizar el clic.
             self.base.tomar_captura(f"{nombre_base}_antes_click", directorio)
 
@@ -950,7 +952,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de realizar el doble clic.
             self.base.tomar_captura(f"{nombre_base}_antes_doble_click", directorio)
 
@@ -1063,7 +1065,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de realizar el hover.
             self.base.tomar_captura(f"{nombre_base}_antes_hover", directorio)
 
@@ -1170,7 +1172,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
 
             # Playwright espera a que el elemento esté habilitado.
             # El `timeout` se especifica en milisegundos.
@@ -1368,7 +1370,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de marcar el checkbox.
             self.base.tomar_captura(f"{nombre_base}_antes_marcar_checkbox", directorio)
             
@@ -1465,7 +1467,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de desmarcar el checkbox.
             self.base.tomar_captura(f"{nombre_base}_antes_desmarcar_checkbox", directorio)
             
@@ -1566,7 +1568,7 @@ class ElementActions:
         start_time_value_check = time.time()
 
         try:
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             self.base.tomar_captura(f"{nombre_base}_antes_verificar_valor_campo", directorio)
             
             # Playwright espera a que el campo contenga el valor especificado.
@@ -1678,7 +1680,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado del campo *antes* de la verificación.
             # Esto puede ser útil para ver el valor inicial si es diferente al esperado.
             self.base.tomar_captura(f"{nombre_base}_antes_verificar_valor_int", directorio)
@@ -1840,7 +1842,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado del campo *antes* de la verificación.
             self.base.tomar_captura(f"{nombre_base}_antes_verificar_valor_float", directorio)
 
@@ -1976,7 +1978,7 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la imagen *antes* de la verificación.
             self.base.tomar_captura(f"{nombre_base}_antes_verificar_alt_imagen", directorio)
 
@@ -2096,20 +2098,31 @@ class ElementActions:
         self.logger.info(f"\nLa imagen con selector '{selector}' es visible en el DOM y tiene la URL: {image_url}")
 
         try:
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             self.base.tomar_captura(f"{nombre_base}_antes_verificar_carga_imagen", directorio)
 
-            # Usamos page.wait_for_event para esperar la respuesta de red.
-            # Esto es compatible con la API síncrona de Playwright.
-            self.logger.debug(f"\nEsperando respuesta de red para la imagen con URL: {image_url} (timeout: {tiempo_espera_red}s).")
-            
-            # El evento 'response' se dispara cuando una respuesta de red se completa.
-            response = self.page.wait_for_event(
-                "response",
-                lambda resp: resp.url == image_url and resp.request.resource_type == "image",
-                timeout=tiempo_espera_red * 1000
-            )
+            # La imagen suele haberse descargado antes de llegar aquí: primero se busca en el registro de red
+            # de la página y solo si aún no hay respuesta se espera el evento 'response'.
+            url_absoluta = urljoin(self.page.url, image_url)
+            registro = self.base.red.ultima_respuesta(url_absoluta, tipo="image")
+            if registro is not None:
+                response = registro.respuesta
+                self.logger.debug(f"\nRespuesta de la imagen '{url_absoluta}' obtenida del registro de red (estado {response.status}).")
+            else:
+                self.logger.debug(f"\nEsperando respuesta de red para la imagen con URL: {url_absoluta} (timeout: {tiempo_espera_red}s).")
+                response = self.page.wait_for_event(
+                    "response",
+                    lambda resp: resp.url == url_absoluta and resp.request.resource_type == "image",
+                    timeout=tiempo_espera_red * 1000
+                )
             
+            # Una imagen simulada por el perfil de red no demuestra que el recurso real cargue.
+            if response.headers.get(CABECERA_SIMULADA):
+                error_msg = (f"\n❌ FALLO: La imagen con URL '{image_url}' fue simulada por el perfil de red "
+                             f"'{response.headers[CABECERA_SIMULADA]}'. Marca el test con @pytest.mark.permitir_recursos(\"image\").")
+                self.logger.error(error_msg)
+                raise ValueError(error_msg)
+
             # 4. Verificar el código de estado de la respuesta HTTP.
             if 200 <= response.status <= 299:
                 # Medición de rendimiento y logging de éxito.
@@ -2205,7 +2218,7 @@ class ElementActions:
             expect(selector).to_be_enabled()
 
             # Resaltar el elemento para depuración visual y tomar una captura.
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.tomar_captura(f"{nombre_base}_antes_extraccion_valor", directorio)
             self.logger.debug(f"\nElemento '{selector}' es visible y habilitado.")
 
@@ -2588,7 +2601,7 @@ class ElementActions:
             for nombre_elemento, localizador_elemento in elementos_a_validar.items():
                 expect(localizador_elemento).to_be_visible()
                 expect(localizador_elemento).to_be_enabled()
-                localizador_elemento.highlight() # Para visualización durante la ejecución
+                self.base.resaltar_elemento(localizador_elemento) # Para visualización durante la ejecución
                 self.base.esperar_fijo(0.1) # Pequeña pausa para que se vea el highlight
             
             # --- Medición de rendimiento: Fin pre-validación ---
@@ -2658,7 +2671,7 @@ class ElementActions:
             duration_move_left_thumb = end_time_move_left_thumb - start_time_move_left_thumb
             self.logger.info(f"PERFORMANCE: Tiempo de movimiento de pulgar izquierdo: {duration_move_left_thumb:.4f} segundos.")
             self.base.tomar_captura(f"{nombre_base}_slider_izquierdo_movido", directorio)
-            self.base.esperar_fijo(0.5) # Pausa adicional después de procesar el primer pulgar para estabilización
+            self.base.esperar_fijo(0.5, funcional=True) # Pausa adicional después de procesar el primer pulgar para estabilización
 
             # --- 5. Mover Pulgar Derecho (Máximo) ---
             self.logger.info(f"\n🔄 Moviendo pulgar derecho a {porcentaje_destino_derecho*100:.0f}%...")
@@ -3138,7 +3151,7 @@ class ElementActions:
 
             # --- Medición de rendimiento: Tiempo de ejecución de la acción de 'focus' ---
             start_time_action = time.time()
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # El método focus() de Playwright establece el foco en el elemento.
             # Playwright espera implícitamente que el elemento esté visible y habilitado antes de enfocarlo.
             locator.focus() # Eliminado 'timeout' del focus() para usar el de Playwright por defecto o global.
@@ -3547,7 +3560,7 @@ class ElementActions:
         
         try:
             # Resalta el elemento para confirmación visual
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             self.logger.debug(f"Elemento '{selector}' resaltado.")
             # Espera explícita a que el elemento esté vacío.
             expect(locator).to_be_empty(timeout=tiempo * 1000)
@@ -3633,7 +3646,7 @@ class ElementActions:
         
         try:
             # Resalta el elemento para confirmación visual
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             self.logger.debug(f"Elemento '{selector}' resaltado.")
             # Espera explícita a que el elemento cumpla la condición de estar deshabilitado.
             expect(locator).to_be_disabled(timeout=tiempo * 1000)
@@ -3728,7 +3741,7 @@ class ElementActions:
             # Esto previene errores si el campo aún no ha cargado completamente.
             expect(locator).to_be_visible(timeout=tiempo * 1000)
             # Resalta el campo antes de la acción para una mejor depuración visual.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             self.logger.debug(f"Elemento '{selector}' resaltado.")
             
             # Realiza la acción de limpieza.
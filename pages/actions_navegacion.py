@@ -1,15 +1,138 @@
 import time
 import re
-from typing import Union, Optional, Dict, Any, List
+from typing import Union, Optional, Dict, Any, List, Callable, Tuple
 from playwright.sync_api import Page, Locator, expect, Error, TimeoutError
+from utils.metricas_navegacion import capturar_metricas as capturar_metricas_navegacion
 
 class NavigationActions:
+    # Estrategias de espera de Playwright para goto/go_back/go_forward, de la más temprana a la más tardía.
+    # Además, `esperar_hasta` acepta un Locator, o un selector con el prefijo 'visible:' (ej: 'visible:#main'):
+    # se navega con 'commit' y se espera a que el elemento sea visible.
+    ESTRATEGIAS_ESPERA = ("commit", "domcontentloaded", "load", "networkidle")
+    PREFIJO_SELECTOR = "visible:"
+    # Interruptor global: si se asigna una estrategia, tiene prioridad sobre el perfil de ejecución en todas las instancias.
+    esperar_hasta_global: Optional[Union[str, Locator]] = None
+    # go_back/go_forward esperan a 'load' salvo que la llamada o `esperar_hasta_global` indiquen otra estrategia.
+    ESTRATEGIA_HISTORIAL = "load"
+    # Segundos acumulados (por proceso) que cada estrategia permitió continuar antes del evento 'load':
+    # {estrategia: [navegaciones, segundos]}. Se resume al final de la sesión (ver `resumen_ahorro`).
+    ahorro_por_estrategia: Dict[str, List[float]] = {}
+
     def __init__(self, base_page):
         self.base = base_page
         self.page: Page = base_page.page
         self.logger = base_page.logger
+        # Navegación temprana cuyo ahorro aún no se ha calculado: (estrategia, descripción, timeOrigin, ms al continuar).
+        self._medicion_pendiente: Optional[Tuple[str, str, float, float]] = None
+
+    def _resolver_estrategia(self, esperar_hasta: Optional[Union[str, Locator]], por_defecto: Optional[str] = None) -> Union[str, Locator]:
+        """
+        Estrategia efectiva: la de la llamada, la global, `por_defecto` (si se indica) o la del perfil de
+        ejecución (por defecto 'domcontentloaded').
+        """
+        if esperar_hasta is not None:
+            return esperar_hasta
+        if NavigationActions.esperar_hasta_global is not None:
+            return NavigationActions.esperar_hasta_global
+        if por_defecto is not None:
+            return por_defecto
+        return self.base.perfil.get("esperar_hasta", "domcontentloaded")
+
+    def _iniciar_medicion_ahorro(self, tipo_estrategia: str, descripcion: str) -> None:
+        """
+        Anota, con el reloj del navegador, el instante en que el test continúa tras una estrategia que termina
+        antes del evento 'load'. No espera al 'load': el ahorro se calcula después en `cerrar_medicion_ahorro`.
+        """
+        try:
+            origen, listo_ms = self.page.evaluate("[performance.timeOrigin, performance.now()]")
+        except Error as e:
+            self.logger.debug(f"\nNo se pudo medir el ahorro de la estrategia '{tipo_estrategia}' en {descripcion}. Detalles: {e}")
+            return
+        self._medicion_pendiente = (tipo_estrategia, descripcion, origen, listo_ms)
 
-    def ir_a_url(self, url: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
+    def cerrar_medicion_ahorro(self) -> None:
+        """
+        Completa la medición pendiente de la última navegación temprana: compara el instante en que el test
+        continuó con `loadEventEnd` de Navigation Timing del mismo documento (mismo `timeOrigin`), sin esperarlo.
+        Se llama antes de cada navegación y al terminar el test. Si el documento ya cambió (p. ej. por un clic)
+        o su 'load' aún no había terminado, la navegación no se contabiliza.
+        """
+        if self._medicion_pendiente is None:
+            return
+        tipo_estrategia, descripcion, origen, listo_ms = self._medicion_pendiente
+        self._medicion_pendiente = None
+        try:
+            origen_actual, load_ms = self.page.evaluate(
+                "[performance.timeOrigin, (performance.getEntriesByType('navigation')[0] || {}).loadEventEnd || 0]"
+            )
+        except Error as e:
+            self.logger.debug(f"\nNo se pudo medir el ahorro de la estrategia '{tipo_estrategia}' en {descripcion}. Detalles: {e}")
+            return
+        if origen_actual != origen or load_ms <= 0:
+            self.logger.debug(f"\nAhorro de la estrategia '{tipo_estrategia}' en {descripcion} no medido: el documento cambió o su 'load' no terminó.")
+            return
+        ahorro = max(load_ms - listo_ms, 0.0) / 1000
+        acumulado = NavigationActions.ahorro_por_estrategia.setdefault(tipo_estrategia, [0, 0.0])
+        acumulado[0] += 1
+        acumulado[1] += ahorro
+        self.logger.info(f"PERFORMANCE: La estrategia de espera '{tipo_estrategia}' en {descripcion} permitió continuar "
+                         f"{ahorro:.4f} segundos antes del evento 'load' (acumulado: {acumulado[1]:.4f} segundos en {acumulado[0]} navegaciones).")
+
+    @classmethod
+    def resumen_ahorro(cls) -> Dict[str, Dict[str, float]]:
+        """Navegaciones medidas, segundos ahorrados en total y media por navegación de cada estrategia (en este proceso)."""
+        return {
+            estrategia: {"navegaciones": navegaciones, "segundos": segundos, "media_segundos": segundos / navegaciones}
+            for estrategia, (navegaciones, segundos) in cls.ahorro_por_estrategia.items()
+        }
+
+    def _navegar_con_estrategia(self, accion: Callable[..., Any], descripcion: str, esperar_hasta: Optional[Union[str, Locator]] = None,
+                                por_defecto: Optional[str] = None) -> Any:
+        """
+        Ejecuta una navegación (`page.goto`, `go_back` o `go_forward`) con la estrategia de espera indicada y,
+        si la estrategia termina antes que el evento 'load', anota cuándo continuó el test para calcular
+        después cuánto tiempo ahorró (ver `cerrar_medicion_ahorro`).
+
+        Args:
+            accion (Callable[..., Any]): Función de navegación que acepta `wait_until`.
+            descripcion (str): Descripción de la navegación para los logs.
+            esperar_hasta (Optional[Union[str, Locator]]): 'commit', 'domcontentloaded', 'load', 'networkidle',
+                                                           'visible:<selector>' o un Locator. Si es `None`, se usa la
+                                                           global, `por_defecto` o la del perfil.
+            por_defecto (Optional[str]): Estrategia que sustituye a la del perfil (ej: `ESTRATEGIA_HISTORIAL`).
+
+        Returns:
+            Any: La respuesta de la navegación (`Response` o `None`).
+
+        Raises:
+            ValueError: Si `esperar_hasta` es un texto que no es una estrategia conocida ni lleva el prefijo 'visible:'.
+        """
+        estrategia = self._resolver_estrategia(esperar_hasta, por_defecto)
+        locator_listo = None
+        if isinstance(estrategia, str) and estrategia in self.ESTRATEGIAS_ESPERA:
+            wait_until, tipo_estrategia = estrategia, estrategia
+        elif isinstance(estrategia, str):
+            if not estrategia.startswith(self.PREFIJO_SELECTOR):
+                raise ValueError(f"\nEstrategia de espera '{estrategia}' no válida. Usa una de {self.ESTRATEGIAS_ESPERA}, "
+                                 f"'{self.PREFIJO_SELECTOR}<selector>' o un Locator.")
+            locator_listo = self.page.locator(estrategia[len(self.PREFIJO_SELECTOR):])
+            wait_until, tipo_estrategia = "commit", "localizador"
+        else:
+            locator_listo = estrategia
+            wait_until, tipo_estrategia = "commit", "localizador"
+        self.logger.debug(f"\nEstrategia de espera para {descripcion}: '{estrategia}' (wait_until='{wait_until}').")
+
+        self.cerrar_medicion_ahorro()
+        respuesta = accion(wait_until=wait_until)
+        if locator_listo is not None:
+            locator_listo.wait_for(state="visible")
+
+        # Sin respuesta (go_back sin historial, navegación dentro del mismo documento) no hay evento 'load' que comparar.
+        if respuesta is not None and tipo_estrategia in ("commit", "domcontentloaded", "localizador"):
+            self._iniciar_medicion_ahorro(tipo_estrategia, descripcion)
+        return respuesta
+
+    def ir_a_url(self, url: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, capturar_metricas: Optional[bool] = None, esperar_hasta: Optional[Union[str, Locator]] = None) -> Optional[Dict[str, Any]]:
         """
         Navega a una URL específica y mide el tiempo que tarda la operación.
         Incluye manejo de excepciones y la posibilidad de tomar capturas de pantalla.
@@ -19,6 +142,17 @@ class NavigationActions:
             nombre_base (str): Nombre base para las capturas de pantalla.
             directorio (str): Ruta del directorio para guardar las capturas.
             tiempo (Union[int, float]): Tiempo de espera después de la navegación.
+            capturar_metricas (Optional[bool]): Si es `True`, lee las métricas del navegador (TTFB, DOMContentLoaded,
+                                                load, FCP, LCP, CLS y recursos) y las guarda por URL y dispositivo
+                                                (ver utils/metricas_navegacion.py). Si es `None`, lo decide la clave
+                                                'metricas_navegacion' del perfil de ejecución.
+            esperar_hasta (Optional[Union[str, Locator]]): Hasta cuándo esperar: 'commit', 'domcontentloaded', 'load',
+                                                           'networkidle', 'visible:<selector>' o un Locator que debe estar visible.
+                                                           Si es `None`, se usa `esperar_hasta_global` o la clave
+                                                           'esperar_hasta' del perfil de ejecución.
+
+        Returns:
+            Optional[Dict[str, Any]]: El registro de métricas si se capturaron; `None` en caso contrario.
         """
         nombre_paso = f"Navegar a la URL: '{url}'"
         self.logger.info(f"\n--- {nombre_paso} ---")
@@ -27,9 +161,9 @@ class NavigationActions:
         start_time = time.time()
 
         try:
-            # Navega a la URL. El `wait_until='domcontentloaded'` espera a que el DOM esté listo,
-            # lo que es útil para la mayoría de los casos.
-            self.page.goto(url, wait_until="domcontentloaded")
+            # Navega a la URL con la estrategia de espera configurada (por defecto 'domcontentloaded',
+            # que espera a que el DOM esté listo y es útil para la mayoría de los casos).
+            self._navegar_con_estrategia(lambda wait_until: self.page.goto(url, wait_until=wait_until), f"la navegación a '{url}'", esperar_hasta)
             
             # --- Medición de rendimiento: Fin de la acción de navegación ---
             end_time = time.time()
@@ -38,7 +172,12 @@ class NavigationActions:
             # Registra el éxito y las métricas de rendimiento.
             self.logger.info(f"PERFORMANCE: La navegación a '{url}' tardó {duration:.4f} segundos.")
             self.logger.info(f"\n✔ ÉXITO: Navegación completada a la URL: '{self.page.url}'.")
+
+            metricas = None
+            if capturar_metricas if capturar_metricas is not None else self.base.perfil.get("metricas_navegacion", False):
+                metricas = capturar_metricas_navegacion(self.page, url, perfil_ejecucion=self.base.perfil.get("nombre"))
             self.base.tomar_captura(f"{nombre_base}_navegacion_exitosa", directorio)
+            return metricas
 
         except Error as e:
             # Captura errores específicos de Playwright, como timeouts o errores de red.
@@ -63,7 +202,7 @@ class NavigationActions:
             self.base.tomar_captura(f"{nombre_base}_error_inesperado_navegacion", directorio)
             raise # Re-lanza la excepción.
     
-    def volver_a_pagina_anterior(self, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
+    def volver_a_pagina_anterior(self, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, esperar_hasta: Optional[Union[str, Locator]] = None):
         """
         Simula la acción de volver a la página anterior en el historial del navegador.
         
@@ -75,6 +214,9 @@ class NavigationActions:
             nombre_base (str): Nombre base para las capturas de pantalla tomadas durante la validación.
             directorio (str): Ruta del directorio para guardar las capturas.
             tiempo (Union[int, float]): Tiempo de espera opcional después de completar la acción.
+            esperar_hasta (Optional[Union[str, Locator]]): Estrategia de espera ('commit', 'domcontentloaded', 'load',
+                                                           'networkidle', 'visible:<selector>' o un Locator visible). Ver `ir_a_url`.
+                                                           Si es `None`, se usa `esperar_hasta_global` o 'load'.
         
         Raises:
             TimeoutError: Si el navegador no puede volver a la página anterior dentro del tiempo límite.
@@ -92,9 +234,9 @@ class NavigationActions:
         start_time = time.time()
 
         try:
-            # Intenta volver a la página anterior. Playwright espera implícitamente
-            # a que la navegación se complete.
-            self.page.go_back()
+            # Intenta volver a la página anterior con la estrategia de espera configurada.
+            self._navegar_con_estrategia(lambda wait_until: self.page.go_back(wait_until=wait_until), "la acción de 'volver atrás'", esperar_hasta,
+                                         por_defecto=self.ESTRATEGIA_HISTORIAL)
             
             # --- Medición de rendimiento: Fin de la acción ---
             end_time = time.time()
@@ -132,7 +274,7 @@ class NavigationActions:
             self.base.tomar_captura(f"{nombre_base}_error_inesperado_volver_atras", directorio)
             raise
     
-    def avanzar_a_pagina_siguiente(self, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
+    def avanzar_a_pagina_siguiente(self, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, esperar_hasta: Optional[Union[str, Locator]] = None):
         """
         Simula la acción de avanzar a la página siguiente en el historial del navegador.
         
@@ -144,6 +286,9 @@ class NavigationActions:
             nombre_base (str): Nombre base para las capturas de pantalla tomadas durante la validación.
             directorio (str): Ruta del directorio para guardar las capturas.
             tiempo (Union[int, float]): Tiempo de espera opcional después de completar la acción.
+            esperar_hasta (Optional[Union[str, Locator]]): Estrategia de espera ('commit', 'domcontentloaded', 'load',
+                                                           'networkidle', 'visible:<selector>' o un Locator visible). Ver `ir_a_url`.
+                                                           Si es `None`, se usa `esperar_hasta_global` o 'load'.
         
         Raises:
             TimeoutError: Si el navegador no puede avanzar a la página siguiente dentro del tiempo límite.
@@ -161,9 +306,9 @@ class NavigationActions:
         start_time = time.time()
 
         try:
-            # Intenta avanzar a la página siguiente. Playwright espera implícitamente
-            # a que la navegación se complete.
-            self.page.go_forward()
+            # Intenta avanzar a la página siguiente con la estrategia de espera configurada.
+            self._navegar_con_estrategia(lambda wait_until: self.page.go_forward(wait_until=wait_until), "la acción de 'avanzar'", esperar_hasta,
+                                         por_defecto=self.ESTRATEGIA_HISTORIAL)
             
             # --- Medición de rendimiento: Fin de la acción ---
             end_time = time.time()
@@ -421,7 +566,7 @@ class NavigationActions:
             self.logger.debug(f"\nEsperando que el contenedor de paginación '{selector_paginado}' esté visible (timeout: {tiempo_espera_componente}s).")
             # Convertir tiempo_espera_componente de segundos a milisegundos para expect()
             expect(selector_paginado).to_be_visible()
-            selector_paginado.highlight()
+            self.base.resaltar_elemento(selector_paginado)
             self.logger.info("\n✅ Contenedor de paginación visible. Procediendo a verificar la página inicial.")
 
             # --- Medición de rendimiento: Inicio de localización de la página inicial ---
@@ -449,7 +594,7 @@ class NavigationActions:
 
             # 3. Verificar que la página inicial esperada esté seleccionada (marcada con la clase de resaltado)
             self.logger.info(f"\nVerificando si la página '{texto_pagina_inicial}' tiene la clase de resaltado esperada '{clase_resaltado}'...")
-            pagina_inicial_locator.highlight() # Resaltar el elemento para la captura visual
+            self.base.resaltar_elemento(pagina_inicial_locator) # Resaltar el elemento para la captura visual
             self.base.tomar_captura(f"{nombre_base}_pagina_inicial_encontrada_resaltada", directorio)
 
             # Obtener todas las clases del elemento y verificar si la clase de resaltado está presente
@@ -544,9 +689,10 @@ class NavigationActions:
                                                          para que el componente de paginación y
                                                          los elementos de página estén visibles.
                                                          Por defecto, `10.0` segundos.
-            pausa_post_clic (Union[int, float]): **Pausa opcional** (en segundos) después de
-                                                  hacer clic en un número de página, para permitir
-                                                  que la página cargue y los estilos se apliquen.
+            pausa_post_clic (Union[int, float]): **Pausa visual opcional** (en segundos) después de
+                                                  hacer clic en un número de página. Se escala por el
+                                                  perfil de ejecución; la verificación de la clase de
+                                                  resaltado espera por sí misma a que se aplique.
                                                   Por defecto, `0.5` segundos.
 
         Returns:
@@ -570,7 +716,7 @@ class NavigationActions:
             self.logger.debug(f"\nEsperando que el contenedor de paginación '{selector_paginado}' esté visible (timeout: {tiempo_espera_componente}s).")
             # Convertir tiempo_espera_componente de segundos a milisegundos para expect()
             expect(selector_paginado).to_be_visible()
-            selector_paginado.highlight()
+            self.base.resaltar_elemento(selector_paginado)
             self.logger.info("\n✅ Contenedor de paginación visible. Procediendo.")
 
             # --- Medición de rendimiento: Inicio detección de página actual y total ---
@@ -652,7 +798,7 @@ class NavigationActions:
             duration_locator_button = end_time_locator_button - start_time_locator_button
             self.logger.info(f"PERFORMANCE: Tiempo de localización del botón de la página de destino: {duration_locator_button:.4f} segundos.")
 
-            pagina_destino_locator.highlight()
+            self.base.resaltar_elemento(pagina_destino_locator)
             self.base.tomar_captura(f"{nombre_base}_pagina_a_navegar_encontrada", directorio)
             
             self.logger.info(f"\n  Haciendo clic en la página '{numero_pagina_a_navegar}'...")
@@ -660,7 +806,7 @@ class NavigationActions:
             # --- Medición de rendimiento: Inicio de click y espera de carga ---
             start_time_click_and_wait = time.time()
             pagina_destino_locator.click()
-            self.base.esperar_fijo(pausa_post_clic) # Pausa para permitir la carga de la página y la aplicación de estilos
+            self.base.esperar_fijo(pausa_post_clic) # Pausa visual; la clase de resaltado se espera con expect más abajo
             
             # --- Medición de rendimiento: Fin de click y espera de carga ---
             end_time_click_and_wait = time.time()
@@ -674,19 +820,22 @@ class NavigationActions:
             
             # Asegurarse de que el elemento de destino aún esté visible y, opcionalmente, que sus atributos se hayan actualizado.
             expect(pagina_destino_locator).to_be_visible()
-            pagina_destino_locator.highlight() # Resaltar el elemento para la captura final
+            self.base.resaltar_elemento(pagina_destino_locator) # Resaltar el elemento para la captura final
 
             # --- Medición de rendimiento: Inicio de verificación de estado final ---
             start_time_final_verification = time.time()
 
+            # La clase se aplica de forma asíncrona tras el clic: expect reintenta hasta que aparece o vence el timeout.
+            try:
+                expect(pagina_destino_locator).to_have_class(
+                    re.compile(rf"(^|\s){re.escape(clase_resaltado)}(\s|$)"), timeout=tiempo_espera_componente * 1000
+                )
+                pagina_resaltada = True
+            except AssertionError:
+                pagina_resaltada = False
             current_classes_attribute = pagina_destino_locator.get_attribute("class")
-            
-            if current_classes_attribute is not None:
-                current_classes_list = current_classes_attribute.split()
-            else:
-                current_classes_list = []
 
-            if clase_resaltado in current_classes_list:
+            if pagina_resaltada:
                 self.logger.info(f"\n  ✅ ÉXITO: La página '{numero_pagina_a_navegar}' está seleccionada y resaltada con la clase '{clase_resaltado}'.")
                 self.base.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_seleccionada_ok", directorio)
                 success = True
@@ -907,7 +1056,7 @@ class NavigationActions:
             self.logger.info(f"\n✅ Pestaña con URL '{current_page_url}' cerrada exitosamente.")
             
             # Pequeña espera después de cerrar la pestaña para asegurar que el DOM se libere
-            self.base.esperar_fijo(tiempo_post_cierre) 
+            self.base.esperar_fijo(tiempo_post_cierre, funcional=True)
 
             # Verificar si hay otras páginas abiertas en el contexto y cambiar el foco
             self.logger.debug("\n  --> Verificando otras pestañas en el contexto para cambiar el foco...")
@@ -973,7 +1122,7 @@ class NavigationActions:
             expect(selector).to_be_visible(timeout=tiempo_espera_max_total * 1000)
             expect(selector).to_be_enabled(timeout=tiempo_espera_max_total * 1000)
             self.logger.info("El selector ha sido validado exitosamente. Está visible y habilitado.")
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2)
             
             # 2. Realizar el clic
@@ -64,7 +64,7 @@ class TableActions:
             expect(selector).to_be_visible()
             
             # Resaltar el elemento de la tabla para depuración visual.
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.logger.debug(f"\nTabla con selector '{selector_info}' resaltada.")
             self.base.tomar_captura(f"{nombre_base}_antes_obtener_dimensiones", directorio) # Captura antes de contar.
 
@@ -187,7 +187,7 @@ class TableActions:
             self.logger.info(f"\nTabla con selector '{table_selector}' está visible.")
             
             # Resaltar la tabla completa para depuración visual.
-            table_selector.highlight()
+            self.base.resaltar_elemento(table_selector)
             self.base.tomar_captura(f"{nombre_base}_antes_busqueda_coincidencia", directorio) # Captura antes de buscar.
 
             # 2. Obtener todas las filas de datos de la tabla
@@ -206,7 +206,7 @@ class TableActions:
                 if texto_buscado.lower() in fila_texto.lower():
                     self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia parcial) en la fila {i+1}.")
                     self.logger.info(f"Contenido completo de la fila: '{fila_texto}'")
-                    fila.highlight() # Resalta la fila donde se encontró la coincidencia.
+                    self.base.resaltar_elemento(fila) # Resalta la fila donde se encontró la coincidencia.
                     self.base.tomar_captura(f"{nombre_base}_coincidencia_parcial_encontrada_fila_{i+1}", directorio)
                     encontrado = True
                     # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar el 'break'
@@ -309,7 +309,7 @@ class TableActions:
             self.logger.info(f"\nTabla con selector '{table_selector}' está visible.")
             
             # Resaltar la tabla completa para depuración visual.
-            table_selector.highlight()
+            self.base.resaltar_elemento(table_selector)
             self.base.tomar_captura(f"{nombre_base}_antes_busqueda_estricta", directorio) # Captura antes de buscar.
 
             # 2. Obtener todas las filas de datos de la tabla
@@ -335,8 +335,8 @@ class TableActions:
                     if celda_texto == texto_buscado: # Coincidencia estricta
                         self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia estricta) en la celda {j+1} de la fila {i+1}.")
                         self.logger.info(f"Contenido completo de la fila: '{fila_texto_completo.strip(' | ')}'")
-                        celda.highlight() # Resaltar la celda donde se encontró la coincidencia.
-                        fila.highlight() # También resaltar la fila para mejor visibilidad.
+                        self.base.resaltar_elemento(celda) # Resaltar la celda donde se encontró la coincidencia.
+                        self.base.resaltar_elemento(fila) # También resaltar la fila para mejor visibilidad.
                         self.base.tomar_captura(f"{nombre_base}_coincidencia_estricta_encontrada_fila_{i+1}_celda_{j+1}", directorio)
                         encontrado = True
                         # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar ambos 'break'.
@@ -440,7 +440,7 @@ class TableActions:
             # Es el primer paso para garantizar que la tabla se ha cargado en el DOM.
             self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_general_timeout}s).")
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.debug(f"\nTabla resaltada para verificación: {tabla_selector}")
 
             # 2. Esperar a que el tbody exista y tenga contenido
@@ -502,7 +502,7 @@ class TableActions:
                 expect(price_cell).to_be_visible() # Convertir a milisegundos
                 
                 price_text = price_cell.text_content().strip() # Obtener texto y limpiar espacios.
-                price_cell.highlight() # Resaltar la celda actual para depuración visual.
+                self.base.resaltar_elemento(price_cell) # Resaltar la celda actual para depuración visual.
 
                 self.logger.debug(f"\n Procesando fila {i+1}, texto de precio: '{price_text}'")
 
@@ -606,7 +606,7 @@ class TableActions:
             # Esto es crucial para asegurar que la tabla se ha cargado en el DOM.
             self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.debug(f"\nTabla resaltada para verificación: {tabla_selector}")
 
             # 2. Verificar la presencia y visibilidad del elemento thead (cabecera de la tabla)
@@ -622,7 +622,7 @@ class TableActions:
             
             # Resaltar todos los encabezados encontrados para depuración visual.
             for i in range(encabezados_actuales_locators.count()):
-                encabezados_actuales_locators.nth(i).highlight()
+                self.base.resaltar_elemento(encabezados_actuales_locators.nth(i))
             self.base.tomar_captura(f"{nombre_base}_encabezados_encontrados_y_resaltados", directorio)
 
             num_encabezados_actuales = encabezados_actuales_locators.count()
@@ -650,7 +650,7 @@ class TableActions:
                     # encabezado_locator.highlight() # Opcional: resaltar el encabezado individual si es necesario para cada uno.
                 else:
                     self.logger.error(f"\n ❌ FALLO: Encabezado {i+1} esperado era '{encabezado_esperado}', pero se encontró '{texto_encabezado_actual}'.")
-                    encabezado_locator.highlight() # Resaltar el encabezado incorrecto.
+                    self.base.resaltar_elemento(encabezado_locator) # Resaltar el encabezado incorrecto.
                     self.base.tomar_captura(f"{nombre_base}_encabezado_incorrecto_{i+1}", directorio)
                     todos_correctos = False
                     # No es necesario un time.sleep() aquí si solo queremos el log y la captura.
@@ -751,7 +751,7 @@ class TableActions:
             # 1. Asegurarse de que la tabla esté visible y disponible
             self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_general}s).")
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a verificar los datos.")
 
             # 2. Obtener los encabezados para mapear los índices de las columnas
@@ -802,7 +802,7 @@ class TableActions:
                 fila_actual_locator = row_locators.nth(i)
                 datos_fila_esperada = datos_filas_esperados[i]
                 self.logger.info(f"\n  Verificando Fila {i+1} (Datos esperados: {datos_fila_esperada})...")
-                fila_actual_locator.highlight() # Resaltar la fila actual en la captura para debug.
+                self.base.resaltar_elemento(fila_actual_locator) # Resaltar la fila actual en la captura para debug.
 
                 # Bandera para saber si la fila actual tiene algún fallo
                 fila_actual_correcta = True 
@@ -830,7 +830,7 @@ class TableActions:
                             checkbox_locator = celda_locator.locator("input[type='checkbox']")
                             if checkbox_locator.count() == 0: # Si no se encuentra el checkbox dentro de la celda
                                 self.logger.error(f"\n  ❌ FALLO: Checkbox no encontrado en la columna '{col_name}' de la Fila {i+1}.")
-                                celda_locator.highlight() # Resaltar la celda donde se esperaba el checkbox
+                                self.base.resaltar_elemento(celda_locator) # Resaltar la celda donde se esperaba el checkbox
                                 self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_no_checkbox", directorio)
                                 todos_los_datos_correctos = False
                                 fila_actual_correcta = False
@@ -838,7 +838,7 @@ class TableActions:
                                 if checkbox_locator.is_checked() != expected_value:
                                     self.logger.error(f"\n  ❌ FALLO: El checkbox de la Fila {i+1}, Columna '{col_name}' estaba "
                                                       f"{'marcado' if checkbox_locator.is_checked() else 'desmarcado'}, se esperaba {'marcado' if expected_value else 'desmarcado'}.")
-                                    checkbox_locator.highlight() # Resaltar el checkbox incorrecto
+                                    self.base.resaltar_elemento(checkbox_locator) # Resaltar el checkbox incorrecto
                                     self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_estado_incorrecto", directorio)
                                     todos_los_datos_correctos = False
                                     fila_actual_correcta = False
@@ -851,7 +851,7 @@ class TableActions:
                             # Aseguramos que expected_value también sea una cadena para la comparación, eliminando espacios.
                             if actual_value != str(expected_value).strip(): 
                                 self.logger.error(f"\n  ❌ FALLO: Fila {i+1}, Columna '{col_name}'. Se esperaba '{expected_value}', se encontró '{actual_value}'.")
-                                celda_locator.highlight() # Resaltar la celda con el dato incorrecto
+                                self.base.resaltar_elemento(celda_locator) # Resaltar la celda con el dato incorrecto
                                 self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_incorrecta", directorio)
                                 todos_los_datos_correctos = False
                                 fila_actual_correcta = False
@@ -971,7 +971,7 @@ class TableActions:
             # 1. Asegurarse de que la tabla esté visible
             self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a buscar checkboxes.")
 
             # --- Medición de rendimiento: Inicio del descubrimiento de checkboxes ---
@@ -1022,7 +1022,7 @@ class TableActions:
                 start_time_interaction = time.time()
 
                 # Resaltar el checkbox actual para la captura/visualización
-                checkbox_to_interact.highlight()
+                self.base.resaltar_elemento(checkbox_to_interact)
                 self.base.tomar_captura(f"{nombre_base}_checkbox_{i+1}_aleatorio_idx_{idx}_resaltado", directorio)
                 self.base.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
 
@@ -1051,11 +1051,11 @@ class TableActions:
                 if initial_state: # Si ya está marcado, lo desmarcamos primero para asegurar la acción de marcar
                     self.logger.info(f"\n  El checkbox del Producto ID: {product_id} ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.")
                     checkbox_to_interact.uncheck()
-                    self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                    self.base.esperar_fijo(pausa_interaccion, funcional=True) # Pausa para que el DOM se actualice
 
                     if checkbox_to_interact.is_checked(): # Si después de uncheck sigue marcado, es un fallo
                         self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no se desmarcó correctamente para la interacción.")
-                        checkbox_to_interact.highlight()
+                        self.base.resaltar_elemento(checkbox_to_interact)
                         self.base.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_desmarco", directorio)
                         todos_correctos = False
                         # No es necesario continuar con la verificación de 'check' si el 'uncheck' ya falló.
@@ -1065,12 +1065,12 @@ class TableActions:
                 # Ahora el checkbox debería estar DESMARCADO (o siempre lo estuvo si initial_state era False)
                 self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para MARCARLO...")
                 checkbox_to_interact.check() # Marca el checkbox
-                self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                self.base.esperar_fijo(pausa_interaccion, funcional=True) # Pausa para que el DOM se actualice
 
                 final_state = checkbox_to_interact.is_checked()
                 if not final_state: # Si no está marcado (seleccionado) después del clic
                     self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
-                    checkbox_to_interact.highlight()
+                    self.base.resaltar_elemento(checkbox_to_interact)
                     self.base.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_marco", directorio)
                     todos_correctos = False
                 else:
@@ -1179,7 +1179,7 @@ class TableActions:
             # 1. Asegurarse de que la tabla esté visible
             self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a buscar checkboxes.")
 
             # --- Medición de rendimiento: Inicio del descubrimiento de checkboxes ---
@@ -1241,7 +1241,7 @@ class TableActions:
                 start_time_interaction = time.time()
 
                 # Resaltar el checkbox actual para la captura/visualización
-                checkbox_to_interact.highlight()
+                self.base.resaltar_elemento(checkbox_to_interact)
                 self.base.tomar_captura(f"{nombre_base}_checkbox_consecutivo_{i+1}_idx_{current_idx}_resaltado", directorio)
                 self.base.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
 
@@ -1265,11 +1265,11 @@ class TableActions:
                 if initial_state: # Si ya está marcado, lo desmarcamos primero para asegurar la acción de marcar
                     self.logger.info(f"\n  El checkbox del Producto ID: {product_id} ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.")
                     checkbox_to_interact.uncheck()
-                    self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                    self.base.esperar_fijo(pausa_interaccion, funcional=True) # Pausa para que el DOM se actualice
 
                     if checkbox_to_interact.is_checked(): # Si después de uncheck sigue marcado, es un fallo
                         self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no se desmarcó correctamente para la interacción.")
-                        checkbox_to_interact.highlight()
+                        self.base.resaltar_elemento(checkbox_to_interact)
                         self.base.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_desmarco_consec", directorio)
                         todos_correctos = False
                         # No es necesario continuar con la verificación de 'check' si el 'uncheck' ya falló.
@@ -1278,12 +1278,12 @@ class TableActions:
                 # Ahora el checkbox debería estar DESMARCADO (o siempre lo estuvo si initial_state era False)
                 self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para MARCARLO...")
                 checkbox_to_interact.check() # Marca el checkbox
-                self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                self.base.esperar_fijo(pausa_interaccion, funcional=True) # Pausa para que el DOM se actualice
 
                 final_state = checkbox_to_interact.is_checked()
                 if not final_state: # Si no está marcado (seleccionado) después del clic
                     self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
-                    checkbox_to_interact.highlight()
+                    self.base.resaltar_elemento(checkbox_to_interact)
                     self.base.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_marco_consec", directorio)
                     todos_correctos = False
                 else:
@@ -1388,7 +1388,7 @@ class TableActions:
             # 1. Asegurarse de que la tabla esté visible
             self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a buscar checkboxes.")
 
             # --- Medición de rendimiento: Inicio del descubrimiento de checkboxes ---
@@ -1440,7 +1440,7 @@ class TableActions:
                 start_time_interaction = time.time()
 
                 # Resaltar el checkbox actual
-                checkbox_to_interact.highlight()
+                self.base.resaltar_elemento(checkbox_to_interact)
                 self.base.tomar_captura(f"{nombre_base}_deseleccion_actual_{i+1}_idx_{original_idx}_resaltado", directorio)
                 self.base.esperar_fijo(pausa_interaccion)
 
@@ -1463,12 +1463,12 @@ class TableActions:
                 self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para DESMARCARLO...")
                 # Usar .uncheck() es más directo para desmarcar que .click() si ya sabes el estado esperado.
                 checkbox_to_interact.uncheck()
-                self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                self.base.esperar_fijo(pausa_interaccion, funcional=True) # Pausa para que el DOM se actualice
 
                 final_state = checkbox_to_interact.is_checked()
                 if final_state: # Si sigue marcado después de .uncheck()
                     self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a DESMARCADO después del clic. Sigue MARCADO.")
-                    checkbox_to_interact.highlight()
+                    self.base.resaltar_elemento(checkbox_to_interact)
                     self.base.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_no_desmarcado", directorio)
                     todos_deseleccionados_correctamente = False
                 else:
@@ -1577,7 +1577,7 @@ class TableActions:
             self.logger.debug(f"Esperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
             # Convertir timeout de segundos a milisegundos para expect()
             expect(tabla_selector).to_be_visible() 
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Comenzando a iterar por filas y celdas.")
 
             # --- Medición de rendimiento: Inicio del escaneo de la tabla ---
@@ -1630,7 +1630,7 @@ class TableActions:
                         
                         if checkbox_locator.count() > 0:
                             checkbox = checkbox_locator.first
-                            checkbox.highlight()
+                            self.base.resaltar_elemento(checkbox)
                             self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_coincidencia_resaltada", directorio)
                             self.base.esperar_fijo(pausa_interaccion)
 
@@ -1640,7 +1640,7 @@ class TableActions:
                             if not checkbox.is_checked():
                                 self.logger.info(f"\n  --> Marcando checkbox en Fila {i+1} (texto '{celda_texto}')...")
                                 checkbox.check()
-                                self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                                self.base.esperar_fijo(pausa_interaccion, funcional=True) # Pausa para que el DOM se actualice
                                 
                                 if checkbox.is_checked():
                                     self.logger.info(f"\n  ✅ Checkbox en Fila {i+1} marcado correctamente.")
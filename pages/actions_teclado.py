@@ -101,7 +101,7 @@ class KeyboardActions:
         try:
             # 2. Resaltar el elemento esperado para una confirmación visual.
             self.logger.info(f"✨ Resaltando el elemento esperado para el foco: '{localizador}'...")
-            localizador.highlight()
+            self.base.resaltar_elemento(localizador)
             
             # 3. Presionar la tecla TAB utilizando la función existente.
             self.presionar_tecla_tab(tiempo_espera_post_tab=tiempo_espera_post_tab, nombre_paso="Presionando TAB para cambiar de foco")
@@ -219,7 +219,7 @@ class KeyboardActions:
 
         try:
             self.logger.info(f"✨ Resaltando el elemento esperado para el foco: '{localizador}'...")
-            localizador.highlight()
+            self.base.resaltar_elemento(localizador)
             # 2. Presionar la combinación de teclas SHIFT + TAB utilizando la función existente.
             self.presionar_shift_tab(tiempo_espera_post_shift_tab=tiempo_espera_post_shift_tab, nombre_paso="Presionando SHIFT + TAB para cambiar de foco")
 
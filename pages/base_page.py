@@ -17,6 +17,8 @@ from .actions_navegacion import NavigationActions
 
 from utils.logger import setup_logger
 from utils.config import LOGGER_DIR, SCREENSHOT_DIR
+from utils.perfiles_ejecucion import obtener_perfil
+from utils.registro_red import RegistradorRed
 
 # Asegúrate de importar la clase de localizadores
 from locators.locator_home import HomeLocatorsPage
@@ -31,16 +33,32 @@ class BasePage:
     proporcionando un punto de entrada único y organizado para las pruebas.
     """
 
+    # Modos de resaltado de elementos usados por `resaltar_elemento`:
+    # - 'siempre': llama a `locator.highlight()` (un roundtrip extra por acción que inyecta un overlay en el DOM).
+    # - 'nunca': no-op.
+    # - 'en_captura': acumula los elementos y los marca en la siguiente captura de pantalla (sin roundtrip por acción).
+    MODOS_RESALTADO = ("siempre", "nunca", "en_captura")
+    # Interruptor global: si se asigna un modo, tiene prioridad sobre el perfil de ejecución en todas las instancias.
+    modo_resaltado_global: Optional[str] = None
+    # Color del marco translúcido con el que se marcan los elementos en el modo 'en_captura'.
+    COLOR_RESALTADO_CAPTURA = "rgba(255, 0, 255, 0.35)"
+
     #1- Creamos una función incial 'Constructor'-----ES IMPORTANTE TENER ESTE INICIADOR-----
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, perfil: Optional[Dict[str, Any]] = None):
         """
         Inicializa la clase Funciones_Globales con un objeto Page de Playwright.
 
         Args:
             page (Page): El objeto de página de Playwright que representa la pestaña
                          del navegador activa.
+            perfil (Optional[Dict[str, Any]]): Perfil de ejecución (ver utils/perfiles_ejecucion.py).
+                                               Si es `None`, se usa el perfil activo.
         """
         self.page = page
+        self.perfil = perfil if perfil is not None else obtener_perfil()
+        resaltar = self.perfil["resaltar"]
+        self.modo_resaltado = resaltar if isinstance(resaltar, str) else ("siempre" if resaltar else "nunca")
+        self._resaltados_pendientes: List[Locator] = []
         self.logger = setup_logger(
             name='AutomationFramework', 
             console_level=logging.INFO, 
@@ -49,6 +67,7 @@ class BasePage:
         )
         
         self.logger.debug("DEBUG: Logger 'AutomationFramework' inicializado.")
+        self.logger.debug(f"DEBUG: Perfil de ejecución '{self.perfil['nombre']}'.")
         
         # --- Banderas para manejo de eventos de diálogo ---
         self._alerta_detectada = False
@@ -59,6 +78,9 @@ class BasePage:
         # --- Banderas para manejo de nuevas pestañas (popups) ---
         self._all_new_pages_opened_by_click: List[Page] = []
         self.page.context.on("page", self._on_new_page)
+
+        # --- Registro de la actividad de red de la página (consultas y aserciones sobre el tráfico) ---
+        self.red = RegistradorRed(self.page)
         
         # --- Instanciación de las clases de acciones (mejora de arquitectura) ---
         self.element = ElementActions(self)
@@ -85,12 +107,17 @@ class BasePage:
     def tomar_captura(self, nombre_base, directorio):
         """
         Toma una captura de pantalla de la página y la guarda en el directorio especificado.
-        Por defecto, usa SCREENSHOT_DIR de config.py.
+        Por defecto, usa SCREENSHOT_DIR de config.py. Solo se toma si la política de capturas del
+        perfil de ejecución es 'siempre' (con 'fallos' la captura la toma el fixture al fallar el test).
 
         Args:
             nombre_base (str): El nombre base para el archivo de la captura de pantalla.
             directorio (str): El directorio donde se guardará la captura. Por defecto, SCREENSHOT_DIR.
         """
+        if self.perfil["capturas"] != "siempre":
+            self.logger.debug(f"\n Captura '{nombre_base}' omitida (política de capturas: '{self.perfil['capturas']}').")
+            return
+
         try:
             if not os.path.exists(directorio):
                 os.makedirs(directorio)
@@ -98,22 +125,53 @@ class BasePage:
 
             nombre_archivo = self._generar_nombre_archivo_con_timestamp(nombre_base) #
             ruta_completa = os.path.join(directorio, f"{nombre_archivo}.png") # Cambiado a .png para mejor calidad
-            self.page.screenshot(path=ruta_completa) #
+            if self._resaltados_pendientes:
+                # Modo 'en_captura': los elementos resaltados desde la última captura se marcan en esta.
+                self.page.screenshot(path=ruta_completa, mask=self._resaltados_pendientes, mask_color=self.COLOR_RESALTADO_CAPTURA) #
+            else:
+                self.page.screenshot(path=ruta_completa) #
             self.logger.info(f"\n 📸 Captura de pantalla guardada en: {ruta_completa}") #
         except Exception as e:
             self.logger.error(f"\n ❌ Error al tomar captura de pantalla '{nombre_base}': {e}") #
+        finally:
+            self._resaltados_pendientes.clear()
+
+    #3.1- Función para resaltar un elemento según el modo de resaltado activo
+    def resaltar_elemento(self, locator: Locator) -> None:
+        """
+        Resalta un elemento según el modo de resaltado activo (`modo_resaltado_global` si está asignado,
+        o el derivado del perfil de ejecución): 'siempre' llama a `locator.highlight()`, 'nunca' no hace
+        nada y 'en_captura' acumula el elemento para marcarlo en la siguiente captura de pantalla.
+
+        Args:
+            locator (Locator): El localizador del elemento a resaltar.
+        """
+        modo = BasePage.modo_resaltado_global or self.modo_resaltado
+        if modo == "siempre":
+            locator.highlight()
+        elif modo == "en_captura" and self.perfil["capturas"] == "siempre":
+            self._resaltados_pendientes.append(locator)
         
     #4- unción basica para tiempo de espera que espera recibir el parametro tiempo
     #En caso de no pasar el tiempo por parametro, el mismo tendra un valor de medio segundo
-    def esperar_fijo(self, tiempo=0.5):
+    def esperar_fijo(self, tiempo=0.5, funcional: bool = False):
         """
-        Espera un tiempo fijo en segundos.
+        Espera un tiempo fijo en segundos. Las pausas visuales (para ver un resaltado o seguir la ejecución)
+        se escalan por el 'factor_esperas' del perfil de ejecución: los perfiles 'ci' y 'benchmark' las eliminan.
+        Las pausas funcionales, de las que depende una lectura posterior del DOM, se respetan siempre;
+        cuando sea posible es preferible sustituirlas por una espera de `expect`.
 
         Args:
             tiempo (Union[int, float]): El tiempo en segundos a esperar. Por defecto, 0.5 segundos.
+            funcional (bool): Si es `True`, la pausa no se escala por el perfil de ejecución.
         """
         self.logger.debug(f"\n Esperando fijo por {tiempo} segundos...") #
         try:
+            if not funcional:
+                tiempo = tiempo * self.perfil["factor_esperas"]
+            if tiempo <= 0:
+                self.logger.debug("\n Espera fija omitida por el perfil de ejecución.")
+                return
             time.sleep(tiempo) #
             self.logger.info(f"Espera fija de {tiempo} segundos completada.") #
         except TypeError:
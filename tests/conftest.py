@@ -3,6 +3,7 @@
 # para los tests en ese directorio y sus subdirectorios.
 import pytest
 import time
+import logging
 from playwright.sync_api import Page, expect, Playwright, sync_playwright
 from datetime import datetime
 import os
@@ -10,7 +11,51 @@ from typing import Generator
 from utils import config
 #from src.utils.config import BASE_URL
 from pages.base_page import BasePage
+from pages.actions_navegacion import NavigationActions
 from locators.locator_obstaculoPantalla import ObstaculosLocators
+from utils.matriz_dispositivos import cargar_matriz_dispositivos, PoolNavegadores
+from utils.perfiles_ejecucion import obtener_perfil, opciones_lanzamiento
+from utils.escritores_datos import SesionEscrituraCSV
+from utils.cliente_api import ClienteAPI, CLAVE_TOKEN_ALMACENAMIENTO
+from utils.cache_recursos import obtener_cache_recursos
+from utils.grabacion_har import crear_grabacion_har, NOMBRE_MARCADOR as MARCADOR_HAR
+from utils.perfil_red import aplicar_perfil_red, NOMBRE_MARCADOR as MARCADOR_PERMITIR_RECURSOS
+
+# Plugins propios del framework (hooks de Pytest que no son fixtures)
+pytest_plugins = [
+    "utils.planificador_duraciones",
+    "utils.perfiles_ejecucion",
+    "utils.escritores_datos",
+    "utils.parametrizacion_datos",
+    "utils.perfil_red",
+    "utils.grabacion_har",
+    "utils.cache_recursos",
+]
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Guarda el reporte de cada fase (setup, call, teardown) en el item como 'rep_<fase>', para que los
+    fixtures puedan saber en su teardown si el test falló (evidencias con política 'fallos').
+    """
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+
+def pytest_sessionfinish(session):
+    """
+    Resume, por proceso (cada worker de xdist el suyo), cuánto tiempo permitió continuar antes del evento 'load'
+    cada estrategia de espera de las navegaciones (ver `NavigationActions.cerrar_medicion_ahorro`).
+    """
+    logger = logging.getLogger('AutomationFramework')
+    worker = os.getenv("PYTEST_XDIST_WORKER", "principal")
+    for estrategia, ahorro in NavigationActions.resumen_ahorro().items():
+        logger.info(f"PERFORMANCE: Estrategia de espera '{estrategia}' ({worker}): {ahorro['segundos']:.4f} segundos antes del "
+                    f"evento 'load' en {ahorro['navegaciones']} navegaciones (media: {ahorro['media_segundos']:.4f} segundos).")
+
+def hubo_fallo_en_test(request) -> bool:
+    """Indica si el setup o la ejecución del test asociado a 'request' fallaron."""
+    return any(getattr(getattr(request.node, f"rep_{fase}", None), "failed", False) for fase in ("setup", "call"))
 
 # Función para generar IDs legibles
 def generar_ids_browser(param):
@@ -23,52 +68,64 @@ def generar_ids_browser(param):
 
     if device:
         return f"{browser}-{device}"
-    else:
+    elif resolution:
         return f"{browser}-{resolution['width']}x{resolution['height']}"
+    else:
+        return browser
+
+@pytest.fixture(scope="session")
+def perfil_ejecucion() -> dict:
+    """
+    Perfil de ejecución activo (debug, ci o benchmark), seleccionado con '--perfil' o PERFIL_EJECUCION.
+    Ver utils/perfiles_ejecucion.py.
+    """
+    return obtener_perfil()
+
+@pytest.fixture(scope="session")
+def pool_navegadores(playwright: Playwright, perfil_ejecucion: dict) -> Generator[PoolNavegadores, None, None]:
+    """
+    Fixture de sesión (uno por worker de xdist) que mantiene un único navegador por motor.
+    Todas las entradas de la matriz que usan el mismo motor comparten ese proceso y solo
+    crean su propio contexto, en lugar de lanzar un navegador por test.
+    """
+    pool = PoolNavegadores(playwright, opciones_lanzamiento(perfil_ejecucion))
+    yield pool
+    pool.cerrar_todos()
 
 @pytest.fixture(
     scope="function",
-    params=[
-            # Resoluciones de escritorio
-            #{"browser": "chromium", "resolution": {"width": 1920, "height": 1080}, "device": None},
-            #{"browser": "firefox", "resolution": {"width": 1920, "height": 1080}, "device": None},
-            {"browser": "webkit", "resolution": {"width": 1920, "height": 1080}, "device": None},
-            # Emulación de dispositivos móviles
-            #{"browser": "chromium", "device": "iPhone 12", "resolution": None},
-            {"browser": "webkit", "device": "Pixel 5", "resolution": None},
-            {"browser": "webkit", "device": "iPhone 12", "resolution": None}
-    ],
+    params=cargar_matriz_dispositivos(), # Matriz declarada en utils/matriz_dispositivos.py o en MATRIZ_DISPOSITIVOS
     ids=generar_ids_browser # <--- Usar la función para generar IDs
 )
-def playwright_page(playwright: Playwright, request) -> Generator[Page, None, None]:
+def playwright_page(playwright: Playwright, pool_navegadores: PoolNavegadores, perfil_ejecucion: dict, request) -> Generator[Page, None, None]:
     """
     Fixture base para configurar el navegador, contexto y página de Playwright con configuraciones comunes.
-    Maneja el lanzamiento del navegador, la creación del contexto (con grabación de video y emulación de dispositivos),
-    el rastreo (tracing) y la navegación de la página a una URL específica. También renombra el archivo de video al finalizar.
+    Obtiene el navegador compartido del motor desde el pool, crea el contexto (con grabación de video y emulación
+    de dispositivos), el rastreo (tracing) y la navegación de la página a una URL específica. También renombra el
+    archivo de video al finalizar. El video, el tracing y la captura final dependen del perfil de ejecución.
+    El perfil de red (utils/perfil_red.py) se aplica al contexto antes de abrir la página y, al terminar,
+    se registra cuántas solicitudes y bytes se evitaron. Con '--har' el tráfico se graba o se reproduce desde
+    un HAR local (utils/grabacion_har.py), y los recursos estáticos se sirven desde la caché del worker
+    (utils/cache_recursos.py) según el perfil.
     """
     param = request.param
     browser_type = param["browser"]
     resolution = param["resolution"]
     device_name = param["device"]
 
-    browser_instance = None
     context = None
     page = None
+    trace_path = None
+    bloqueador_red = None
+    grabacion_har = None
 
     try:
-        if browser_type == "chromium":
-            browser_instance = playwright.chromium.launch(headless=False, slow_mo=500)
-        elif browser_type == "firefox":
-            browser_instance = playwright.firefox.launch(headless=False, slow_mo=500)
-        elif browser_type == "webkit":
-            browser_instance = playwright.webkit.launch(headless=False, slow_mo=500)
-        else:
-            raise ValueError(f"\nEl tipo de navegador '{browser_type}' no es compatible.")
+        browser_instance = pool_navegadores.obtener(browser_type)
 
-        context_options = {
-            "record_video_dir": config.VIDEO_DIR,
-            "record_video_size": {"width": 1920, "height": 1080}
-        }
+        context_options = {}
+        if perfil_ejecucion["video"]:
+            context_options["record_video_dir"] = config.VIDEO_DIR
+            context_options["record_video_size"] = {"width": 1920, "height": 1080}
 
         if device_name:
             device = playwright.devices[device_name]
@@ -78,6 +135,17 @@ def playwright_page(playwright: Playwright, request) -> Generator[Page, None, No
         else:
             context = browser_instance.new_context(**context_options)
 
+        # Playwright evalúa primero las rutas registradas en último lugar: perfil de red -> HAR -> caché de recursos.
+        cache_recursos = obtener_cache_recursos(perfil_ejecucion)
+        if cache_recursos:
+            cache_recursos.instalar(context)
+
+        grabacion_har = crear_grabacion_har(request.node.nodeid, generar_ids_browser(param), request.node.get_closest_marker(MARCADOR_HAR))
+        if grabacion_har:
+            grabacion_har.aplicar(context)
+
+        bloqueador_red = aplicar_perfil_red(context, perfil_ejecucion, request.node.get_closest_marker(MARCADOR_PERMITIR_RECURSOS))
+
         page = context.new_page()
 
         current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -90,17 +158,39 @@ def playwright_page(playwright: Playwright, request) -> Generator[Page, None, No
         trace_file_name = f"traceview_{current_time}_{browser_type}_{trace_name_suffix}.zip"
         trace_path = os.path.join(config.TRACEVIEW_DIR, trace_file_name)
 
-        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        if perfil_ejecucion["tracing"] != "nunca":
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
 
         yield page
 
     finally:
+        fallido = hubo_fallo_en_test(request)
+
+        # Con la política de capturas 'fallos', la única captura del test se toma aquí si falló.
+        if page and fallido and perfil_ejecucion["capturas"] == "fallos":
+            try:
+                nombre_captura = f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_FALLO_{request.node.name}.png"
+                page.screenshot(path=os.path.join(config.SCREENSHOT_DIR, nombre_captura))
+            except Exception as e:
+                print(f"\nError al tomar la captura del fallo: {e}")
+
         if context:
-            context.tracing.stop(path=trace_path)
+            if perfil_ejecucion["tracing"] == "siempre" or (perfil_ejecucion["tracing"] == "fallos" and fallido):
+                context.tracing.stop(path=trace_path)
+            elif perfil_ejecucion["tracing"] == "fallos":
+                context.tracing.stop() # Se descarta el trace de los tests exitosos.
             context.close()
-            
-        if browser_instance:
-            browser_instance.close()
+
+        if grabacion_har:
+            grabacion_har.finalizar(fallido)
+
+        if bloqueador_red is not None:
+            resumen_red = bloqueador_red.resumen()
+            request.node.user_properties.append(("ahorro_red", resumen_red))
+            print(f"\nPerfil de red '{resumen_red['perfil_red']}': {resumen_red['solicitudes_evitadas']} solicitudes evitadas "
+                  f"(bloqueadas: {resumen_red['bloqueadas']}, simuladas: {resumen_red['simuladas']}), "
+                  f"~{resumen_red['bytes_ahorrados_estimados']} bytes ahorrados (estimación con el tamaño conocido de "
+                  f"{resumen_red['con_tamano_conocido']} solicitudes; {resumen_red['sin_tamano_conocido']} sin tamaño conocido no suman).")
             
         if page and page.video:
             video_path = page.video.path()
@@ -114,13 +204,52 @@ def playwright_page(playwright: Playwright, request) -> Generator[Page, None, No
                 
 # --- Fixture principal de la arquitectura ---
 @pytest.fixture(scope="function")
-def base_page(playwright_page: Page) -> BasePage:
+def base_page(playwright_page: Page, perfil_ejecucion: dict) -> Generator[BasePage, None, None]:
     """
     Fixture que inicializa la clase BasePage con el objeto 'page' de Playwright.
     Esto proporciona acceso a todas las clases de acciones (elementos, tablas, etc.)
-    en cada test que lo requiera.
+    en cada test que lo requiera. Al terminar el test se completa la medición del ahorro de la última
+    navegación con una estrategia de espera temprana (antes de cerrar el contexto).
+    """
+    base = BasePage(playwright_page, perfil=perfil_ejecucion)
+    yield base
+    base.navigation.cerrar_medicion_ahorro()
+
+@pytest.fixture(scope="function")
+def sesion_escritura_csv() -> Generator:
+    """
+    Fábrica de sesiones de escritura CSV (ver utils/escritores_datos.py). Uso en un test:
+        escritor = sesion_escritura_csv(ruta, por_worker=True)
+        escritor.escribir({...})
+    Todas las sesiones creadas se cierran (y vacían su último lote) en el teardown, aunque el test falle
+    o el cierre de otra sesión lance un error; los errores de cierre se informan juntos al final.
+    """
+    sesiones = []
+
+    def _crear(ruta: str, **opciones) -> SesionEscrituraCSV:
+        sesion = SesionEscrituraCSV(ruta, **opciones).abrir()
+        sesiones.append(sesion)
+        return sesion
+
+    yield _crear
+    errores = []
+    for sesion in sesiones:
+        try:
+            sesion.cerrar()
+        except Exception as e:
+            errores.append(f"'{sesion.ruta}': {e}")
+    if errores:
+        raise RuntimeError(f"\n❌ No se pudieron cerrar {len(errores)} sesiones de escritura CSV:\n" + "\n".join(errores))
+
+@pytest.fixture(scope="session")
+def cliente_api() -> Generator[ClienteAPI, None, None]:
     """
-    return BasePage(playwright_page)
+    Cliente de la API (utils/cliente_api.py) compartido por todos los tests del worker: una única sesión
+    HTTP con conexiones keep-alive y reintentos, cerrada al terminar la sesión.
+    """
+    cliente = ClienteAPI()
+    yield cliente
+    cliente.cerrar()
 
 # --- Ejemplo de nuevos fixtures de pre-condición ---
 @pytest.fixture
@@ -199,4 +328,49 @@ def set_up_Registrar(base_page: BasePage):
     base_page.navigation.validar_titulo_de_web("Buggy Cars Rating", "validar_titulo_de_web_registro", config.SCREENSHOT_DIR)
     
     # Retorna la instancia de BasePage para que los tests puedan utilizarla.
-    return base_page
\ No newline at end of file
+    return base_page
+
+@pytest.fixture
+def set_up_usuario_registrado(cliente_api: ClienteAPI) -> dict:
+    """
+    Fixture de pre-condición que crea un usuario aleatorio por API, sin recorrer el formulario de registro.
+    Para los tests que necesitan un usuario existente pero no validan el registro.
+
+    Returns:
+        dict: Los datos del usuario creado (formato de `GeneradorDeDatos.generar_usuario_aleatorio`).
+    """
+    return cliente_api.registrar_usuario()
+
+@pytest.fixture
+def set_up_sesion_iniciada(base_page: BasePage, cliente_api: ClienteAPI, set_up_usuario_registrado: dict) -> BasePage:
+    """
+    Fixture de pre-condición que deja la aplicación con la sesión iniciada sin pasar por el login de la UI.
+
+    1. Inicia sesión por API con el usuario creado por `set_up_usuario_registrado`.
+    2. Inyecta la sesión (cookies y token) en el contexto de Playwright antes de navegar. El token se escribe
+       una sola vez por pestaña: un test que cierra sesión no vuelve a quedar autenticado al recargar.
+    3. Navega a la URL base y maneja cualquier obstáculo en la página.
+    4. Verifica que la aplicación aceptó la sesión: el token está en `localStorage` y se muestra
+       el enlace 'Logout' en lugar del formulario de login.
+
+    Args:
+        base_page (BasePage): Instancia de BasePage del test.
+        cliente_api (ClienteAPI): Cliente de la API del worker.
+        set_up_usuario_registrado (dict): Usuario creado por API.
+
+    Returns:
+        BasePage: La instancia de BasePage con la sesión iniciada. El usuario queda en `base_page.usuario`.
+    """
+    token = cliente_api.iniciar_sesion(set_up_usuario_registrado["username"], set_up_usuario_registrado["password"])
+    cliente_api.inyectar_sesion(base_page.page.context, token)
+    base_page.usuario = set_up_usuario_registrado
+
+    base_page.navigation.ir_a_url(config.BASE_URL, "inicio_test_sesion_api", config.SCREENSHOT_DIR)
+    base_page.element.manejar_obstaculos_en_pagina(ObstaculosLocators.LISTA_DE_OBSTACULOS)
+
+    token_en_pagina = base_page.page.evaluate("clave => window.localStorage.getItem(clave)", CLAVE_TOKEN_ALMACENAMIENTO)
+    assert token_en_pagina == token, \
+        f"\n❌ FALLO: El token inyectado no está en localStorage['{CLAVE_TOKEN_ALMACENAMIENTO}'] tras abrir {config.BASE_URL}."
+    expect(base_page.home.botonLogout).to_be_visible()
+    expect(base_page.home.botonLogin).to_be_hidden()
+    return base_page
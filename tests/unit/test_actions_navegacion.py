@@ -0,0 +1,75 @@
+import logging
+from types import SimpleNamespace
+import pytest
+from pages.actions_navegacion import NavigationActions
+
+
+class PaginaFalsa:
+    """Sustituto de `Page` que registra las esperas pedidas y responde a `evaluate` con los valores indicados."""
+
+    def __init__(self, evaluaciones=()):
+        self.evaluaciones = list(evaluaciones)
+        self.esperas = []
+
+    def goto(self, url, wait_until):
+        self.esperas.append(("goto", wait_until))
+        return object()
+
+    def go_back(self, wait_until):
+        self.esperas.append(("go_back", wait_until))
+        return object()
+
+    def evaluate(self, expresion):
+        return self.evaluaciones.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def estado_global_limpio(monkeypatch):
+    monkeypatch.setattr(NavigationActions, "esperar_hasta_global", None)
+    monkeypatch.setattr(NavigationActions, "ahorro_por_estrategia", {})
+
+
+def _navegacion(pagina, perfil=None):
+    base = SimpleNamespace(page=pagina, logger=logging.getLogger("test_actions_navegacion"),
+                           perfil=perfil or {"esperar_hasta": "domcontentloaded"})
+    return NavigationActions(base)
+
+
+def test_historial_espera_a_load_salvo_indicacion_explicita() -> None:
+    pagina = PaginaFalsa(evaluaciones=[[1000.0, 5.0]])
+    navegacion = _navegacion(pagina)
+    volver = lambda wait_until: pagina.go_back(wait_until=wait_until)
+
+    navegacion._navegar_con_estrategia(volver, "volver", por_defecto=NavigationActions.ESTRATEGIA_HISTORIAL)
+    NavigationActions.esperar_hasta_global = "networkidle"
+    navegacion._navegar_con_estrategia(volver, "volver", por_defecto=NavigationActions.ESTRATEGIA_HISTORIAL)
+    navegacion._navegar_con_estrategia(volver, "volver", "commit", por_defecto=NavigationActions.ESTRATEGIA_HISTORIAL)
+
+    assert pagina.esperas == [("go_back", "load"), ("go_back", "networkidle"), ("go_back", "commit")]
+    assert navegacion._medicion_pendiente[0] == "commit"
+
+
+def test_ahorro_se_mide_sin_esperar_al_load() -> None:
+    """
+    Con el perfil por defecto ('domcontentloaded') se anota cuándo continuó el test y el ahorro se calcula en la
+    siguiente navegación con el `loadEventEnd` del mismo documento; si el documento cambió no se contabiliza.
+    """
+    pagina = PaginaFalsa(evaluaciones=[
+        [1000.0, 200.0], [1000.0, 950.0],  # Primera navegación: continúa a los 200 ms, 'load' a los 950 ms.
+        [2000.0, 100.0], [3000.0, 400.0],  # Segunda: otro documento al cerrar la medición.
+    ])
+    navegacion = _navegacion(pagina)
+    ir = lambda wait_until: pagina.goto("https://app.test/", wait_until=wait_until)
+
+    navegacion._navegar_con_estrategia(ir, "ir")
+    navegacion._navegar_con_estrategia(ir, "ir")
+    navegacion.cerrar_medicion_ahorro()
+
+    assert pagina.esperas == [("goto", "domcontentloaded")] * 2
+    resumen = NavigationActions.resumen_ahorro()
+    assert resumen == {"domcontentloaded": {"navegaciones": 1, "segundos": pytest.approx(0.75), "media_segundos": pytest.approx(0.75)}}
+
+
+def test_estrategia_desconocida() -> None:
+    with pytest.raises(ValueError):
+        _navegacion(PaginaFalsa())._navegar_con_estrategia(lambda wait_until: None, "ir", "loaded")
@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+import pytest
+from utils.cache_recursos import CacheRecursos, calcular_caducidad
+
+AHORA = 1_700_000_000.0
+
+
+class RutaFalsa:
+    """Sustituto mínimo de `playwright.sync_api.Route` para ejercitar la caché sin navegador."""
+
+    def __init__(self, url, encabezados=None, respuesta=None, metodo="GET", tipo="script"):
+        self.request = SimpleNamespace(url=url, headers=encabezados or {}, method=metodo, resource_type=tipo)
+        self.respuesta = respuesta
+        self.fetch_headers = "sin fetch"
+        self.servido = None
+        self.fallback_llamado = False
+
+    def fetch(self, headers=None):
+        self.fetch_headers = headers
+        return self.respuesta
+
+    def fulfill(self, **kwargs):
+        self.servido = kwargs
+
+    def fallback(self):
+        self.fallback_llamado = True
+
+
+def _respuesta(status=200, encabezados=None, cuerpo=b"contenido"):
+    return SimpleNamespace(status=status, headers=encabezados or {}, body=lambda: cuerpo)
+
+
+@pytest.mark.parametrize("encabezados, esperado", [
+    ({"cache-control": "public, max-age=600"}, AHORA + 600),
+    ({"cache-control": "max-age=600", "age": "100"}, AHORA + 500),
+    ({"cache-control": "no-cache, max-age=600"}, AHORA),
+    ({"cache-control": "no-store"}, None),
+    ({"expires": "Thu, 01 Jan 2026 00:10:00 GMT", "date": "Thu, 01 Jan 2026 00:00:00 GMT"}, AHORA + 600),
+    ({"expires": "fecha no valida"}, AHORA),
+    ({}, AHORA),
+], ids=["max_age", "max_age_menos_age", "no_cache", "no_store", "expires_relativo_a_date", "expires_invalido", "sin_frescura"])
+def test_calcular_caducidad(encabezados, esperado) -> None:
+    """
+    La frescura sale de max-age (menos Age) o de Expires relativo a Date; no-cache caduca ya y no-store no se guarda.
+    """
+    assert calcular_caducidad(encabezados, ahora=AHORA) == esperado
+
+
+def test_segunda_solicitud_se_sirve_desde_la_cache() -> None:
+    cache = CacheRecursos(modo="memoria")
+    url = "https://app.test/main.js"
+
+    primera = RutaFalsa(url, respuesta=_respuesta(encabezados={"Cache-Control": "max-age=600"}))
+    cache._manejar_ruta(primera)
+    segunda = RutaFalsa(url)
+    cache._manejar_ruta(segunda)
+
+    assert segunda.fetch_headers == "sin fetch"
+    assert segunda.servido["body"] == b"contenido"
+    assert (cache.aciertos, cache.fallos) == (1, 1)
+
+
+def test_clave_incluye_los_encabezados_de_vary() -> None:
+    """
+    Con 'Vary: Accept-Encoding' una solicitud con otro Accept-Encoding no reutiliza la entrada guardada.
+    """
+    cache = CacheRecursos(modo="memoria")
+    url = "https://app.test/estilos.css"
+    respuesta = _respuesta(encabezados={"Cache-Control": "max-age=600", "Vary": "Accept-Encoding"})
+
+    cache._manejar_ruta(RutaFalsa(url, {"accept-encoding": "gzip"}, respuesta))
+    misma = RutaFalsa(url, {"accept-encoding": "gzip"})
+    cache._manejar_ruta(misma)
+    distinta = RutaFalsa(url, {"accept-encoding": "br"}, respuesta)
+    cache._manejar_ruta(distinta)
+
+    assert misma.servido is not None and misma.fetch_headers == "sin fetch"
+    assert distinta.fetch_headers is None
+    assert (cache.aciertos, cache.fallos) == (1, 2)
+
+
+def test_vary_asterisco_y_no_store_no_se_guardan() -> None:
+    cache = CacheRecursos(modo="memoria")
+    for numero, encabezados in enumerate([{"Cache-Control": "max-age=600", "Vary": "*"}, {"Cache-Control": "no-store"}]):
+        url = f"https://app.test/recurso{numero}.js"
+        cache._manejar_ruta(RutaFalsa(url, respuesta=_respuesta(encabezados=encabezados)))
+        repetida = RutaFalsa(url, respuesta=_respuesta(encabezados=encabezados))
+        cache._manejar_ruta(repetida)
+        assert repetida.fetch_headers is None
+    assert cache.aciertos == 0
+
+
+def test_entrada_caducada_con_etag_se_revalida() -> None:
+    """
+    Una entrada sin frescura pero con ETag se revalida con If-None-Match; un 304 sirve el cuerpo guardado.
+    """
+    cache = CacheRecursos(modo="memoria")
+    url = "https://app.test/logo.png"
+    cache._manejar_ruta(RutaFalsa(url, tipo="image", respuesta=_respuesta(encabezados={"ETag": '"v1"', "Cache-Control": "no-cache"})))
+
+    revalidada = RutaFalsa(url, tipo="image", respuesta=_respuesta(status=304, cuerpo=b""))
+    cache._manejar_ruta(revalidada)
+
+    assert revalidada.fetch_headers["if-none-match"] == '"v1"'
+    assert revalidada.servido["body"] == b"contenido"
+    assert cache.revalidaciones == 1
+
+
+def test_solicitudes_no_cacheables_siguen_su_curso() -> None:
+    cache = CacheRecursos(modo="memoria")
+    for ruta in (RutaFalsa("https://app.test/api", metodo="POST"), RutaFalsa("https://app.test/", tipo="document")):
+        cache._manejar_ruta(ruta)
+        assert ruta.fallback_llamado and ruta.fetch_headers == "sin fetch"
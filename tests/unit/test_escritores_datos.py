@@ -0,0 +1,220 @@
+import json
+import openpyxl
+import pytest
+from utils import escritores_datos
+from utils.escritores_datos import (
+    SesionEscrituraCSV, SesionEscrituraExcel, ruta_por_worker, fusionar_archivos_por_worker,
+    es_json_lines, anexar_lineas_json, iterar_lineas_json, EscritorJSONL
+)
+
+
+def _leer(ruta) -> str:
+    with open(ruta, 'r', newline='', encoding='utf-8') as archivo:
+        return archivo.read()
+
+
+# --- JSON Lines ---
+
+def test_es_json_lines() -> None:
+    assert es_json_lines("resultados.jsonl") and es_json_lines("RESULTADOS.NDJSON")
+    assert not es_json_lines("resultados.json")
+
+
+def test_anexar_e_iterar_lineas_json(tmp_path) -> None:
+    """
+    Cada registro es una línea compacta; `append` añade al final y las líneas vacías se ignoran al leer.
+    """
+    ruta = str(tmp_path / "sub" / "resultados.jsonl")
+    assert anexar_lineas_json(ruta, [{"test": "a", "ok": True}, {"test": "ñ"}], append=False) == 2
+    assert anexar_lineas_json(ruta, [[1, 2]]) == 1
+    with open(ruta, 'a', encoding='utf-8') as archivo:
+        archivo.write("\n")
+
+    assert _leer(ruta).splitlines()[0] == '{"test":"a","ok":true}'
+    assert list(iterar_lineas_json(ruta)) == [{"test": "a", "ok": True}, {"test": "ñ"}, [1, 2]]
+
+    assert anexar_lineas_json(ruta, [{"nuevo": 1}], append=False) == 1
+    assert list(iterar_lineas_json(ruta)) == [{"nuevo": 1}]
+
+
+def test_iterar_lineas_json_indica_la_linea_invalida(tmp_path) -> None:
+    ruta = tmp_path / "roto.jsonl"
+    ruta.write_text('{"a": 1}\n{roto\n', encoding='utf-8')
+    with pytest.raises(json.JSONDecodeError, match="Línea 2"):
+        list(iterar_lineas_json(str(ruta)))
+
+
+def test_escritor_jsonl_vacia_por_tamano_y_al_cerrar(tmp_path) -> None:
+    ruta = str(tmp_path / "resultados.jsonl")
+    escritor = EscritorJSONL(ruta, max_registros=2, max_segundos=3600, append=False)
+    escritor.escribir({"n": 1})
+    assert list(iterar_lineas_json(ruta)) == []
+    escritor.escribir({"n": 2})
+    assert escritor.registros_escritos == 2
+    escritor.escribir({"n": 3})
+    escritor.cerrar()
+    escritor.cerrar()
+
+    assert [registro["n"] for registro in iterar_lineas_json(ruta)] == [1, 2, 3]
+    with pytest.raises(ValueError):
+        escritor.escribir({"n": 4})
+
+
+def test_escritor_jsonl_vacia_por_tiempo(tmp_path, monkeypatch) -> None:
+    ruta = str(tmp_path / "resultados.jsonl")
+    instante = [1000.0]
+    monkeypatch.setattr(escritores_datos.time, "time", lambda: instante[0])
+    with EscritorJSONL(ruta, max_registros=100, max_segundos=5.0) as escritor:
+        escritor.escribir({"n": 1})
+        assert escritor.registros_escritos == 0
+        instante[0] += 6.0
+        escritor.escribir({"n": 2})
+        assert escritor.registros_escritos == 2
+
+
+# --- SesionEscrituraExcel ---
+
+def _filas_excel(ruta, hoja="Sheet1"):
+    libro = openpyxl.load_workbook(ruta)
+    return [list(fila) for fila in libro[hoja].iter_rows(values_only=True)]
+
+
+def test_sesion_excel_solo_escribe_el_archivo_al_cerrar(tmp_path) -> None:
+    """
+    Los lotes se envían a la hoja, pero el archivo de destino no existe hasta `cerrar()`.
+    """
+    ruta = tmp_path / "resultados.xlsx"
+    sesion = SesionEscrituraExcel(str(ruta), tamano_lote=2).abrir()
+    sesion.escribir_varios([{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"b": 6, "a": 5}])
+    assert sesion.filas_escritas == 2
+    assert not ruta.exists()
+    sesion.cerrar()
+
+    assert _filas_excel(ruta) == [["a", "b"], [1, 2], [3, 4], [5, 6]]
+    assert not [p for p in tmp_path.iterdir() if p.name.endswith(".tmp.xlsx")]
+
+
+def test_sesion_excel_append_conserva_hojas_y_valores(tmp_path) -> None:
+    ruta = tmp_path / "resultados.xlsx"
+    libro = openpyxl.Workbook()
+    libro.active.title = "Resultados"
+    libro.active.append(["a", "b"])
+    libro.active.append([1, 2])
+    libro.create_sheet("Otra").append(["x"])
+    libro.save(ruta)
+
+    with SesionEscrituraExcel(str(ruta), hoja="Resultados") as sesion:
+        sesion.escribir({"b": 4, "a": 3})
+
+    assert _filas_excel(ruta, "Resultados") == [["a", "b"], [1, 2], [3, 4]]
+    assert _filas_excel(ruta, "Otra") == [["x"]]
+
+
+def test_sesion_excel_rechaza_claves_y_encabezados_distintos(tmp_path) -> None:
+    ruta = tmp_path / "resultados.xlsx"
+    with SesionEscrituraExcel(str(ruta)) as sesion:
+        sesion.escribir({"a": 1, "b": 2})
+        with pytest.raises(ValueError):
+            sesion.escribir({"a": 1, "c": 2})
+    assert _filas_excel(ruta) == [["a", "b"], [1, 2]]
+
+    with pytest.raises(ValueError):
+        SesionEscrituraExcel(str(ruta), encabezados=["x", "y"]).abrir()
+
+
+# --- SesionEscrituraCSV ---
+
+def test_sesion_csv_escribe_encabezado_y_lotes(tmp_path) -> None:
+    """
+    Los encabezados salen del primer registro, los lotes se escriben al llenarse y `cerrar()` vacía el último.
+    """
+    ruta = tmp_path / "resultados.csv"
+    with SesionEscrituraCSV(str(ruta), tamano_lote=2) as sesion:
+        sesion.escribir_varios([{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"b": 6, "a": 5}])
+        assert sesion.filas_escritas == 2
+    assert sesion.filas_escritas == 3
+    assert _leer(ruta) == "a,b\r\n1,2\r\n3,4\r\n5,6\r\n"
+
+
+def test_sesion_csv_append_reutiliza_encabezados_existentes(tmp_path) -> None:
+    ruta = tmp_path / "resultados.csv"
+    ruta.write_text("a,b\r\n1,2\r\n", encoding='utf-8')
+    with SesionEscrituraCSV(str(ruta)) as sesion:
+        sesion.escribir({"b": 4, "a": 3})
+    assert _leer(ruta) == "a,b\r\n1,2\r\n3,4\r\n"
+
+    with pytest.raises(ValueError):
+        SesionEscrituraCSV(str(ruta), encabezados=["x", "y"]).abrir()
+
+
+def test_sesion_csv_clave_invalida_falla_en_su_llamada_sin_duplicar_filas(tmp_path) -> None:
+    """
+    Regresión: un registro con una clave fuera de los encabezados se rechaza en su propio `escribir()`, sin
+    entrar en el lote; los registros válidos se escriben una sola vez al cerrar.
+    """
+    ruta = tmp_path / "resultados.csv"
+    sesion = SesionEscrituraCSV(str(ruta), tamano_lote=3).abrir()
+    sesion.escribir({"a": 1, "b": 2})
+    sesion.escribir({"a": 3, "b": 4})
+    with pytest.raises(ValueError, match="'c'"):
+        sesion.escribir({"a": 5, "c": 6})
+    sesion.cerrar()
+    sesion.cerrar()
+
+    assert _leer(ruta) == "a,b\r\n1,2\r\n3,4\r\n"
+    assert sesion.filas_escritas == 2
+
+
+def test_sesion_csv_no_repite_un_lote_que_fallo_al_escribirse(tmp_path) -> None:
+    """
+    Si la escritura de un lote falla a medias, el lote se descarta y `cerrar()` no lo vuelve a enviar.
+    """
+    ruta = tmp_path / "resultados.csv"
+    sesion = SesionEscrituraCSV(str(ruta), tamano_lote=10).abrir()
+    sesion.escribir({"a": 1, "b": 2})
+
+    class EscritorQueFalla:
+        def __init__(self, original):
+            self.original = original
+
+        def writerows(self, filas):
+            self.original.writerow(filas[0])
+            raise OSError("disco lleno")
+
+    sesion._writer = EscritorQueFalla(sesion._writer)
+    sesion.escribir({"a": 3, "b": 4})
+    with pytest.raises(OSError):
+        sesion.vaciar()
+    sesion.cerrar()
+
+    assert _leer(ruta) == "a,b\r\n1,2\r\n"
+
+
+def test_sesion_csv_rechaza_escribir_sin_abrir(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        SesionEscrituraCSV(str(tmp_path / "x.csv")).escribir({"a": 1})
+
+
+# --- Archivos por worker de xdist ---
+
+def test_ruta_por_worker(monkeypatch) -> None:
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    assert ruta_por_worker("salida/datos.csv") == "salida/datos.csv"
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+    assert ruta_por_worker("salida/datos.csv") == "salida/datos.gw2.csv"
+
+
+def test_fusionar_archivos_por_worker(tmp_path) -> None:
+    """
+    Los archivos '<base>.gwN.csv' se añaden al destino con un solo encabezado y se eliminan; un archivo con
+    encabezados distintos no se fusiona.
+    """
+    ruta = tmp_path / "datos.csv"
+    ruta.write_text("a,b\r\n0,0\r\n", encoding='utf-8')
+    (tmp_path / "datos.gw0.csv").write_text("a,b\r\n1,2\r\n", encoding='utf-8')
+    (tmp_path / "datos.gw1.csv").write_text("a,b\r\n3,4\r\n5,6\r\n", encoding='utf-8')
+    (tmp_path / "datos.gw2.csv").write_text("x,y\r\n7,8\r\n", encoding='utf-8')
+
+    assert fusionar_archivos_por_worker(str(ruta)) == 3
+    assert _leer(ruta) == "a,b\r\n0,0\r\n1,2\r\n3,4\r\n5,6\r\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["datos.csv", "datos.gw2.csv"]
@@ -0,0 +1,117 @@
+import os
+import openpyxl
+import pytest
+from utils import fuente_datos
+from utils.fuente_datos import cargar_fuente_datos, cargar_registros, formato_cache, limpiar_memo
+from utils.hash_archivos import hash_archivo, hash_bytes
+
+
+@pytest.fixture(autouse=True)
+def memo_vacio():
+    """Cada test parte sin DataFrames memorizados en el proceso."""
+    limpiar_memo()
+    yield
+    limpiar_memo()
+
+
+@pytest.fixture
+def excel_con_encabezado_numerico(tmp_path) -> str:
+    ruta = tmp_path / "datos.xlsx"
+    libro = openpyxl.Workbook()
+    libro.active.title = "Hoja1"
+    libro.active.append(["nombre", 2024])
+    libro.active.append(["ana", 1])
+    libro.active.append(["luis", None])
+    libro.save(ruta)
+    return str(ruta)
+
+
+def _entradas(directorio) -> list:
+    return sorted(nombre for nombre in os.listdir(directorio))
+
+
+def test_csv_se_lee_como_texto_y_se_cachea(tmp_path) -> None:
+    ruta = tmp_path / "datos.csv"
+    ruta.write_text("id;codigo\n1;007\n2;\n", encoding='utf-8')
+    cache = tmp_path / "cache"
+
+    assert cargar_registros(str(ruta), delimiter=';', directorio_cache=str(cache)) == [
+        {"id": "1", "codigo": "007"}, {"id": "2", "codigo": ""}
+    ]
+    assert len(_entradas(cache)) == 1
+    assert _entradas(cache)[0].endswith(".feather" if formato_cache() == "feather" else ".pkl")
+
+
+def test_segunda_lectura_sale_de_la_cache_sin_parsear(tmp_path, monkeypatch, excel_con_encabezado_numerico) -> None:
+    """
+    Sin el memo del proceso, la segunda lectura carga la entrada en disco en lugar de volver a parsear el Excel.
+    """
+    cache = str(tmp_path / "cache")
+    primera = cargar_registros(excel_con_encabezado_numerico, directorio_cache=cache)
+
+    limpiar_memo()
+    monkeypatch.setattr(fuente_datos, "_parsear_fuente", lambda *args: pytest.fail("No debía volver a parsearse."))
+    assert cargar_registros(excel_con_encabezado_numerico, directorio_cache=cache) == primera
+
+
+def test_columnas_de_texto_en_parseo_y_en_cache(tmp_path, excel_con_encabezado_numerico) -> None:
+    """
+    Un encabezado numérico de Excel es '2024' tanto al parsear como al leer la caché; las celdas vacías son `None`.
+    """
+    cache = str(tmp_path / "cache")
+    parseado = cargar_fuente_datos(excel_con_encabezado_numerico, directorio_cache=cache)
+    assert parseado.columns.tolist() == ["nombre", "2024"]
+
+    limpiar_memo()
+    desde_cache = cargar_fuente_datos(excel_con_encabezado_numerico, directorio_cache=cache)
+    assert desde_cache.columns.tolist() == ["nombre", "2024"]
+    assert cargar_registros(excel_con_encabezado_numerico, directorio_cache=cache) == [
+        {"nombre": "ana", "2024": 1}, {"nombre": "luis", "2024": None}
+    ]
+
+
+def test_archivo_modificado_genera_otra_entrada(tmp_path) -> None:
+    ruta = tmp_path / "datos.csv"
+    cache = tmp_path / "cache"
+    ruta.write_text("a\n1\n", encoding='utf-8')
+    cargar_registros(str(ruta), directorio_cache=str(cache))
+
+    ruta.write_text("a\n1\n2\n", encoding='utf-8')
+    os.utime(ruta, ns=(os.stat(ruta).st_mtime_ns + 10**9,) * 2)
+    assert cargar_registros(str(ruta), directorio_cache=str(cache)) == [{"a": "1"}, {"a": "2"}]
+    assert len(_entradas(cache)) == 2
+
+
+def test_hoja_distinta_no_comparte_entrada(tmp_path, excel_con_encabezado_numerico) -> None:
+    libro = openpyxl.load_workbook(excel_con_encabezado_numerico)
+    libro.create_sheet("Hoja2").append(["otra"])
+    libro.save(excel_con_encabezado_numerico)
+    cache = str(tmp_path / "cache")
+
+    assert cargar_fuente_datos(excel_con_encabezado_numerico, hoja="Hoja2", directorio_cache=cache).columns.tolist() == ["otra"]
+    assert cargar_fuente_datos(excel_con_encabezado_numerico, hoja="Hoja1", directorio_cache=cache).columns.tolist() == ["nombre", "2024"]
+
+
+def test_entrada_ilegible_se_regenera(tmp_path) -> None:
+    ruta = tmp_path / "datos.csv"
+    ruta.write_text("a\n1\n", encoding='utf-8')
+    cache = tmp_path / "cache"
+    cargar_registros(str(ruta), directorio_cache=str(cache))
+    entrada = cache / _entradas(cache)[0]
+    entrada.write_bytes(b"no es una entrada valida")
+
+    limpiar_memo()
+    assert cargar_registros(str(ruta), directorio_cache=str(cache)) == [{"a": "1"}]
+
+
+def test_extension_no_soportada(tmp_path) -> None:
+    ruta = tmp_path / "datos.txt"
+    ruta.write_text("a", encoding='utf-8')
+    with pytest.raises(ValueError):
+        cargar_fuente_datos(str(ruta), directorio_cache=str(tmp_path / "cache"))
+
+
+def test_hash_archivo_coincide_con_el_contenido(tmp_path) -> None:
+    ruta = tmp_path / "datos.bin"
+    ruta.write_bytes(b"x" * 10)
+    assert hash_archivo(str(ruta), tamano_bloque=3) == hash_bytes(b"x" * 10)
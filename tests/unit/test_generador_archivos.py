@@ -0,0 +1,65 @@
+import os
+import pytest
+from utils import generador_archivos
+from utils.generador_archivos import generar_archivo_sintetico, preparar_para_set_input_files, limpiar_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_vacia():
+    """Cada test parte sin buffers ni archivos temporales de otros tests."""
+    limpiar_cache()
+    yield
+    limpiar_cache()
+
+
+def test_contenido_determinista_y_cacheado() -> None:
+    """
+    La misma especificación devuelve el mismo buffer (el mismo objeto); otra semilla cambia el contenido.
+    """
+    primero = generar_archivo_sintetico("grande.pdf", 1024)
+    segundo = generar_archivo_sintetico("grande.pdf", 1024)
+
+    assert primero == {"name": "grande.pdf", "mimeType": "application/pdf", "buffer": primero["buffer"]}
+    assert len(primero["buffer"]) == 1024 and primero["buffer"].startswith(b"%PDF-1.4")
+    assert segundo["buffer"] is primero["buffer"]
+    assert generar_archivo_sintetico("grande.pdf", 1024, semilla=1)["buffer"] != primero["buffer"]
+
+
+def test_tipos_de_texto_y_tamano_negativo() -> None:
+    texto = generar_archivo_sintetico("datos.csv", 100)["buffer"]
+    assert len(texto) == 100 and texto.startswith(b"datos.csv;linea de datos sintetica")
+    assert generar_archivo_sintetico("sin_extension", 0) == {"name": "sin_extension", "mimeType": "application/octet-stream", "buffer": b""}
+    with pytest.raises(ValueError):
+        generar_archivo_sintetico("x.bin", -1)
+
+
+def test_bajo_el_limite_se_devuelven_los_buffers(monkeypatch) -> None:
+    monkeypatch.setattr(generador_archivos, "LIMITE_BUFFER_PLAYWRIGHT", 10)
+    archivos = [generar_archivo_sintetico("a.bin", 10), generar_archivo_sintetico("b.bin", 5)]
+    assert preparar_para_set_input_files(archivos) == archivos
+
+
+def test_sobre_el_limite_todos_pasan_a_rutas(monkeypatch) -> None:
+    """
+    Si un payload supera el límite, todos se convierten en rutas temporales con su nombre y contenido; una
+    segunda llamada reutiliza los mismos archivos y `limpiar_cache()` los borra.
+    """
+    monkeypatch.setattr(generador_archivos, "LIMITE_BUFFER_PLAYWRIGHT", 10)
+    pequeno, grande = generar_archivo_sintetico("a.txt", 5), generar_archivo_sintetico("informe.pdf", 11)
+
+    rutas = preparar_para_set_input_files([pequeno, grande])
+    assert [os.path.basename(ruta) for ruta in rutas] == ["a.txt", "informe.pdf"]
+    for ruta, payload in zip(rutas, (pequeno, grande)):
+        with open(ruta, 'rb') as archivo:
+            assert archivo.read() == payload["buffer"]
+    assert preparar_para_set_input_files([pequeno, grande]) == rutas
+
+    limpiar_cache()
+    assert not any(os.path.exists(ruta) for ruta in rutas)
+
+
+def test_mismo_nombre_con_distinto_contenido_no_comparte_ruta(monkeypatch) -> None:
+    monkeypatch.setattr(generador_archivos, "LIMITE_BUFFER_PLAYWRIGHT", 0)
+    primera, = preparar_para_set_input_files([generar_archivo_sintetico("x.bin", 8)])
+    segunda, = preparar_para_set_input_files([generar_archivo_sintetico("x.bin", 8, semilla=1)])
+    assert primera != segunda and os.path.exists(primera) and os.path.exists(segunda)
@@ -0,0 +1,105 @@
+import os
+import shutil
+import pytest
+from playwright.sync_api import Error
+from utils.escritores_datos import iterar_lineas_json
+from utils.gestor_descargas import GestorDescargas
+from utils.hash_archivos import hash_bytes
+
+
+class DescargaFalsa:
+    """Sustituto mínimo de `playwright.sync_api.Download` respaldado por un archivo temporal."""
+
+    def __init__(self, directorio, nombre, contenido=b"", fallo=None, error_guardado=None, ruta=None):
+        self.suggested_filename = nombre
+        self._fallo = fallo
+        self._error_guardado = error_guardado
+        self._ruta = ruta
+        if ruta is None and fallo is None:
+            self._ruta = os.path.join(directorio, f"tmp_{id(self)}")
+            with open(self._ruta, 'wb') as archivo:
+                archivo.write(contenido)
+
+    def path(self):
+        return self._ruta
+
+    def failure(self):
+        return self._fallo
+
+    def save_as(self, ruta):
+        if self._error_guardado:
+            raise self._error_guardado
+        shutil.copyfile(self._ruta, ruta)
+
+
+@pytest.fixture
+def entorno(tmp_path):
+    temporales = tmp_path / "navegador"
+    temporales.mkdir()
+    destino = tmp_path / "descargas"
+    gestor = GestorDescargas(page=None, directorio_descargas=str(destino), ruta_metricas=str(tmp_path / "metricas.jsonl"))
+    return gestor, str(temporales), destino, tmp_path / "metricas.jsonl"
+
+
+def _esperar(gestor, descargas, **kwargs):
+    gestor._pendientes = [(descarga, 0.0) for descarga in descargas]
+    return gestor.esperar_todas(**kwargs)
+
+
+def test_contenido_identico_se_guarda_una_vez(entorno) -> None:
+    gestor, temporales, destino, _ = entorno
+    a, b = _esperar(gestor, [DescargaFalsa(temporales, "a.pdf", b"igual"), DescargaFalsa(temporales, "b.pdf", b"igual")])
+
+    assert a.exitosa and b.exitosa
+    assert b.duplicado_de == a.ruta == str(destino / "a.pdf")
+    assert os.listdir(destino) == ["a.pdf"]
+
+
+def test_mismo_nombre_con_distinto_contenido_no_se_sobrescribe(entorno) -> None:
+    """
+    Dos descargas con el mismo nombre sugerido y distinto contenido se guardan ambas; la segunda con sufijo de hash.
+    """
+    gestor, temporales, destino, _ = entorno
+    primera, segunda = _esperar(gestor, [DescargaFalsa(temporales, "informe.csv", b"v1"), DescargaFalsa(temporales, "informe.csv", b"v2")])
+
+    assert primera.ruta == str(destino / "informe.csv")
+    assert segunda.ruta == str(destino / f"informe_{hash_bytes(b'v2')[:12]}.csv")
+    assert (destino / "informe.csv").read_bytes() == b"v1"
+    assert open(segunda.ruta, 'rb').read() == b"v2"
+
+
+def test_verificacion_de_hash_tamano_y_vacios(entorno) -> None:
+    gestor, temporales, _, _ = entorno
+    bien, mal_hash, mal_tamano, vacio = _esperar(
+        gestor,
+        [DescargaFalsa(temporales, "bien.txt", b"abc"), DescargaFalsa(temporales, "hash.txt", b"abc"),
+         DescargaFalsa(temporales, "tamano.txt", b"abcd"), DescargaFalsa(temporales, "vacio.txt", b"")],
+        sha256_esperados={"bien.txt": hash_bytes(b"abc").upper(), "hash.txt": "0" * 64},
+        tamanos_esperados={"tamano.txt": 3},
+    )
+
+    assert bien.exitosa and bien.bytes == 3
+    assert not mal_hash.exitosa and "sha256" in mal_hash.errores[0]
+    assert not mal_tamano.exitosa and "Tamaño 4" in mal_tamano.errores[0]
+    assert not vacio.exitosa and "vacío" in vacio.errores[0]
+
+
+def test_errores_de_descarga_lectura_y_guardado_se_informan(entorno) -> None:
+    """
+    Una descarga fallida, un archivo temporal ilegible o un error al guardar quedan en `errores` sin interrumpir el lote.
+    """
+    gestor, temporales, _, metricas = entorno
+    fallida, ilegible, sin_guardar, correcta = _esperar(gestor, [
+        DescargaFalsa(temporales, "fallida.txt", fallo="canceled"),
+        DescargaFalsa(temporales, "ilegible.txt", ruta=os.path.join(temporales, "no_existe")),
+        DescargaFalsa(temporales, "sin_guardar.txt", b"x", error_guardado=Error("Target closed")),
+        DescargaFalsa(temporales, "correcta.txt", b"y"),
+    ])
+
+    assert "canceled" in fallida.errores[0]
+    assert "verificarlo" in ilegible.errores[0]
+    assert "guardar" in sin_guardar.errores[0] and sin_guardar.ruta is None
+    assert correcta.exitosa
+    assert [registro["nombre"] for registro in iterar_lineas_json(str(metricas))] == [
+        "fallida.txt", "ilegible.txt", "sin_guardar.txt", "correcta.txt"
+    ]
@@ -0,0 +1,106 @@
+import json
+import os
+import pytest
+from types import SimpleNamespace
+from utils import grabacion_har
+from utils.grabacion_har import (
+    SUBDIRECTORIO_PARTES, GrabacionHar, crear_grabacion_har, fusionar_flujos_pendientes, fusionar_partes_har,
+    leer_manifiesto
+)
+
+
+def _entrada(url, metodo="GET", cuerpo=None):
+    solicitud = {"method": metodo, "url": url}
+    if cuerpo is not None:
+        solicitud["postData"] = {"text": cuerpo}
+    return {"request": solicitud, "response": {"status": 200}}
+
+
+def _escribir_har(ruta, entradas, paginas=()):
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump({"log": {"version": "1.2", "pages": list(paginas), "entries": entradas}}, archivo)
+
+
+def _leer_har(ruta):
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        return json.load(archivo)["log"]
+
+
+def test_fusionar_partes_deduplica_por_metodo_url_y_cuerpo(tmp_path) -> None:
+    """
+    Las entradas con el mismo método, URL y cuerpo se guardan una vez; un POST con otro cuerpo se conserva.
+    """
+    parte_a, parte_b = str(tmp_path / "a.har"), str(tmp_path / "b.har")
+    _escribir_har(parte_a, [_entrada("https://app.test/"), _entrada("https://app.test/api", "POST", '{"n":1}')], [{"id": "page@1"}])
+    _escribir_har(parte_b, [
+        _entrada("https://app.test/"), _entrada("https://app.test/api", "POST", '{"n":1}'),
+        _entrada("https://app.test/api", "POST", '{"n":2}'), _entrada("https://app.test/", "HEAD"),
+    ], [{"id": "page@1"}, {"id": "page@2"}])
+    destino = str(tmp_path / "flujo.har")
+
+    assert fusionar_partes_har([parte_b, parte_a], destino) == 4
+    log = _leer_har(destino)
+    assert [(e["request"]["method"], (e["request"].get("postData") or {}).get("text")) for e in log["entries"]] == [
+        ("GET", None), ("POST", '{"n":1}'), ("POST", '{"n":2}'), ("HEAD", None)
+    ]
+    assert [pagina["id"] for pagina in log["pages"]] == ["page@1", "page@2"]
+    assert not [nombre for nombre in os.listdir(tmp_path) if nombre.endswith(".tmp")]
+
+
+def test_fusionar_sin_partes_no_escribe_nada(tmp_path) -> None:
+    destino = tmp_path / "vacio.har"
+    assert fusionar_partes_har([], str(destino)) == 0
+    assert not destino.exists()
+
+
+def test_fusionar_flujos_pendientes(tmp_path) -> None:
+    """
+    Cada subdirectorio de `_partes` se fusiona en '<flujo>.har' con su manifiesto y se elimina; las partes de un
+    flujo que no se puede fusionar se conservan, y las partes de tests sueltos no se tocan.
+    """
+    partes = tmp_path / SUBDIRECTORIO_PARTES
+    _escribir_har(str(partes / "home__chromium" / "test_a.1.har"), [_entrada("https://app.test/")])
+    _escribir_har(str(partes / "home__chromium" / "test_b.2.har"), [_entrada("https://app.test/"), _entrada("https://app.test/x")])
+    (partes / "roto__chromium").mkdir()
+    (partes / "roto__chromium" / "test_c.3.har").write_text("{no es json", encoding='utf-8')
+    _escribir_har(str(partes / "test_suelto.4.har"), [])
+
+    fusionar_flujos_pendientes(str(tmp_path))
+
+    destino = str(tmp_path / "home__chromium.har")
+    assert len(_leer_har(destino)["entries"]) == 2
+    assert leer_manifiesto(destino)["base_url"] == grabacion_har.BASE_URL
+    assert sorted(os.listdir(partes)) == ["roto__chromium", "test_suelto.4.har"]
+    assert not (tmp_path / "roto__chromium.har").exists()
+
+
+def test_finalizar_publica_o_descarta_solo_la_parte_propia(tmp_path) -> None:
+    suelto = GrabacionHar("tests/test_home.py::test_a[chromium]", "grabar", directorio=str(tmp_path))
+    _escribir_har(suelto.ruta_parte, [_entrada("https://app.test/")])
+    suelto.finalizar(fallido=False)
+    assert os.path.exists(suelto.ruta) and not os.path.exists(suelto.ruta_parte)
+    assert leer_manifiesto(suelto.ruta) is not None
+
+    fallido = GrabacionHar("home__chromium", "grabar", directorio=str(tmp_path), parte="test_b", flujo=True)
+    otra = GrabacionHar("home__chromium", "grabar", directorio=str(tmp_path), parte="test_c", flujo=True)
+    _escribir_har(fallido.ruta_parte, [])
+    _escribir_har(otra.ruta_parte, [])
+    fallido.finalizar(fallido=True)
+    otra.finalizar(fallido=False)
+    assert not os.path.exists(fallido.ruta_parte)
+    assert os.path.exists(otra.ruta_parte) and not os.path.exists(otra.ruta)
+
+
+def test_crear_grabacion_segun_modo_y_marcador(monkeypatch) -> None:
+    monkeypatch.delenv(grabacion_har.VARIABLE_ENTORNO_MODO, raising=False)
+    assert crear_grabacion_har("test_a", "chromium") is None
+
+    monkeypatch.setenv(grabacion_har.VARIABLE_ENTORNO_MODO, "Reproducir")
+    monkeypatch.setenv(grabacion_har.VARIABLE_ENTORNO_ESTRICTO, "1")
+    grabacion = crear_grabacion_har("tests/x.py::test_a[chromium]", "chromium", SimpleNamespace(args=("home",)))
+    assert (grabacion.nombre, grabacion.modo, grabacion.estricto, grabacion.flujo) == ("home__chromium", "reproducir", True, True)
+
+    monkeypatch.setenv(grabacion_har.VARIABLE_ENTORNO_MODO, "otro")
+    with pytest.raises(ValueError):
+        crear_grabacion_har("test_a", "chromium")
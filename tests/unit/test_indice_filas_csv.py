@@ -0,0 +1,97 @@
+import os
+import pytest
+from utils import indice_filas_csv
+from utils.indice_filas_csv import obtener_indice_csv, construir_desplazamientos
+
+
+def _escribir(ruta, contenido: bytes) -> str:
+    with open(ruta, 'wb') as archivo:
+        archivo.write(contenido)
+    return str(ruta)
+
+
+def test_indice_localiza_cada_fila(tmp_path) -> None:
+    """
+    Cada fila física se lee saltando a su desplazamiento, incluida la última sin salto de línea final.
+    """
+    ruta = _escribir(tmp_path / "datos.csv", b"id,nombre\n1,ana\n2,luis\n3,eva")
+    indice = obtener_indice_csv(ruta, persistir=False)
+
+    assert indice.num_filas == 4
+    assert list(indice.desplazamientos) == [0, 10, 16, 23]
+    assert indice.leer_fila(0) == ["id", "nombre"]
+    assert indice.leer_fila(2) == ["2", "luis"]
+    assert indice.leer_fila(3) == ["3", "eva"]
+
+
+def test_salto_de_linea_entre_comillas_no_termina_la_fila(tmp_path) -> None:
+    """
+    Un salto de línea dentro de un campo entre comillas (también con comillas escapadas "") pertenece a la fila.
+    """
+    contenido = b'id,nota\n1,"linea uno\nlinea ""dos"""\n2,simple\n'
+    ruta = _escribir(tmp_path / "comillas.csv", contenido)
+    indice = obtener_indice_csv(ruta, persistir=False)
+
+    assert indice.num_filas == 3
+    assert indice.leer_fila(1) == ["1", 'linea uno\nlinea "dos"']
+    assert indice.leer_fila(2) == ["2", "simple"]
+
+
+def test_fila_fuera_de_rango_y_archivo_vacio(tmp_path) -> None:
+    """
+    Un índice fuera de rango devuelve `None` y un archivo vacío no tiene filas.
+    """
+    indice = obtener_indice_csv(_escribir(tmp_path / "una.csv", b"a,b\n"), persistir=False)
+    assert indice.num_filas == 1
+    assert indice.leer_fila(1) is None
+    assert indice.leer_fila(-1) is None
+
+    assert len(construir_desplazamientos(_escribir(tmp_path / "vacio.csv", b""))) == 0
+
+
+def test_separador_personalizado_y_crlf(tmp_path) -> None:
+    """
+    Las filas terminadas en CRLF y los separadores distintos de la coma se parsean correctamente.
+    """
+    ruta = _escribir(tmp_path / "crlf.csv", b"a;b\r\n1;2\r\n")
+    indice = obtener_indice_csv(ruta, persistir=False)
+
+    assert indice.num_filas == 2
+    assert indice.leer_fila(1, delimiter=';') == ["1", "2"]
+
+
+def test_indice_se_invalida_cuando_cambia_el_archivo(tmp_path) -> None:
+    """
+    La caché del proceso devuelve el mismo índice mientras el archivo no cambia y lo reconstruye si cambia.
+    """
+    ruta = _escribir(tmp_path / "cambia.csv", b"a\n1\n")
+    indice = obtener_indice_csv(ruta, persistir=False)
+    assert obtener_indice_csv(ruta, persistir=False) is indice
+
+    _escribir(ruta, b"a\n1\n2\n")
+    os.utime(ruta, ns=(indice.firma[0] + 10**9, indice.firma[0] + 10**9))
+    nuevo = obtener_indice_csv(ruta, persistir=False)
+    assert nuevo is not indice
+    assert nuevo.num_filas == 3
+
+
+def test_indice_persistido_se_reutiliza_y_se_descarta_si_esta_desactualizado(tmp_path, monkeypatch) -> None:
+    """
+    Con persistencia, el archivo .idx se escribe junto al CSV y se carga en lugar de volver a recorrer el archivo;
+    si el CSV cambia, el .idx se ignora y se reconstruye.
+    """
+    ruta = _escribir(tmp_path / "persistido.csv", b"a\n1\n2\n")
+    obtener_indice_csv(ruta, persistir=True)
+    assert os.path.exists(ruta + indice_filas_csv.EXTENSION_INDICE)
+
+    # Sin la caché del proceso, el índice debe salir del .idx y no de una nueva pasada sobre el CSV.
+    monkeypatch.setattr(indice_filas_csv, "_indices", {})
+    monkeypatch.setattr(indice_filas_csv, "construir_desplazamientos", lambda _ruta: pytest.fail("No debía reconstruirse el índice."))
+    assert obtener_indice_csv(ruta, persistir=True).num_filas == 3
+
+    monkeypatch.undo()
+    _escribir(ruta, b"a\n1\n2\n3\n")
+    firma = os.stat(ruta).st_mtime_ns + 10**9
+    os.utime(ruta, ns=(firma, firma))
+    monkeypatch.setattr(indice_filas_csv, "_indices", {})
+    assert obtener_indice_csv(ruta, persistir=True).num_filas == 4
@@ -0,0 +1,131 @@
+import logging
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+import openpyxl
+import pytest
+from pages.actions_archivos import FileActions
+
+
+@pytest.fixture
+def file_actions() -> FileActions:
+    """`FileActions` sin navegador: los lectores en streaming solo usan el logger del page object."""
+    base = SimpleNamespace(page=None, logger=logging.getLogger("test_lectores_streaming"), tomar_captura=lambda *args, **kwargs: None)
+    return FileActions(base)
+
+
+# --- CSV, Excel y texto plano ---
+
+def test_iterar_csv_por_filas_y_por_lotes(file_actions, tmp_path) -> None:
+    ruta = tmp_path / "datos.csv"
+    ruta.write_text("a;b\n1;2\n3;4\n5;6\n", encoding='utf-8')
+
+    assert list(file_actions.iterar_csv_diccionario(str(ruta), delimiter=';')) == [
+        {"a": "1", "b": "2"}, {"a": "3", "b": "4"}, {"a": "5", "b": "6"}
+    ]
+    lotes = list(file_actions.iterar_csv_diccionario(str(ruta), delimiter=';', tamano_lote=2))
+    assert [len(lote) for lote in lotes] == [2, 1]
+    assert lotes[1] == [{"a": "5", "b": "6"}]
+
+
+def test_iterar_csv_es_perezoso(file_actions, tmp_path) -> None:
+    """
+    Crear el generador no abre el archivo: el error de un archivo inexistente llega al consumir el primer elemento.
+    """
+    generador = file_actions.iterar_csv_diccionario(str(tmp_path / "no_existe.csv"))
+    with pytest.raises(FileNotFoundError):
+        next(generador)
+
+
+def test_iterar_excel_con_y_sin_encabezado(file_actions, tmp_path) -> None:
+    ruta = tmp_path / "datos.xlsx"
+    libro = openpyxl.Workbook()
+    hoja = libro.active
+    hoja.title = "Datos"
+    for fila in (["nombre", "edad"], ["ana", 30], ["luis", 41]):
+        hoja.append(fila)
+    libro.save(ruta)
+
+    assert list(file_actions.iterar_excel_diccionario(str(ruta), "Datos")) == [
+        {"nombre": "ana", "edad": 30}, {"nombre": "luis", "edad": 41}
+    ]
+    sin_encabezado = list(file_actions.iterar_excel_diccionario(str(ruta), "Datos", has_header=False, headers=["c1", "c2"], tamano_lote=5))
+    assert sin_encabezado == [[{"c1": "nombre", "c2": "edad"}, {"c1": "ana", "c2": 30}, {"c1": "luis", "c2": 41}]]
+
+    with pytest.raises(ValueError):
+        next(file_actions.iterar_excel_diccionario(str(ruta), "Datos", has_header=False))
+    with pytest.raises(KeyError):
+        next(file_actions.iterar_excel_diccionario(str(ruta), "NoExiste"))
+
+
+def test_iterar_texto_plano_sin_saltos_de_linea(file_actions, tmp_path) -> None:
+    ruta = tmp_path / "log.txt"
+    ruta.write_bytes(b"uno\r\ndos\ntres")
+
+    assert list(file_actions.iterar_texto_plano(str(ruta))) == ["uno", "dos", "tres"]
+    assert list(file_actions.iterar_texto_plano(str(ruta), tamano_lote=2)) == [["uno", "dos"], ["tres"]]
+
+
+# --- XML con iterparse ---
+
+SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url id="1"><loc>https://app.test/a</loc><image:image><image:loc>https://app.test/a.png</image:loc></image:image></url>
+  <url id="2"><loc>https://app.test/b</loc><precio moneda="EUR">10</precio></url>
+  <otro><url id="3"><loc>https://app.test/c</loc></url></otro>
+</urlset>
+"""
+
+
+@pytest.fixture
+def sitemap(tmp_path) -> str:
+    ruta = tmp_path / "sitemap.xml"
+    ruta.write_text(SITEMAP, encoding='utf-8')
+    return str(ruta)
+
+
+def test_iterar_xml_por_nombre_local_y_por_ruta(file_actions, sitemap) -> None:
+    """
+    El nombre local coincide en cualquier nivel (ignorando el espacio de nombres); una ruta solo con ese anidamiento.
+    """
+    ids = [elemento.get("id") for elemento in file_actions.iterar_xml(sitemap, "url")]
+    assert ids == ["1", "2", "3"]
+    ids_ruta = [elemento.get("id") for elemento in file_actions.iterar_xml(sitemap, "urlset/url")]
+    assert ids_ruta == ["1", "2"]
+    ids_ns = [elemento.get("id") for elemento in file_actions.iterar_xml(sitemap, "{http://www.sitemaps.org/schemas/sitemap/0.9}url")]
+    assert ids_ns == ["1", "2", "3"]
+
+
+def test_iterar_xml_conserva_hijos_y_libera_al_avanzar(file_actions, sitemap) -> None:
+    """
+    Cada elemento llega completo (con sus hijos) y se vacía cuando se pide el siguiente.
+    """
+    generador = file_actions.iterar_xml(sitemap, "url")
+    primero = next(generador)
+    assert primero.findtext("{http://www.sitemaps.org/schemas/sitemap/0.9}loc") == "https://app.test/a"
+    assert len(primero) == 2
+    next(generador)
+    assert len(primero) == 0 and primero.get("id") is None
+    generador.close()
+
+
+def test_iterar_xml_por_lotes(file_actions, sitemap) -> None:
+    lotes = [[elemento.get("id") for elemento in lote] for lote in file_actions.iterar_xml(sitemap, "url", tamano_lote=2)]
+    assert lotes == [["1", "2"], ["3"]]
+
+
+def test_extraer_campos_xml(file_actions, sitemap) -> None:
+    namespaces = {"s": "http://www.sitemaps.org/schemas/sitemap/0.9", "image": "http://www.google.com/schemas/sitemap-image/1.1"}
+    campos = {"id": "@id", "loc": "s:loc", "imagen": "image:image/image:loc", "moneda": "s:precio/@moneda"}
+
+    registros = list(file_actions.extraer_campos_xml(sitemap, "urlset/url", campos, namespaces))
+    assert registros == [
+        {"id": "1", "loc": "https://app.test/a", "imagen": "https://app.test/a.png", "moneda": None},
+        {"id": "2", "loc": "https://app.test/b", "imagen": None, "moneda": "EUR"},
+    ]
+
+
+def test_iterar_xml_mal_formado(file_actions, tmp_path) -> None:
+    ruta = tmp_path / "roto.xml"
+    ruta.write_text("<a><b></a>", encoding='utf-8')
+    with pytest.raises(ET.ParseError):
+        list(file_actions.iterar_xml(str(ruta), "b"))
@@ -0,0 +1,33 @@
+from utils.parametrizacion_datos import generar_ids
+
+
+def test_ids_por_numero_de_fila_sin_id_columna() -> None:
+    """
+    Sin `id_columna` los ids son '<archivo>-fila<N>', con N basado en 1 y sin la extensión ni el directorio.
+    """
+    registros = [{"email": "a@test.com"}, {"email": "b@test.com"}]
+    assert generar_ids(registros, "datos/usuarios.xlsx") == ["usuarios-fila1", "usuarios-fila2"]
+
+
+def test_ids_con_id_columna_y_respaldo_para_celdas_vacias() -> None:
+    """
+    Con `id_columna` se usa su valor; las celdas vacías, `None` o ausentes vuelven al id por número de fila.
+    """
+    registros = [{"email": "a@test.com"}, {"email": ""}, {"email": None}, {}]
+    assert generar_ids(registros, "usuarios.csv", id_columna="email") == [
+        "a@test.com", "usuarios-fila2", "usuarios-fila3", "usuarios-fila4"
+    ]
+
+
+def test_ids_sin_caracteres_problematicos_para_k() -> None:
+    """
+    Los espacios y símbolos se sustituyen por '_' para poder seleccionar el test con `-k`; los números se convierten a texto.
+    """
+    registros = [{"nombre": "Ana María [admin]"}, {"nombre": 42}, {"nombre": "  ///  "}]
+    assert generar_ids(registros, "mis datos.csv", id_columna="nombre") == ["Ana_María_admin", "42", "vacio"]
+    assert generar_ids([{}], "mis datos.csv") == ["mis_datos-fila1"]
+
+
+def test_ids_estables_entre_llamadas() -> None:
+    registros = [{"id": 7}, {"id": 8}]
+    assert generar_ids(registros, "a.csv", id_columna="id") == generar_ids(list(registros), "a.csv", id_columna="id")
@@ -0,0 +1,86 @@
+import json
+from types import SimpleNamespace
+from playwright.sync_api import Error
+from utils.perfil_red import BloqueadorRecursos, RegistroTamanos, CABECERA_SIMULADA
+
+
+class RespuestaFalsa:
+    """Sustituto de `playwright.sync_api.Response` que cuenta las lecturas del cuerpo."""
+
+    def __init__(self, url, encabezados=None, cuerpo=b"", tipo="image", status=200, error=None):
+        self.url = url
+        self.headers = encabezados or {}
+        self.status = status
+        self.request = SimpleNamespace(resource_type=tipo)
+        self._cuerpo = cuerpo
+        self._error = error
+        self.lecturas_cuerpo = 0
+
+    def body(self):
+        self.lecturas_cuerpo += 1
+        if self._error:
+            raise self._error
+        return self._cuerpo
+
+
+class SolicitudFalsa:
+    def __init__(self, url, tipo):
+        self.url = url
+        self.resource_type = tipo
+
+
+class RutaFalsa:
+    def __init__(self, url, tipo):
+        self.request = SolicitudFalsa(url, tipo)
+
+    def abort(self, motivo):
+        pass
+
+    def fulfill(self, **kwargs):
+        pass
+
+    def fallback(self):
+        pass
+
+
+def test_tamano_por_content_length_o_por_cuerpo(tmp_path) -> None:
+    """
+    Sin Content-Length (p. ej. servida desde la caché de recursos) el tamaño sale del cuerpo, que se lee una sola
+    vez por URL y solo para los tipos estimables; las respuestas simuladas y los errores no se aprenden.
+    """
+    tamanos = RegistroTamanos(str(tmp_path / "tamanos.json"))
+    sin_cabecera = RespuestaFalsa("https://app.test/logo.png", cuerpo=b"x" * 70)
+    tamanos._on_response(RespuestaFalsa("https://app.test/fuente.woff2", {"content-length": "1200"}, tipo="font"))
+    tamanos._on_response(sin_cabecera)
+    tamanos._on_response(sin_cabecera)
+    tamanos._on_response(RespuestaFalsa("https://app.test/api", cuerpo=b"{}", tipo="fetch"))
+    tamanos._on_response(RespuestaFalsa("https://app.test/simulada.png", {CABECERA_SIMULADA: "funcional"}, b"png"))
+    tamanos._on_response(RespuestaFalsa("https://app.test/redirigida.png", status=302))
+    tamanos._on_response(RespuestaFalsa("https://app.test/cerrada.png", error=Error("Target closed")))
+
+    assert tamanos.tamanos == {"https://app.test/fuente.woff2": 1200, "https://app.test/logo.png": 70}
+    assert sin_cabecera.lecturas_cuerpo == 1
+
+
+def test_guardar_fusiona_con_el_archivo(tmp_path) -> None:
+    ruta = tmp_path / "tamanos.json"
+    ruta.write_text(json.dumps({"https://app.test/a.png": 10}), encoding='utf-8')
+    tamanos = RegistroTamanos(str(ruta))
+    tamanos._on_response(RespuestaFalsa("https://app.test/b.png", {"content-length": "20"}))
+    tamanos.guardar()
+
+    assert json.loads(ruta.read_text(encoding='utf-8')) == {"https://app.test/a.png": 10, "https://app.test/b.png": 20}
+    assert RegistroTamanos(str(ruta)).obtener("https://app.test/b.png") == 20
+
+
+def test_resumen_distingue_solicitudes_con_y_sin_tamano(tmp_path) -> None:
+    tamanos = RegistroTamanos(str(tmp_path / "tamanos.json"))
+    tamanos.tamanos["https://app.test/conocida.png"] = 500
+    bloqueador = BloqueadorRecursos("funcional", tamanos=tamanos)
+    for url, tipo in (("https://app.test/conocida.png", "image"), ("https://app.test/nueva.png", "image"),
+                      ("https://app.test/fuente.woff2", "font"), ("https://app.test/main.js", "script")):
+        bloqueador._manejar_ruta(RutaFalsa(url, tipo))
+
+    resumen = bloqueador.resumen()
+    assert (resumen["solicitudes_evitadas"], resumen["bloqueadas"], resumen["simuladas"]) == (3, {"font": 1}, {"image": 2})
+    assert (resumen["bytes_ahorrados_estimados"], resumen["con_tamano_conocido"], resumen["sin_tamano_conocido"]) == (500, 1, 2)
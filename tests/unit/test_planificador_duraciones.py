@@ -0,0 +1,92 @@
+import json
+import pytest
+from utils.planificador_duraciones import (
+    HistorialDuraciones, grupo_de_test, repartir_en_unidades, DURACION_POR_DEFECTO, FACTOR_SUAVIZADO
+)
+
+
+def test_grupo_de_test_por_dispositivo_o_modulo() -> None:
+    """
+    Los tests parametrizados por navegador/dispositivo se agrupan por ese id; el resto, por módulo.
+    """
+    assert grupo_de_test("tests/e2e/test_home.py::test_x[webkit-Pixel 5]") == "webkit-Pixel 5"
+    assert grupo_de_test("tests/e2e/test_home.py::test_x[chromium-1920x1080-fila3]") == "chromium-1920x1080"
+    assert grupo_de_test("tests/e2e/test_home.py::test_x") == "tests/e2e/test_home.py"
+
+
+def test_repartir_en_unidades_ordena_por_duracion_descendente() -> None:
+    """
+    Las unidades se entregan de mayor a menor duración total (LPT) y cada una ordena sus tests igual.
+    """
+    duraciones = {
+        "a.py::t1[chromium-d1]": 1.0,
+        "a.py::t2[chromium-d1]": 2.0,
+        "a.py::t1[firefox-d2]": 4.0,
+        "b.py::t3": 0.5,
+    }
+    unidades = repartir_en_unidades(duraciones, num_workers=1)
+
+    assert list(unidades) == ["firefox-d2", "chromium-d1", "b.py"]
+    assert unidades["chromium-d1"] == ["a.py::t2[chromium-d1]", "a.py::t1[chromium-d1]"]
+
+
+def test_repartir_en_unidades_divide_grupos_mas_pesados_que_la_carga_ideal() -> None:
+    """
+    Un grupo que supera la carga ideal por worker se divide en sub-bloques equilibrados, sin perder tests.
+    """
+    duraciones = {f"a.py::t{i}[chromium-d1]": 1.0 for i in range(8)}
+    unidades = repartir_en_unidades(duraciones, num_workers=4)
+
+    assert len(unidades) == 4
+    assert all(nombre.startswith("chromium-d1::bloque") for nombre in unidades)
+    assert [len(nodeids) for nodeids in unidades.values()] == [2, 2, 2, 2]
+    assert sorted(n for nodeids in unidades.values() for n in nodeids) == sorted(duraciones)
+
+
+def test_repartir_en_unidades_sin_tests() -> None:
+    assert repartir_en_unidades({}, num_workers=4) == {}
+
+
+def test_historial_media_movil_exponencial(tmp_path) -> None:
+    """
+    La primera ejecución guarda la duración tal cual; las siguientes la suavizan con `FACTOR_SUAVIZADO`.
+    Las fases (setup, call, teardown) de un mismo test se suman.
+    """
+    ruta = str(tmp_path / "historial" / "duraciones.json")
+    historial = HistorialDuraciones(ruta)
+    historial.registrar("a.py::t1", 1.0)
+    historial.registrar("a.py::t1", 3.0)
+    historial.guardar()
+    assert historial.duracion_de("a.py::t1") == 4.0
+
+    siguiente = HistorialDuraciones(ruta)
+    siguiente.registrar("a.py::t1", 8.0)
+    siguiente.guardar()
+
+    with open(ruta, encoding='utf-8') as archivo:
+        guardado = json.load(archivo)
+    esperado = FACTOR_SUAVIZADO * 8.0 + (1 - FACTOR_SUAVIZADO) * 4.0
+    assert guardado["a.py::t1"] == {"duracion": pytest.approx(esperado), "ejecuciones": 2}
+
+
+def test_historial_estima_tests_nuevos_con_la_mediana(tmp_path) -> None:
+    """
+    Los tests sin historial reciben la mediana de los conocidos, o `DURACION_POR_DEFECTO` si no hay ninguno.
+    """
+    ruta = tmp_path / "duraciones.json"
+    ruta.write_text(json.dumps({
+        "a.py::t1": {"duracion": 1.0, "ejecuciones": 1},
+        "a.py::t2": {"duracion": 3.0, "ejecuciones": 1},
+        "a.py::t3": {"duracion": 9.0, "ejecuciones": 1},
+    }), encoding='utf-8')
+    historial = HistorialDuraciones(str(ruta))
+
+    estimadas = historial.estimar(["a.py::t1", "a.py::t3", "a.py::nuevo"])
+    assert estimadas == {"a.py::t1": 1.0, "a.py::t3": 9.0, "a.py::nuevo": 9.0}
+    assert HistorialDuraciones(str(tmp_path / "no_existe.json")).estimar(["x"]) == {"x": DURACION_POR_DEFECTO}
+
+
+def test_historial_corrupto_equivale_a_vacio(tmp_path) -> None:
+    ruta = tmp_path / "duraciones.json"
+    ruta.write_text("{no es json", encoding='utf-8')
+    assert HistorialDuraciones(str(ruta)).duraciones == {}
@@ -0,0 +1,203 @@
+"""
+Caché a nivel de proceso de los libros Excel usados como fuente de datos.
+
+Cada libro se abre una sola vez con `openpyxl.load_workbook(read_only=True)` (lectura en streaming,
+sin construir el modelo de celdas editable) y las filas de cada hoja se materializan en tuplas de
+valores. Las consultas posteriores a la misma hoja cuestan un acceso por índice en lugar de un nuevo
+parseo del XML del archivo.
+
+La clave de la caché es la ruta absoluta y la firma del archivo (mtime en ns + tamaño): si el archivo
+cambia en disco, la entrada se invalida en la siguiente consulta. Las entradas se desalojan por LRU.
+
+También mantiene índices de encabezados (nombre normalizado -> posición de columna) por hoja Excel y por
+archivo CSV, para que la búsqueda de una columna por nombre sea un acceso a diccionario.
+"""
+import os
+import csv
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Any, Optional
+
+import openpyxl
+
+from utils.config import LOGGER_DIR
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='cache_archivos_datos',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+# Número máximo de libros que se mantienen materializados en memoria.
+MAX_LIBROS_CACHE = 8
+# Número máximo de índices de encabezados CSV que se mantienen en memoria.
+MAX_ENCABEZADOS_CSV_CACHE = 64
+
+
+def normalizar_encabezado(nombre: Any) -> str:
+    """Normaliza un nombre de columna para compararlo sin distinguir mayúsculas ni espacios laterales."""
+    return str(nombre).strip().lower()
+
+
+def construir_indice_encabezados(encabezados: Tuple[Any, ...]) -> Dict[str, int]:
+    """
+    Construye el índice nombre normalizado -> posición de columna (basada en 1).
+    Si hay nombres repetidos se conserva la primera columna, igual que la búsqueda secuencial.
+    """
+    indice: Dict[str, int] = {}
+    for posicion, nombre in enumerate(encabezados, 1):
+        if nombre is not None:
+            indice.setdefault(normalizar_encabezado(nombre), posicion)
+    return indice
+
+
+class HojaMaterializada:
+    """Filas de una hoja Excel como tuplas de valores (índices de fila y columna basados en 1, como en openpyxl)."""
+
+    __slots__ = ("nombre", "filas", "max_row", "max_column", "_indice_encabezados")
+
+    def __init__(self, nombre: str, filas: List[Tuple[Any, ...]]):
+        self.nombre = nombre
+        self.filas = filas
+        self.max_row = len(filas)
+        self.max_column = max((len(fila) for fila in filas), default=0)
+        self._indice_encabezados: Optional[Dict[str, int]] = None
+
+    @property
+    def indice_encabezados(self) -> Dict[str, int]:
+        """Índice de la primera fila (encabezado): nombre normalizado -> columna (basada en 1). Se construye una vez."""
+        if self._indice_encabezados is None:
+            self._indice_encabezados = construir_indice_encabezados(self.filas[0] if self.filas else ())
+        return self._indice_encabezados
+
+    def columna_por_nombre(self, nombre: str) -> Optional[int]:
+        """Devuelve la posición (basada en 1) de la columna con ese encabezado, o `None` si no existe."""
+        return self.indice_encabezados.get(normalizar_encabezado(nombre))
+
+    def fila(self, numero_fila: int) -> Tuple[Any, ...]:
+        """Devuelve los valores de la fila física indicada (basada en 1)."""
+        return self.filas[numero_fila - 1]
+
+    def celda(self, numero_fila: int, numero_columna: int) -> Any:
+        """Devuelve el valor de la celda (fila y columna basadas en 1) o `None` si está fuera de la fila."""
+        fila = self.filas[numero_fila - 1]
+        return fila[numero_columna - 1] if numero_columna <= len(fila) else None
+
+
+def _firma_archivo(ruta: str) -> Tuple[int, int]:
+    """Firma de un archivo para invalidar la caché: (mtime en nanosegundos, tamaño en bytes)."""
+    estado = os.stat(ruta)
+    return estado.st_mtime_ns, estado.st_size
+
+
+class CacheLibrosExcel:
+    """
+    Caché LRU de libros Excel materializados, compartida por todo el proceso (cada worker de xdist tiene la suya).
+    """
+
+    def __init__(self, max_libros: int = MAX_LIBROS_CACHE):
+        self.max_libros = max_libros
+        self._libros: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, HojaMaterializada]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _cargar_libro(self, ruta: str) -> Dict[str, HojaMaterializada]:
+        """Abre el libro en modo solo lectura, materializa todas sus hojas y lo cierra de inmediato."""
+        # --- Medición de rendimiento: parseo único del libro ---
+        start_time_carga = time.time()
+        workbook = openpyxl.load_workbook(ruta, read_only=True)
+        try:
+            hojas = {
+                nombre: HojaMaterializada(nombre, list(workbook[nombre].iter_rows(values_only=True)))
+                for nombre in workbook.sheetnames
+            }
+        finally:
+            # En modo read_only el archivo queda abierto hasta cerrar el libro explícitamente.
+            workbook.close()
+        duration_carga = time.time() - start_time_carga
+        logger.info(f"PERFORMANCE: Carga (read_only) y materialización del libro '{ruta}' ({len(hojas)} hojas): {duration_carga:.4f} segundos.")
+        return hojas
+
+    def obtener_hoja(self, ruta: str, hoja: str) -> HojaMaterializada:
+        """
+        Devuelve la hoja materializada, cargando el libro si no está en caché o si cambió en disco.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            KeyError: Si la hoja no existe en el libro.
+        """
+        ruta = os.path.abspath(ruta)
+        firma = _firma_archivo(ruta)
+
+        with self._lock:
+            entrada = self._libros.get(ruta)
+            if entrada is not None and entrada[0] == firma:
+                self._libros.move_to_end(ruta)
+                self.aciertos += 1
+                hojas = entrada[1]
+            else:
+                self.fallos += 1
+                hojas = self._cargar_libro(ruta)
+                self._libros[ruta] = (firma, hojas)
+                self._libros.move_to_end(ruta)
+                while len(self._libros) > self.max_libros:
+                    desalojado, _ = self._libros.popitem(last=False)
+                    logger.debug(f"\nLibro '{desalojado}' desalojado de la caché (LRU).")
+
+        if hoja not in hojas:
+            raise KeyError(hoja)
+        return hojas[hoja]
+
+    def invalidar(self, ruta: Optional[str] = None) -> None:
+        """Descarta un libro de la caché (o todos si no se indica ruta)."""
+        with self._lock:
+            if ruta is None:
+                self._libros.clear()
+            else:
+                self._libros.pop(os.path.abspath(ruta), None)
+
+
+cache_libros_excel = CacheLibrosExcel()
+
+_encabezados_csv: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], Tuple[str, ...], Dict[str, int]]]" = OrderedDict()
+_lock_encabezados_csv = threading.Lock()
+
+
+def obtener_hoja_excel(ruta: str, hoja: str) -> HojaMaterializada:
+    """Atajo para consultar una hoja a través de la caché de libros del proceso."""
+    return cache_libros_excel.obtener_hoja(ruta, hoja)
+
+
+def encabezados_csv(ruta: str, delimiter: str = ',') -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    """
+    Devuelve los encabezados de un CSV y su índice (nombre normalizado -> columna basada en 1).
+    Solo se lee la primera fila del archivo, y el resultado se reutiliza mientras el archivo no cambie.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+    """
+    ruta = os.path.abspath(ruta)
+    firma = _firma_archivo(ruta)
+    clave = (ruta, delimiter)
+
+    with _lock_encabezados_csv:
+        entrada = _encabezados_csv.get(clave)
+        if entrada is not None and entrada[0] == firma:
+            _encabezados_csv.move_to_end(clave)
+            return entrada[1], entrada[2]
+
+    with open(ruta, 'r', newline='', encoding='utf-8') as archivo:
+        encabezados = tuple(next(csv.reader(archivo, delimiter=delimiter), ()))
+    indice = construir_indice_encabezados(encabezados)
+
+    with _lock_encabezados_csv:
+        _encabezados_csv[clave] = (firma, encabezados, indice)
+        _encabezados_csv.move_to_end(clave)
+        while len(_encabezados_csv) > MAX_ENCABEZADOS_CSV_CACHE:
+            _encabezados_csv.popitem(last=False)
+    return encabezados, indice
@@ -0,0 +1,308 @@
+"""
+Caché HTTP de recursos estáticos compartida por todos los contextos de un worker.
+
+Cada contexto nuevo de `playwright_page` empieza con la caché del navegador vacía, así que los bundles JS,
+hojas de estilo, imágenes y fuentes se volvían a descargar en cada test. Esta caché se instala con
+`context.route` y guarda las respuestas GET cacheables a nivel de proceso (un worker de xdist):
+
+- Solo se guardan respuestas 200 de recursos estáticos (`TIPOS_CACHEABLES`), sin 'no-store' ni 'Vary: *'.
+- La clave es la URL más los encabezados de la solicitud que la respuesta declara en 'Vary'.
+- La frescura sale de 'Cache-Control: max-age' (menos 'Age') o de 'Expires'; 'no-cache' obliga a revalidar.
+- Una entrada caducada con 'ETag' o 'Last-Modified' se revalida con una solicitud condicional: un 304
+  renueva la entrada y se sirve el cuerpo guardado.
+
+Modos (clave 'cache_recursos' del perfil de ejecución u opción `--cache-recursos`): 'nunca', 'memoria'
+(LRU limitada por bytes) y 'disco' (además, cada entrada se guarda en `CACHE_RECURSOS_DIR` y sobrevive
+entre ejecuciones mientras siga fresca o revalidable). Al final de la sesión cada worker registra la tasa
+de aciertos y los bytes que no tuvo que descargar.
+"""
+import os
+import time
+import pickle
+import hashlib
+import logging
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Tuple
+
+import pytest
+from playwright.sync_api import BrowserContext, Route, Request, APIResponse
+
+from utils.config import LOGGER_DIR, CACHE_RECURSOS_DIR
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='cache_recursos',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+VARIABLE_ENTORNO_CACHE = "CACHE_RECURSOS"
+MODOS_CACHE = ("nunca", "memoria", "disco")
+TIPOS_CACHEABLES = frozenset({"script", "stylesheet", "image", "font"})
+MAX_BYTES_MEMORIA = 200 * 1024 * 1024
+
+# Encabezados que no se reenvían al servir desde la caché: el cuerpo guardado ya está descomprimido.
+_ENCABEZADOS_EXCLUIDOS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+
+def _directivas_cache_control(valor: Optional[str]) -> Dict[str, Optional[str]]:
+    """Convierte 'public, max-age=60' en {'public': None, 'max-age': '60'}."""
+    directivas: Dict[str, Optional[str]] = {}
+    for parte in (valor or "").split(","):
+        nombre, _, argumento = parte.strip().partition("=")
+        if nombre:
+            directivas[nombre.lower()] = argumento.strip('"') or None
+    return directivas
+
+
+def calcular_caducidad(encabezados: Dict[str, str], ahora: Optional[float] = None) -> Optional[float]:
+    """
+    Calcula el instante (epoch) hasta el que una respuesta es fresca según sus encabezados.
+
+    Returns:
+        Optional[float]: El instante de caducidad, o `None` si la respuesta no debe guardarse ('no-store').
+                         Una respuesta sin información de frescura (o con 'no-cache') caduca de inmediato.
+    """
+    ahora = time.time() if ahora is None else ahora
+    directivas = _directivas_cache_control(encabezados.get("cache-control"))
+    if "no-store" in directivas:
+        return None
+    if "no-cache" in directivas:
+        return ahora
+    max_age = directivas.get("max-age")
+    if max_age is not None and max_age.isdigit():
+        edad = encabezados.get("age", "0")
+        return ahora + int(max_age) - (int(edad) if edad.isdigit() else 0)
+    if "expires" in encabezados:
+        try:
+            expira = parsedate_to_datetime(encabezados["expires"]).timestamp()
+            fecha = parsedate_to_datetime(encabezados["date"]).timestamp() if "date" in encabezados else ahora
+            return ahora + (expira - fecha)
+        except (TypeError, ValueError):
+            return ahora
+    return ahora
+
+
+class EntradaCache:
+    """Respuesta guardada: estado, encabezados filtrados, cuerpo y frescura."""
+
+    __slots__ = ("status", "encabezados", "cuerpo", "caduca", "vary")
+
+    def __init__(self, status: int, encabezados: Dict[str, str], cuerpo: bytes, caduca: float, vary: Tuple[str, ...]):
+        self.status = status
+        self.encabezados = encabezados
+        self.cuerpo = cuerpo
+        self.caduca = caduca
+        self.vary = vary
+
+    @property
+    def fresca(self) -> bool:
+        return time.time() < self.caduca
+
+    @property
+    def revalidable(self) -> bool:
+        return "etag" in self.encabezados or "last-modified" in self.encabezados
+
+
+class CacheRecursos:
+    """
+    Caché de recursos del worker. Se instala en cada contexto con `instalar(context)` y acumula las
+    estadísticas de todos ellos.
+    """
+
+    def __init__(self, modo: str = "memoria", max_bytes: int = MAX_BYTES_MEMORIA, directorio: str = CACHE_RECURSOS_DIR):
+        self.modo = modo
+        self.max_bytes = max_bytes
+        self.directorio = directorio
+        self._entradas: "OrderedDict[str, EntradaCache]" = OrderedDict()
+        # Encabezados 'Vary' conocidos por URL, necesarios para construir la clave antes de tener la respuesta.
+        self._vary_por_url: Dict[str, Tuple[str, ...]] = {}
+        self._bytes_memoria = 0
+        self.aciertos = 0
+        self.revalidaciones = 0
+        self.fallos = 0
+        self.bytes_ahorrados = 0
+        if modo == "disco":
+            os.makedirs(directorio, exist_ok=True)
+
+    def instalar(self, context: BrowserContext) -> None:
+        """Registra la ruta de la caché en el contexto."""
+        context.route("**/*", self._manejar_ruta)
+
+    # --- Claves y almacenamiento ---
+
+    def _clave(self, request: Request, vary: Tuple[str, ...]) -> str:
+        encabezados = request.headers
+        return request.url + "".join(f"\n{nombre}:{encabezados.get(nombre, '')}" for nombre in vary)
+
+    def _ruta_disco(self, clave: str) -> str:
+        return os.path.join(self.directorio, hashlib.sha256(clave.encode("utf-8")).hexdigest() + ".pkl")
+
+    def _obtener(self, clave: str) -> Optional[EntradaCache]:
+        entrada = self._entradas.get(clave)
+        if entrada is not None:
+            self._entradas.move_to_end(clave)
+            return entrada
+        if self.modo != "disco":
+            return None
+        ruta = self._ruta_disco(clave)
+        if not os.path.exists(ruta):
+            return None
+        try:
+            with open(ruta, 'rb') as archivo:
+                entrada = EntradaCache(*pickle.load(archivo))
+        except (OSError, pickle.UnpicklingError, EOFError, TypeError) as e:
+            logger.debug(f"\nEntrada de caché en disco ilegible '{ruta}'. Se descarta. Detalles: {e}")
+            return None
+        self._guardar_en_memoria(clave, entrada)
+        return entrada
+
+    def _guardar_en_memoria(self, clave: str, entrada: EntradaCache) -> None:
+        anterior = self._entradas.pop(clave, None)
+        if anterior is not None:
+            self._bytes_memoria -= len(anterior.cuerpo)
+        self._entradas[clave] = entrada
+        self._bytes_memoria += len(entrada.cuerpo)
+        while self._bytes_memoria > self.max_bytes and len(self._entradas) > 1:
+            _, desalojada = self._entradas.popitem(last=False)
+            self._bytes_memoria -= len(desalojada.cuerpo)
+
+    def _guardar(self, clave: str, entrada: EntradaCache) -> None:
+        self._guardar_en_memoria(clave, entrada)
+        if self.modo != "disco":
+            return
+        ruta = self._ruta_disco(clave)
+        ruta_temporal = f"{ruta}.{os.getpid()}.tmp"
+        try:
+            with open(ruta_temporal, 'wb') as archivo:
+                pickle.dump((entrada.status, entrada.encabezados, entrada.cuerpo, entrada.caduca, entrada.vary), archivo)
+            os.replace(ruta_temporal, ruta)
+        except OSError as e:
+            logger.debug(f"\nNo se pudo guardar la entrada de caché en disco '{ruta}'. Detalles: {e}")
+
+    # --- Manejo de solicitudes ---
+
+    def _servir(self, route: Route, entrada: EntradaCache) -> None:
+        route.fulfill(status=entrada.status, headers=entrada.encabezados, body=entrada.cuerpo)
+        self.bytes_ahorrados += len(entrada.cuerpo)
+
+    def _almacenar_respuesta(self, request: Request, respuesta: APIResponse, cuerpo: bytes) -> None:
+        encabezados = {nombre.lower(): valor for nombre, valor in respuesta.headers.items()}
+        vary = tuple(sorted(v.strip().lower() for v in encabezados.get("vary", "").split(",") if v.strip()))
+        if respuesta.status != 200 or "*" in vary:
+            return
+        caduca = calcular_caducidad(encabezados)
+        if caduca is None:
+            return
+        entrada = EntradaCache(200, {k: v for k, v in encabezados.items() if k not in _ENCABEZADOS_EXCLUIDOS}, cuerpo, caduca, vary)
+        if not entrada.fresca and not entrada.revalidable:
+            return
+        self._vary_por_url[request.url] = vary
+        self._guardar(self._clave(request, vary), entrada)
+
+    def _manejar_ruta(self, route: Route) -> None:
+        request = route.request
+        if request.method != "GET" or request.resource_type not in TIPOS_CACHEABLES:
+            route.fallback()
+            return
+
+        clave = self._clave(request, self._vary_por_url.get(request.url, ()))
+        entrada = self._obtener(clave)
+        if entrada is not None and entrada.fresca:
+            self.aciertos += 1
+            self._servir(route, entrada)
+            return
+
+        encabezados_condicionales = {}
+        if entrada is not None and entrada.revalidable:
+            if "etag" in entrada.encabezados:
+                encabezados_condicionales["if-none-match"] = entrada.encabezados["etag"]
+            if "last-modified" in entrada.encabezados:
+                encabezados_condicionales["if-modified-since"] = entrada.encabezados["last-modified"]
+
+        try:
+            respuesta = route.fetch(headers={**request.headers, **encabezados_condicionales} if encabezados_condicionales else None)
+        except Exception as e:
+            logger.debug(f"\nLa caché de recursos no pudo descargar '{request.url}'. Se deja seguir la solicitud. Detalles: {e}")
+            route.fallback()
+            return
+
+        if respuesta.status == 304 and entrada is not None:
+            entrada.caduca = calcular_caducidad({**entrada.encabezados, **{k.lower(): v for k, v in respuesta.headers.items()}}) or time.time()
+            self.revalidaciones += 1
+            self._guardar(clave, entrada)
+            self._servir(route, entrada)
+            return
+
+        self.fallos += 1
+        cuerpo = respuesta.body()
+        self._almacenar_respuesta(request, respuesta, cuerpo)
+        route.fulfill(response=respuesta, body=cuerpo)
+
+    def resumen(self) -> Dict[str, Any]:
+        """Aciertos, revalidaciones (304), fallos, tasa de aciertos y bytes servidos sin descargar."""
+        total = self.aciertos + self.revalidaciones + self.fallos
+        return {
+            "modo": self.modo,
+            "aciertos": self.aciertos,
+            "revalidaciones": self.revalidaciones,
+            "fallos": self.fallos,
+            "tasa_aciertos": (self.aciertos + self.revalidaciones) / total if total else 0.0,
+            "bytes_ahorrados": self.bytes_ahorrados,
+            "entradas_en_memoria": len(self._entradas),
+        }
+
+
+def modo_cache_recursos(perfil_ejecucion: Dict[str, Any]) -> str:
+    """Modo de caché activo: variable `CACHE_RECURSOS` o, en su defecto, la clave 'cache_recursos' del perfil."""
+    modo = (os.getenv(VARIABLE_ENTORNO_CACHE) or perfil_ejecucion.get("cache_recursos") or "nunca").strip().lower()
+    if modo not in MODOS_CACHE:
+        raise ValueError(f"\nEl modo de caché de recursos '{modo}' no existe. Modos disponibles: {MODOS_CACHE}.")
+    return modo
+
+
+_cache: Optional[CacheRecursos] = None
+
+
+def obtener_cache_recursos(perfil_ejecucion: Dict[str, Any]) -> Optional[CacheRecursos]:
+    """Caché del proceso (una por worker de xdist), o `None` si el modo activo es 'nunca'."""
+    global _cache
+    modo = modo_cache_recursos(perfil_ejecucion)
+    if modo == "nunca":
+        return None
+    if _cache is None or _cache.modo != modo:
+        _cache = CacheRecursos(modo)
+    return _cache
+
+
+# --- Hooks del plugin ---
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("cache_recursos", "Caché de recursos estáticos entre contextos")
+    group.addoption(
+        "--cache-recursos",
+        action="store",
+        default=None,
+        choices=list(MODOS_CACHE),
+        help=f"Caché de recursos estáticos compartida por los contextos del worker. Por defecto, la variable "
+             f"de entorno {VARIABLE_ENTORNO_CACHE} o la clave 'cache_recursos' del perfil de ejecución."
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Se propaga por variable de entorno para que la hereden los workers de xdist.
+    modo = config.getoption("--cache-recursos")
+    if modo:
+        os.environ[VARIABLE_ENTORNO_CACHE] = modo
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if _cache is None:
+        return
+    resumen = _cache.resumen()
+    worker = os.getenv("PYTEST_XDIST_WORKER", "principal")
+    logger.info(f"PERFORMANCE: Caché de recursos ({worker}, modo '{resumen['modo']}'): {resumen['aciertos']} aciertos, "
+                f"{resumen['revalidaciones']} revalidaciones, {resumen['fallos']} fallos, tasa de aciertos "
+                f"{resumen['tasa_aciertos']:.1%}, {resumen['bytes_ahorrados']} bytes servidos sin descargar.")
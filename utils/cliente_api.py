@@ -0,0 +1,155 @@
+"""
+Cliente de la API de la aplicación para preparar precondiciones sin pasar por la UI.
+
+Registrar un usuario o iniciar sesión a través de los formularios cuesta varios segundos por test. Cuando el
+test no trata sobre esos flujos, el estado se crea con una llamada HTTP a `config.API_URL` y se inyecta en el
+contexto de Playwright (cookies de la sesión HTTP y token en `localStorage`) antes de abrir la aplicación.
+
+`ClienteAPI` usa un único `requests.Session` por worker de xdist: conexiones keep-alive reutilizadas desde un
+pool y una política de reintentos con backoff. Los POST solo se reintentan ante errores de conexión (la
+solicitud no llegó al servidor), para no registrar dos veces el mismo usuario.
+"""
+import json
+import time
+import logging
+from typing import Dict, Any, Optional, List
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from playwright.sync_api import BrowserContext
+
+from utils.config import LOGGER_DIR, API_URL, BASE_URL
+from utils.generador_datos import GeneradorDeDatos
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='cliente_api',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+RUTA_USUARIOS = "/users"
+RUTA_TOKEN = "/oauth/token"
+# Clave de `localStorage` en la que la aplicación web guarda el token de acceso.
+CLAVE_TOKEN_ALMACENAMIENTO = "token"
+# Marca de `sessionStorage` que indica que la pestaña ya recibió el token: la inyección ocurre una sola vez.
+CLAVE_SESION_INYECTADA = "sesion_inyectada_por_api"
+
+TIMEOUT_POR_DEFECTO = 10.0
+TAMANO_POOL = 10
+
+
+def _politica_reintentos() -> Retry:
+    """Reintentos con backoff ante errores de conexión y 502/503/504 (estos últimos solo en métodos idempotentes)."""
+    return Retry(total=3, connect=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False)
+
+
+class ClienteAPI:
+    """Cliente HTTP de la API con una sesión `requests` reutilizada (pool de conexiones y reintentos)."""
+
+    def __init__(self, url_base: Optional[str] = API_URL, timeout: float = TIMEOUT_POR_DEFECTO):
+        if not url_base:
+            raise EnvironmentError("\nLa variable de entorno 'API_URL' no está definida: no se pueden preparar precondiciones por API.")
+        self.url_base = url_base.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=TAMANO_POOL, pool_maxsize=TAMANO_POOL, max_retries=_politica_reintentos())
+        self.session.mount("https://", adaptador)
+        self.session.mount("http://", adaptador)
+        self.session.headers.update({"Accept": "application/json"})
+
+    def _solicitar(self, metodo: str, ruta: str, **kwargs) -> requests.Response:
+        """Envía la solicitud, registra su duración y lanza `requests.HTTPError` si la respuesta no es 2xx."""
+        url = f"{self.url_base}{ruta}"
+        start_time_api = time.time()
+        respuesta = self.session.request(metodo, url, timeout=self.timeout, **kwargs)
+        duration_api = time.time() - start_time_api
+        logger.info(f"PERFORMANCE: {metodo} {ruta} -> {respuesta.status_code}: {duration_api:.4f} segundos.")
+        if not respuesta.ok:
+            logger.error(f"\n❌ La API respondió {respuesta.status_code} a {metodo} {url}: {respuesta.text[:500]}")
+        respuesta.raise_for_status()
+        return respuesta
+
+    def registrar_usuario(self, usuario: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        Crea un usuario por API.
+
+        Args:
+            usuario (Optional[Dict[str, str]]): Datos con el formato de `GeneradorDeDatos.generar_usuario_aleatorio`.
+                                                Si es `None`, se genera un usuario aleatorio.
+
+        Returns:
+            Dict[str, str]: Los datos del usuario creado (para iniciar sesión con ellos).
+        """
+        usuario = usuario or GeneradorDeDatos().generar_usuario_aleatorio()
+        self._solicitar("POST", RUTA_USUARIOS, json={
+            "username": usuario["username"],
+            "firstName": usuario["first_name"],
+            "lastName": usuario["last_name"],
+            "password": usuario["password"],
+            "confirmPassword": usuario["confirm_password"],
+        })
+        logger.info(f"\n✔ Usuario '{usuario['username']}' registrado por API.")
+        return usuario
+
+    def iniciar_sesion(self, username: str, password: str) -> str:
+        """
+        Inicia sesión por API y devuelve el token de acceso.
+
+        Raises:
+            requests.HTTPError: Si las credenciales no son válidas.
+            ValueError: Si la respuesta no contiene un token.
+        """
+        # Las cookies de la sesión HTTP son las de este inicio de sesión, no las de un usuario anterior del worker.
+        self.session.cookies.clear()
+        respuesta = self._solicitar("POST", RUTA_TOKEN, data={"grant_type": "password", "username": username, "password": password})
+        token = respuesta.json().get("access_token")
+        if not token:
+            raise ValueError(f"\nLa respuesta de inicio de sesión de '{username}' no contiene 'access_token'.")
+        logger.info(f"\n✔ Sesión de '{username}' iniciada por API.")
+        return token
+
+    def cookies_para_contexto(self, url_aplicacion: str = BASE_URL) -> List[Dict[str, Any]]:
+        """Convierte las cookies de la sesión HTTP al formato de `context.add_cookies`."""
+        dominio_por_defecto = urlparse(url_aplicacion).hostname
+        cookies = []
+        for cookie in self.session.cookies:
+            cookies.append({
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain or dominio_por_defecto,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+                **({"expires": float(cookie.expires)} if cookie.expires else {}),
+            })
+        return cookies
+
+    def inyectar_sesion(self, context: BrowserContext, token: str, url_aplicacion: str = BASE_URL) -> None:
+        """
+        Traslada la sesión iniciada por API al contexto de Playwright: añade las cookies de la sesión HTTP y
+        deja el token en `localStorage` antes de que se ejecute cualquier script de la aplicación.
+        Debe llamarse antes de navegar a la aplicación.
+
+        El token se escribe solo en la primera carga de la aplicación de cada pestaña (marca
+        `CLAVE_SESION_INYECTADA` en `sessionStorage`): después de un logout, recargar o navegar no vuelve a
+        iniciar la sesión. Una pestaña nueva sin la marca sí la recibe, y las cookies se conservan en el contexto.
+        """
+        cookies = self.cookies_para_contexto(url_aplicacion)
+        if cookies:
+            context.add_cookies(cookies)
+        origen = "{0.scheme}://{0.netloc}".format(urlparse(url_aplicacion))
+        # json.dumps produce literales de cadena de JavaScript válidos para cualquier contenido (repr no).
+        marca = json.dumps(CLAVE_SESION_INYECTADA)
+        context.add_init_script(
+            f"if (window.location.origin === {json.dumps(origen)} && !window.sessionStorage.getItem({marca})) "
+            f"{{ window.localStorage.setItem({json.dumps(CLAVE_TOKEN_ALMACENAMIENTO)}, {json.dumps(token)}); "
+            f"window.sessionStorage.setItem({marca}, '1'); }}"
+        )
+        logger.debug(f"\nSesión inyectada en el contexto: {len(cookies)} cookies y token en localStorage['{CLAVE_TOKEN_ALMACENAMIENTO}'].")
+
+    def cerrar(self) -> None:
+        """Cierra las conexiones del pool."""
+        self.session.close()
@@ -66,6 +66,25 @@ SOURCE_FILES_DIR_DATA_WRITE = os.path.join(PROJECT_ROOT, "tests", "files", "file
 SOURCE_FILES_DIR_DATA_SOURCE = os.path.join(PROJECT_ROOT, "tests", "files", "files_data_source")
 SOURCE_FILES_DIR_UPLOAD = os.path.join(PROJECT_ROOT, "tests", "files", "files_upload")
 SOURCE_FILES_DIR_DOWNLOAD = os.path.join(PROJECT_ROOT, "tests", "files", "files_download")
+# Grabaciones HAR del tráfico de los tests, reproducibles sin red (utils/grabacion_har.py)
+HAR_DIR = os.path.join(PROJECT_ROOT, "tests", "files", "har")
+
+# Historial de duraciones de los tests, usado por el planificador de xdist (utils/planificador_duraciones.py)
+HISTORIAL_DURACIONES_FILE = os.path.join(DIRECTORIO_BASE_EVIDENCIAS, "historial_duraciones.json")
+# Informe del perfilador de selectores (utils/perfilador_selectores.py)
+PERFILADO_SELECTORES_FILE = os.path.join(DIRECTORIO_BASE_EVIDENCIAS, "perfilado_selectores.json")
+# Manifiesto de archivos CSV escritos por worker de xdist pendientes de fusionar (utils/escritores_datos.py)
+PENDIENTES_FUSION_CSV_FILE = os.path.join(DIRECTORIO_BASE_EVIDENCIAS, "pendientes_fusion_csv.txt")
+# Caché columnar (Feather/pickle) de los archivos de datos de los tests, indexada por hash de contenido (utils/fuente_datos.py)
+CACHE_FUENTES_DATOS_DIR = os.path.join(DIRECTORIO_BASE_EVIDENCIAS, "cache_fuentes_datos")
+# Métricas por descarga (bytes, segundos, MB/s, sha256) en JSON Lines (utils/gestor_descargas.py)
+METRICAS_DESCARGAS_FILE = os.path.join(DIRECTORIO_BASE_EVIDENCIAS, "metricas_descargas.jsonl")
+# Métricas del navegador por navegación (Navigation/Resource Timing, FCP, LCP, CLS), un archivo por worker (utils/metricas_navegacion.py)
+METRICAS_NAVEGACION_FILE = os.path.join(DIRECTORIO_BASE_EVIDENCIAS, "metricas", "navegacion.jsonl")
+# Tamaño en bytes por URL aprendido de las respuestas reales, para estimar el ahorro del perfil de red (utils/perfil_red.py)
+TAMANOS_RECURSOS_FILE = os.path.join(DIRECTORIO_BASE_EVIDENCIAS, "tamanos_recursos.json")
+# Entradas de la caché de recursos estáticos en modo 'disco', compartidas entre ejecuciones (utils/cache_recursos.py)
+CACHE_RECURSOS_DIR = os.path.join(DIRECTORIO_BASE_EVIDENCIAS, "cache_recursos")
 
 
 # --------------------------------------------------------------------------
@@ -114,7 +133,8 @@ def asegurar_directorios_existan():
         SOURCE_FILES_DIR_DATA_WRITE, 
         SOURCE_FILES_DIR_DATA_SOURCE,
         SOURCE_FILES_DIR_UPLOAD, 
-        SOURCE_FILES_DIR_DOWNLOAD
+        SOURCE_FILES_DIR_DOWNLOAD,
+        HAR_DIR
     ]
     
     logger.info("\nVerificando y asegurando la existencia de directorios base...")
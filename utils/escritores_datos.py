@@ -0,0 +1,542 @@
+"""
+Escritura y lectura de archivos JSON Lines (`.jsonl`): un objeto JSON por línea.
+
+A diferencia de un archivo JSON con una lista, añadir un registro a un JSON Lines no obliga a leer ni
+reescribir el contenido existente: cada `append` es una escritura al final del archivo (O(1)).
+
+`EscritorJSONL` acumula los registros en memoria y los escribe en bloque cuando el búfer alcanza
+`max_registros` o cuando han pasado `max_segundos` desde la última escritura, para que los logs de
+resultados de ejecuciones largas crezcan de forma lineal sin una llamada al sistema por registro.
+
+`SesionEscrituraExcel` aplica la misma idea a los libros Excel: mantiene abierto un libro de solo
+escritura durante toda la exportación y lo guarda una única vez al cerrar (no hay guardados intermedios: si
+el proceso muere antes de cerrar la sesión, el archivo en disco no cambia). `SesionEscrituraCSV` mantiene
+abierto un `csv.DictWriter` con los encabezados resueltos una vez y, opcionalmente, un archivo por worker
+de xdist que el controlador fusiona al final de la sesión (este módulo también es un plugin de pytest).
+"""
+import os
+import csv
+import glob
+import json
+import time
+import atexit
+import logging
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import openpyxl
+
+from utils.config import LOGGER_DIR, PENDIENTES_FUSION_CSV_FILE
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='escritores_datos',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+EXTENSIONES_JSON_LINES = (".jsonl", ".ndjson")
+
+
+def es_json_lines(ruta: str) -> bool:
+    """Indica si la ruta corresponde a un archivo JSON Lines (por extensión)."""
+    return os.path.splitext(ruta)[1].lower() in EXTENSIONES_JSON_LINES
+
+
+def serializar_linea_json(registro: Any) -> str:
+    """Serializa un registro como una línea JSON compacta (terminada en salto de línea)."""
+    return json.dumps(registro, ensure_ascii=False, separators=(",", ":"), default=str) + "\n"
+
+
+def anexar_lineas_json(ruta: str, registros: Iterable[Any], append: bool = True) -> int:
+    """
+    Escribe los registros en el archivo JSON Lines, uno por línea, con una sola escritura.
+
+    Args:
+        ruta (str): Ruta del archivo.
+        registros (Iterable[Any]): Registros serializables a JSON.
+        append (bool): Si es `True` (por defecto) se añaden al final; si es `False` el archivo se sobrescribe.
+
+    Returns:
+        int: Número de registros escritos.
+    """
+    lineas = [serializar_linea_json(registro) for registro in registros]
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    with open(ruta, 'a' if append else 'w', encoding='utf-8') as archivo:
+        archivo.write("".join(lineas))
+    return len(lineas)
+
+
+def iterar_lineas_json(ruta: str) -> Iterator[Any]:
+    """
+    Lee un archivo JSON Lines en streaming, devolviendo un registro por línea (las líneas vacías se ignoran).
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        json.JSONDecodeError: Si una línea no es JSON válido (el mensaje indica el número de línea).
+    """
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        for numero_linea, linea in enumerate(archivo, 1):
+            linea = linea.strip()
+            if not linea:
+                continue
+            try:
+                yield json.loads(linea)
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(f"Línea {numero_linea} de '{ruta}': {e.msg}", e.doc, e.pos) from e
+
+
+class EscritorJSONL:
+    """
+    Escritor con búfer para archivos JSON Lines.
+
+    Los registros se vacían al disco cuando el búfer llega a `max_registros`, cuando en una escritura se
+    detecta que han pasado más de `max_segundos` desde el último vaciado, al llamar a `vaciar()`/`cerrar()`,
+    al salir del bloque `with` o al terminar el proceso.
+
+    Uso:
+        with EscritorJSONL(ruta) as escritor:
+            escritor.escribir({"test": "...", "resultado": "ok"})
+    """
+
+    def __init__(self, ruta: str, max_registros: int = 500, max_segundos: float = 5.0, append: bool = True):
+        self.ruta = ruta
+        self.max_registros = max_registros
+        self.max_segundos = max_segundos
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._ultimo_vaciado = time.time()
+        self._cerrado = False
+        self.registros_escritos = 0
+
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        if not append:
+            open(ruta, 'w', encoding='utf-8').close()
+        atexit.register(self.cerrar)
+
+    def escribir(self, registro: Any) -> None:
+        """Añade un registro al búfer y lo vacía si se alcanzó el tamaño o el tiempo máximo."""
+        with self._lock:
+            if self._cerrado:
+                raise ValueError(f"El escritor JSON Lines de '{self.ruta}' ya está cerrado.")
+            self._buffer.append(serializar_linea_json(registro))
+            if len(self._buffer) >= self.max_registros or time.time() - self._ultimo_vaciado >= self.max_segundos:
+                self._vaciar_sin_lock()
+
+    def escribir_varios(self, registros: Iterable[Any]) -> None:
+        """Añade varios registros al búfer."""
+        for registro in registros:
+            self.escribir(registro)
+
+    def vaciar(self) -> None:
+        """Escribe en disco los registros pendientes."""
+        with self._lock:
+            self._vaciar_sin_lock()
+
+    def _vaciar_sin_lock(self) -> None:
+        self._ultimo_vaciado = time.time()
+        if not self._buffer:
+            return
+        pendientes = len(self._buffer)
+        with open(self.ruta, 'a', encoding='utf-8') as archivo:
+            archivo.write("".join(self._buffer))
+        self._buffer.clear()
+        self.registros_escritos += pendientes
+        logger.debug(f"\n{pendientes} registros escritos en '{self.ruta}' (total: {self.registros_escritos}).")
+
+    def cerrar(self) -> None:
+        """Vacía el búfer y cierra el escritor. Es seguro llamarlo varias veces."""
+        with self._lock:
+            if self._cerrado:
+                return
+            try:
+                self._vaciar_sin_lock()
+            except OSError as e:
+                logger.error(f"\n❌ No se pudieron escribir los registros pendientes en '{self.ruta}'. Detalles: {e}", exc_info=True)
+            self._cerrado = True
+        atexit.unregister(self.cerrar)
+
+    def __enter__(self) -> "EscritorJSONL":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.cerrar()
+
+
+class SesionEscrituraExcel:
+    """
+    Sesión de escritura de un libro Excel para exportar muchos registros con coste lineal.
+
+    Usa un libro `write_only` de openpyxl: las filas se envían en lotes a la hoja (que openpyxl vuelca
+    a un archivo temporal, sin mantener el modelo de celdas en memoria) y el libro se guarda una sola vez
+    al cerrar la sesión. Si `append` es `True` y el archivo existe, su contenido se copia una única vez
+    al abrir la sesión (todas las hojas) y los encabezados de la hoja destino se toman de su primera fila.
+
+    Un libro `write_only` solo puede guardarse una vez: los registros no llegan al disco hasta `cerrar()`.
+    En modo `append` el libro se reescribe entero a partir de los valores de sus celdas, así que se pierde
+    todo lo demás: estilos, anchos de columna, celdas combinadas, validaciones, gráficos e imágenes, y las
+    fórmulas quedan sustituidas por su último valor calculado. No usar `append` sobre libros con formato;
+    para ellos, `FileActions.escribir_excel(append=True)` edita el libro conservándolo.
+
+    La validación de encabezados se hace una vez por cada combinación distinta de claves de los registros.
+
+    Uso:
+        with SesionEscrituraExcel(ruta, hoja="Resultados") as sesion:
+            for resultado in resultados:
+                sesion.escribir(resultado)
+    """
+
+    def __init__(self, ruta: str, hoja: str = "Sheet1", encabezados: Optional[List[str]] = None, append: bool = True,
+                 escribir_encabezado: bool = True, tamano_lote: int = 1000):
+        self.ruta = ruta
+        self.hoja = hoja
+        self.encabezados: Optional[List[str]] = list(encabezados) if encabezados else None
+        self.append = append
+        self.escribir_encabezado = escribir_encabezado
+        self.tamano_lote = tamano_lote
+        self.filas_escritas = 0
+        self._buffer: List[List[Any]] = []
+        self._claves_validadas: Set[Tuple[str, ...]] = set()
+        self._workbook = None
+        self._hoja_destino = None
+        self._encabezado_pendiente = False
+
+    def abrir(self) -> "SesionEscrituraExcel":
+        """Crea el libro de solo escritura y, en modo `append`, copia una vez el contenido existente."""
+        # --- Medición de rendimiento: apertura de la sesión (incluye la copia única del contenido existente) ---
+        start_time_apertura = time.time()
+        self._workbook = openpyxl.Workbook(write_only=True)
+        filas_copiadas = 0
+
+        if self.append and os.path.exists(self.ruta) and os.path.getsize(self.ruta) > 0:
+            logger.warning(f"\n⚠️ La sesión de escritura Excel reescribe '{self.ruta}' copiando solo los valores de sus celdas: "
+                           f"se pierden estilos, anchos de columna, celdas combinadas y fórmulas.")
+            existente = openpyxl.load_workbook(self.ruta, read_only=True)
+            try:
+                filas_copiadas = self._copiar_existente(existente)
+            except Exception:
+                # Cierra las hojas ya empezadas para no dejar el libro de solo escritura a medias.
+                for hoja in self._workbook.worksheets:
+                    hoja.close()
+                self._workbook = None
+                self._hoja_destino = None
+                raise
+            finally:
+                existente.close()
+
+        if self._hoja_destino is None:
+            self._hoja_destino = self._workbook.create_sheet(self.hoja)
+            self._encabezado_pendiente = self.escribir_encabezado
+        if self._encabezado_pendiente and self.encabezados:
+            self._hoja_destino.append(self.encabezados)
+            self._encabezado_pendiente = False
+
+        duration_apertura = time.time() - start_time_apertura
+        logger.info(f"PERFORMANCE: Apertura de la sesión de escritura Excel '{self.ruta}' ({filas_copiadas} filas existentes copiadas): {duration_apertura:.4f} segundos.")
+        return self
+
+    def _copiar_existente(self, existente) -> int:
+        """Copia todas las hojas del libro existente y devuelve el número de filas copiadas."""
+        filas_copiadas = 0
+        for nombre_hoja in existente.sheetnames:
+            hoja_nueva = self._workbook.create_sheet(nombre_hoja)
+            filas = existente[nombre_hoja].iter_rows(values_only=True)
+            if nombre_hoja == self.hoja:
+                self._hoja_destino = hoja_nueva
+                primera = next(filas, None)
+                if primera is None:
+                    self._encabezado_pendiente = self.escribir_encabezado
+                else:
+                    hoja_nueva.append(list(primera))
+                    filas_copiadas += 1
+                    if self.escribir_encabezado:
+                        existentes = [valor for valor in primera if valor is not None]
+                        if self.encabezados and existentes != self.encabezados:
+                            raise ValueError(f"Las cabeceras del archivo existente no coinciden con las indicadas. "
+                                             f"Existentes: {existentes}. Indicadas: {self.encabezados}.")
+                        self.encabezados = existentes
+            for fila in filas:
+                hoja_nueva.append(list(fila))
+                filas_copiadas += 1
+        return filas_copiadas
+
+    def _validar_claves(self, registro: Dict[str, Any]) -> None:
+        claves = tuple(registro.keys())
+        if claves in self._claves_validadas:
+            return
+        if self.encabezados is None:
+            self.encabezados = list(claves)
+            if self._encabezado_pendiente:
+                self._hoja_destino.append(self.encabezados)
+                self._encabezado_pendiente = False
+        elif set(claves) != set(self.encabezados):
+            raise ValueError(f"Las claves del registro no coinciden con las cabeceras de la hoja '{self.hoja}'. "
+                             f"Cabeceras: {self.encabezados}. Claves: {list(claves)}.")
+        self._claves_validadas.add(claves)
+
+    def escribir(self, registro: Dict[str, Any]) -> None:
+        """Añade un registro (diccionario) al lote; el lote se envía a la hoja al llegar a `tamano_lote`."""
+        if self._workbook is None:
+            raise ValueError(f"La sesión de escritura Excel de '{self.ruta}' no está abierta.")
+        self._validar_claves(registro)
+        self._buffer.append([registro.get(encabezado) for encabezado in self.encabezados])
+        if len(self._buffer) >= self.tamano_lote:
+            self._enviar_lote()
+
+    def escribir_varios(self, registros: Iterable[Dict[str, Any]]) -> None:
+        """Añade varios registros a la sesión."""
+        for registro in registros:
+            self.escribir(registro)
+
+    def _enviar_lote(self) -> None:
+        """
+        Envía el lote pendiente a la hoja (openpyxl lo vuelca a su archivo temporal) y libera su memoria.
+        No guarda el libro: el archivo de destino solo se escribe en `cerrar()`.
+        """
+        for fila in self._buffer:
+            self._hoja_destino.append(fila)
+        self.filas_escritas += len(self._buffer)
+        self._buffer.clear()
+
+    def cerrar(self) -> None:
+        """Envía el último lote y guarda el libro de forma atómica (archivo temporal + reemplazo)."""
+        if self._workbook is None:
+            return
+        # --- Medición de rendimiento: guardado único del libro ---
+        start_time_guardado = time.time()
+        self._enviar_lote()
+        directorio = os.path.dirname(self.ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        ruta_temporal = f"{self.ruta}.{os.getpid()}.tmp.xlsx"
+        try:
+            self._workbook.save(ruta_temporal)
+            os.replace(ruta_temporal, self.ruta)
+        finally:
+            self._workbook = None
+            if os.path.exists(ruta_temporal):
+                os.remove(ruta_temporal)
+        duration_guardado = time.time() - start_time_guardado
+        logger.info(f"PERFORMANCE: Guardado de la sesión de escritura Excel '{self.ruta}' ({self.filas_escritas} filas nuevas): {duration_guardado:.4f} segundos.")
+
+    def __enter__(self) -> "SesionEscrituraExcel":
+        return self.abrir()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.cerrar()
+
+
+def ruta_por_worker(ruta: str) -> str:
+    """
+    Devuelve la ruta propia del worker de xdist actual ('<base>.gw0.csv') o la ruta original si no
+    se está ejecutando dentro de un worker.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        return ruta
+    base, extension = os.path.splitext(ruta)
+    return f"{base}.{worker}{extension}"
+
+
+def _registrar_pendiente_fusion(ruta: str) -> None:
+    """Anota la ruta en el manifiesto de archivos a fusionar al terminar la sesión (una línea por ruta)."""
+    os.makedirs(os.path.dirname(PENDIENTES_FUSION_CSV_FILE), exist_ok=True)
+    with open(PENDIENTES_FUSION_CSV_FILE, 'a', encoding='utf-8') as manifiesto:
+        manifiesto.write(os.path.abspath(ruta) + "\n")
+
+
+class SesionEscrituraCSV:
+    """
+    Sesión de escritura CSV: resuelve los encabezados una sola vez, mantiene el archivo abierto con un
+    `csv.DictWriter` y escribe los registros en lotes de `tamano_lote`.
+
+    Con `por_worker=True`, cada worker de xdist escribe en su propio archivo ('<base>.gwN.csv') y el
+    proceso controlador los fusiona en la ruta original al terminar la sesión de pytest
+    (`fusionar_archivos_por_worker`), de modo que los workers nunca escriben sobre el mismo archivo.
+
+    `cerrar()` es idempotente y no lanza excepciones, por lo que puede llamarse sin riesgo en el teardown de un fixture.
+    """
+
+    def __init__(self, ruta: str, encabezados: Optional[List[str]] = None, append: bool = True, escribir_encabezado: bool = True,
+                 tamano_lote: int = 500, delimiter: str = ',', por_worker: bool = False):
+        self.ruta_destino = ruta
+        self.ruta = ruta_por_worker(ruta) if por_worker else ruta
+        self.encabezados: Optional[List[str]] = list(encabezados) if encabezados else None
+        self.append = append
+        self.escribir_encabezado = escribir_encabezado
+        self.tamano_lote = tamano_lote
+        self.delimiter = delimiter
+        self.por_worker = por_worker and self.ruta != ruta
+        self.filas_escritas = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._claves_validadas: Set[Tuple[str, ...]] = set()
+        self._archivo = None
+        self._writer: Optional[csv.DictWriter] = None
+        self._encabezado_pendiente = False
+
+    def abrir(self) -> "SesionEscrituraCSV":
+        """Abre el archivo una sola vez; en modo `append` toma los encabezados de la primera línea existente."""
+        directorio = os.path.dirname(self.ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+        existe = self.append and os.path.exists(self.ruta) and os.path.getsize(self.ruta) > 0
+        if existe:
+            with open(self.ruta, 'r', newline='', encoding='utf-8') as archivo:
+                existentes = next(csv.reader(archivo, delimiter=self.delimiter), [])
+            if self.escribir_encabezado:
+                if self.encabezados and existentes != self.encabezados:
+                    raise ValueError(f"Las cabeceras del archivo existente no coinciden con las indicadas. "
+                                     f"Existentes: {existentes}. Indicadas: {self.encabezados}.")
+                self.encabezados = existentes
+
+        self._archivo = open(self.ruta, 'a' if existe else 'w', newline='', encoding='utf-8', buffering=1 << 16)
+        self._encabezado_pendiente = self.escribir_encabezado and not existe
+        if self.encabezados:
+            self._crear_writer()
+        if self.por_worker:
+            _registrar_pendiente_fusion(self.ruta_destino)
+        return self
+
+    def _crear_writer(self) -> None:
+        self._writer = csv.DictWriter(self._archivo, fieldnames=self.encabezados, delimiter=self.delimiter)
+        if self._encabezado_pendiente:
+            self._writer.writeheader()
+            self._encabezado_pendiente = False
+
+    def _validar_claves(self, registro: Dict[str, Any]) -> None:
+        """
+        Rechaza el registro si tiene claves que no están en los encabezados, antes de añadirlo al lote: así el
+        error se lanza en la llamada del registro culpable y no en la escritura de un lote posterior.
+        Las claves ausentes se escriben como celdas vacías (igual que `csv.DictWriter`).
+        """
+        claves = tuple(registro.keys())
+        if claves in self._claves_validadas:
+            return
+        sobrantes = [clave for clave in claves if clave not in self.encabezados]
+        if sobrantes:
+            raise ValueError(f"Las claves {sobrantes} del registro no están en las cabeceras de '{self.ruta}'. "
+                             f"Cabeceras: {self.encabezados}. Claves: {list(claves)}.")
+        self._claves_validadas.add(claves)
+
+    def escribir(self, registro: Dict[str, Any]) -> None:
+        """
+        Añade un registro al lote; el lote se escribe al llegar a `tamano_lote`.
+
+        Raises:
+            ValueError: Si la sesión no está abierta o el registro tiene claves fuera de los encabezados.
+        """
+        if self._archivo is None:
+            raise ValueError(f"La sesión de escritura CSV de '{self.ruta}' no está abierta.")
+        if self._writer is None:
+            self.encabezados = list(registro.keys())
+            self._crear_writer()
+        self._validar_claves(registro)
+        self._buffer.append(registro)
+        if len(self._buffer) >= self.tamano_lote:
+            self.vaciar()
+
+    def escribir_varios(self, registros: Iterable[Dict[str, Any]]) -> None:
+        """Añade varios registros a la sesión."""
+        for registro in registros:
+            self.escribir(registro)
+
+    def vaciar(self) -> None:
+        """
+        Escribe el lote pendiente y vacía el búfer del archivo al disco. El lote se descarta aunque la escritura
+        falle a medias, para que un reintento (o `cerrar()`) nunca repita filas ya escritas.
+        """
+        if not self._buffer or self._writer is None:
+            return
+        try:
+            self._writer.writerows(self._buffer)
+            self._archivo.flush()
+            self.filas_escritas += len(self._buffer)
+        finally:
+            self._buffer.clear()
+
+    def cerrar(self) -> None:
+        """Escribe el último lote y cierra el archivo. Es seguro llamarlo varias veces."""
+        if self._archivo is None:
+            return
+        try:
+            self.vaciar()
+        except (OSError, ValueError) as e:
+            logger.error(f"\n❌ No se pudieron escribir los registros pendientes en '{self.ruta}'. Detalles: {e}", exc_info=True)
+        finally:
+            self._archivo.close()
+            self._archivo = None
+        logger.debug(f"\nSesión de escritura CSV de '{self.ruta}' cerrada ({self.filas_escritas} filas).")
+
+    def __enter__(self) -> "SesionEscrituraCSV":
+        return self.abrir()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.cerrar()
+
+
+def fusionar_archivos_por_worker(ruta: str, delimiter: str = ',') -> int:
+    """
+    Fusiona los archivos '<base>.gwN.csv' en `ruta` (añadiendo al final si ya existe) y los elimina.
+    El encabezado se escribe una sola vez y se valida que todos los archivos compartan el mismo.
+
+    Returns:
+        int: Número de filas de datos fusionadas.
+    """
+    base, extension = os.path.splitext(ruta)
+    archivos_worker = sorted(glob.glob(f"{glob.escape(base)}.gw*{extension}"))
+    if not archivos_worker:
+        return 0
+
+    # --- Medición de rendimiento: fusión de archivos por worker ---
+    start_time_fusion = time.time()
+    filas_fusionadas = 0
+    existe = os.path.exists(ruta) and os.path.getsize(ruta) > 0
+    encabezado_destino: Optional[List[str]] = None
+    if existe:
+        with open(ruta, 'r', newline='', encoding='utf-8') as archivo:
+            encabezado_destino = next(csv.reader(archivo, delimiter=delimiter), None)
+
+    with open(ruta, 'a' if existe else 'w', newline='', encoding='utf-8') as destino:
+        writer = csv.writer(destino, delimiter=delimiter)
+        for archivo_worker in archivos_worker:
+            with open(archivo_worker, 'r', newline='', encoding='utf-8') as origen:
+                reader = csv.reader(origen, delimiter=delimiter)
+                encabezado = next(reader, None)
+                if encabezado is None:
+                    continue
+                if encabezado_destino is None:
+                    encabezado_destino = encabezado
+                    writer.writerow(encabezado)
+                elif encabezado != encabezado_destino:
+                    logger.error(f"\n❌ El archivo '{archivo_worker}' tiene cabeceras distintas ({encabezado}) a las de '{ruta}' ({encabezado_destino}). No se fusiona.")
+                    continue
+                for fila in reader:
+                    writer.writerow(fila)
+                    filas_fusionadas += 1
+            os.remove(archivo_worker)
+
+    duration_fusion = time.time() - start_time_fusion
+    logger.info(f"PERFORMANCE: Fusión de {len(archivos_worker)} archivos por worker en '{ruta}' ({filas_fusionadas} filas): {duration_fusion:.4f} segundos.")
+    return filas_fusionadas
+
+
+# --- Hooks del plugin ---
+
+def pytest_sessionfinish(session) -> None:
+    # Solo el proceso controlador (o la ejecución sin xdist) fusiona: los workers ya cerraron sus archivos.
+    if hasattr(session.config, "workerinput") or not os.path.exists(PENDIENTES_FUSION_CSV_FILE):
+        return
+    with open(PENDIENTES_FUSION_CSV_FILE, 'r', encoding='utf-8') as manifiesto:
+        rutas = list(dict.fromkeys(linea.strip() for linea in manifiesto if linea.strip()))
+    for ruta in rutas:
+        try:
+            fusionar_archivos_por_worker(ruta)
+        except (OSError, csv.Error) as e:
+            logger.error(f"\n❌ No se pudieron fusionar los archivos por worker de '{ruta}'. Detalles: {e}", exc_info=True)
+    os.remove(PENDIENTES_FUSION_CSV_FILE)
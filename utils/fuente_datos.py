@@ -0,0 +1,188 @@
+"""
+Caché columnar en disco de los archivos de datos (CSV/Excel) usados para parametrizar los tests.
+
+La primera lectura de un archivo lo parsea con pandas y guarda el resultado en formato binario columnar
+bajo `CACHE_FUENTES_DATOS_DIR`, con el hash del contenido del archivo en el nombre. Las lecturas siguientes
+(en la misma ejecución, en otros workers de xdist o en ejecuciones posteriores) cargan ese binario en lugar
+de volver a parsear el Excel o el CSV. Si el archivo fuente cambia, su hash cambia y se genera otra entrada.
+
+Formato de la caché:
+- Feather (Arrow IPC) si `pyarrow` está instalado: se lee con `memory_map=True`, sin copiar el archivo completo.
+- pickle del DataFrame en caso contrario (o si alguna columna no se puede representar en Arrow).
+
+`pyarrow` está fijado en requirements.txt; si falta en el entorno, la caché sigue funcionando con pickle.
+Los nombres de columna se convierten a texto al parsear, de modo que el DataFrame tiene las mismas columnas
+tanto si viene del parseo como de la caché (Feather o pickle).
+"""
+import os
+import time
+import pickle
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - depende del entorno
+    feather = None
+
+from utils.config import LOGGER_DIR, CACHE_FUENTES_DATOS_DIR
+from utils.hash_archivos import hash_archivo
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='fuente_datos',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+EXTENSIONES_EXCEL = (".xlsx", ".xlsm")
+EXTENSIONES_CSV = (".csv",)
+# Se incrementa si cambia la forma de parsear los archivos, para no reutilizar entradas antiguas.
+VERSION_CACHE = 2
+
+_memo: Dict[str, pd.DataFrame] = {}
+_lock_memo = threading.Lock()
+
+
+def formato_cache() -> str:
+    """Formato usado para las nuevas entradas de la caché: 'feather' si pyarrow está disponible, si no 'pickle'."""
+    return "feather" if feather is not None else "pickle"
+
+
+def _clave_cache(resumen: str, hoja: Optional[str], delimiter: str) -> str:
+    """Nombre base de la entrada: hash del contenido + opciones de lectura que alteran el resultado."""
+    variante = f"hoja-{hoja}" if hoja is not None else f"sep-{ord(delimiter)}"
+    variante = "".join(caracter if caracter.isalnum() or caracter in "-_" else "_" for caracter in variante)
+    return f"{resumen}-{variante}-v{VERSION_CACHE}"
+
+
+def _parsear_fuente(ruta: str, hoja: Optional[str], delimiter: str) -> pd.DataFrame:
+    """
+    Parsea el archivo fuente con pandas. Los CSV se leen como texto (igual que `csv.DictReader`) y los
+    Excel conservan los tipos de las celdas. Los nombres de columna se normalizan a texto (un encabezado
+    numérico de Excel, como 2024, pasa a ser '2024'), que es lo único que admite Feather.
+
+    Raises:
+        ValueError: Si la extensión no es de un CSV o un Excel.
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension in EXTENSIONES_CSV:
+        datos = pd.read_csv(ruta, sep=delimiter, dtype=str, keep_default_na=False, encoding='utf-8')
+    elif extension in EXTENSIONES_EXCEL:
+        datos = pd.read_excel(ruta, sheet_name=hoja if hoja is not None else 0, engine='openpyxl')
+    else:
+        raise ValueError(f"Extensión no soportada para la caché de fuentes de datos: '{extension}'.")
+    datos.columns = [str(columna) for columna in datos.columns]
+    return datos
+
+
+def _escribir_atomico(ruta_destino: str, escribir) -> None:
+    """Escribe en un archivo temporal del proceso y lo renombra, para que otro worker nunca lea una entrada a medias."""
+    ruta_temporal = f"{ruta_destino}.{os.getpid()}.tmp"
+    try:
+        escribir(ruta_temporal)
+        os.replace(ruta_temporal, ruta_destino)
+    finally:
+        if os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+
+
+def _guardar_en_cache(datos: pd.DataFrame, ruta_base: str) -> Optional[str]:
+    """Guarda el DataFrame en Feather (o pickle como alternativa). Devuelve la ruta escrita, o `None` si falló."""
+    if feather is not None:
+        try:
+            # Feather exige un índice por defecto (los nombres de columna ya son texto desde `_parsear_fuente`).
+            columnar = datos.reset_index(drop=True)
+            _escribir_atomico(f"{ruta_base}.feather", lambda destino: feather.write_feather(columnar, destino))
+            return f"{ruta_base}.feather"
+        except Exception as e:
+            logger.warning(f"\n⚠️ No se pudo guardar la caché en Feather ('{ruta_base}'). Se usará pickle. Detalles: {e}")
+    try:
+        _escribir_atomico(f"{ruta_base}.pkl", lambda destino: datos.to_pickle(destino))
+        return f"{ruta_base}.pkl"
+    except Exception as e:
+        logger.warning(f"\n⚠️ No se pudo guardar la caché de la fuente de datos '{ruta_base}'. Detalles: {e}")
+        return None
+
+
+def _cargar_de_cache(ruta_base: str) -> Optional[Tuple[pd.DataFrame, str]]:
+    """Carga la entrada de la caché si existe (Feather con mapeo en memoria o pickle)."""
+    ruta_feather = f"{ruta_base}.feather"
+    if feather is not None and os.path.exists(ruta_feather):
+        try:
+            return feather.read_table(ruta_feather, memory_map=True).to_pandas(), ruta_feather
+        except Exception as e:
+            logger.warning(f"\n⚠️ Entrada de caché Feather ilegible '{ruta_feather}'. Se regenerará. Detalles: {e}")
+    ruta_pickle = f"{ruta_base}.pkl"
+    if os.path.exists(ruta_pickle):
+        try:
+            with open(ruta_pickle, 'rb') as archivo:
+                return pickle.load(archivo), ruta_pickle
+        except Exception as e:
+            logger.warning(f"\n⚠️ Entrada de caché pickle ilegible '{ruta_pickle}'. Se regenerará. Detalles: {e}")
+    return None
+
+
+def cargar_fuente_datos(ruta: str, hoja: Optional[str] = None, delimiter: str = ',', directorio_cache: str = CACHE_FUENTES_DATOS_DIR) -> pd.DataFrame:
+    """
+    Devuelve el contenido de un archivo de datos como DataFrame, pasando por la caché columnar.
+
+    Args:
+        ruta (str): Ruta del archivo CSV o Excel.
+        hoja (Optional[str]): Hoja del Excel (por defecto la primera). Se ignora en los CSV.
+        delimiter (str): Separador del CSV. Por defecto es `,`.
+        directorio_cache (str): Directorio de las entradas de la caché.
+
+    Returns:
+        pd.DataFrame: Los datos (los llamadores no deben modificarlo: se comparte dentro del proceso).
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        ValueError: Si la extensión no está soportada.
+    """
+    ruta = os.path.abspath(ruta)
+    # --- Medición de rendimiento: resolución completa de la fuente (hash + caché o parseo) ---
+    start_time_fuente = time.time()
+    clave = _clave_cache(hash_archivo(ruta), hoja, delimiter)
+
+    with _lock_memo:
+        datos = _memo.get(clave)
+    if datos is not None:
+        return datos
+
+    ruta_base = os.path.join(directorio_cache, clave)
+    cargado = _cargar_de_cache(ruta_base)
+    if cargado is not None:
+        datos, ruta_cache = cargado
+        origen = f"caché '{os.path.basename(ruta_cache)}'"
+    else:
+        datos = _parsear_fuente(ruta, hoja, delimiter)
+        os.makedirs(directorio_cache, exist_ok=True)
+        ruta_cache = _guardar_en_cache(datos, ruta_base)
+        origen = f"parseo del archivo fuente (caché generada: '{ruta_cache}')"
+
+    with _lock_memo:
+        _memo[clave] = datos
+    duration_fuente = time.time() - start_time_fuente
+    logger.info(f"PERFORMANCE: Carga de la fuente de datos '{os.path.basename(ruta)}' ({len(datos)} filas) desde {origen}: {duration_fuente:.4f} segundos.")
+    return datos
+
+
+def cargar_registros(ruta: str, hoja: Optional[str] = None, delimiter: str = ',', directorio_cache: str = CACHE_FUENTES_DATOS_DIR) -> List[Dict[str, Any]]:
+    """
+    Igual que `cargar_fuente_datos`, pero devuelve una lista de diccionarios (una por fila), con las celdas
+    vacías como `None`. Cada llamada devuelve diccionarios nuevos, que el llamador puede modificar.
+    """
+    datos = cargar_fuente_datos(ruta, hoja=hoja, delimiter=delimiter, directorio_cache=directorio_cache)
+    registros = datos.astype(object).where(datos.notna(), None).to_dict(orient="records")
+    return registros
+
+
+def limpiar_memo() -> None:
+    """Descarta los DataFrames memorizados en el proceso (la caché en disco se conserva)."""
+    with _lock_memo:
+        _memo.clear()
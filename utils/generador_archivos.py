@@ -0,0 +1,178 @@
+"""
+Generador de archivos sintéticos en memoria para las pruebas de carga de archivos.
+
+Devuelve diccionarios con la forma de `FilePayload` de Playwright ({"name", "mimeType", "buffer"}), que se
+pasan directamente a `Locator.set_input_files()` sin escribir nada en disco. El contenido es determinista
+(depende solo de la especificación) y cada especificación se genera una sola vez por proceso: los tests que
+suben el mismo archivo grande reutilizan el mismo buffer.
+
+Playwright rechaza los buffers de más de 50 MB en `set_input_files` ("Cannot set buffer larger than 50Mb").
+`preparar_para_set_input_files` sustituye esos payloads por la ruta de un archivo temporal con el mismo nombre
+y contenido, escrito una sola vez por proceso en un directorio temporal que se borra al terminar la sesión.
+"""
+import os
+import time
+import atexit
+import random
+import shutil
+import hashlib
+import logging
+import tempfile
+import mimetypes
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple, Any, Optional, List, Union
+
+from utils.config import LOGGER_DIR
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='generador_archivos',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+# Límite de memoria de los buffers generados que se conservan (256 MiB). Se desalojan por LRU.
+MAX_BYTES_CACHE = 256 * 1024 * 1024
+TIPO_MIME_POR_DEFECTO = "application/octet-stream"
+# Tamaño máximo de un buffer que Playwright acepta en `set_input_files` (50 MB).
+LIMITE_BUFFER_PLAYWRIGHT = 50 * 1024 * 1024
+
+# Cabeceras ("magic numbers") para que el servidor reconozca el tipo por contenido y no solo por extensión.
+_CABECERAS_POR_TIPO = {
+    "image/png": b"\x89PNG\r\n\x1a\n",
+    "image/jpeg": b"\xff\xd8\xff\xe0\x00\x10JFIF\x00",
+    "image/gif": b"GIF89a",
+    "application/pdf": b"%PDF-1.4\n",
+    "application/zip": b"PK\x03\x04",
+}
+
+_buffers: "OrderedDict[Tuple[str, int, str, int], bytes]" = OrderedDict()
+_bytes_en_cache = 0
+_lock_buffers = threading.Lock()
+
+# Archivos temporales de los payloads que superan el límite de Playwright: (nombre, tipo, sha256) -> ruta.
+_rutas_temporales: Dict[Tuple[str, str, str], str] = {}
+_directorio_temporal: Optional[str] = None
+
+
+def _es_tipo_texto(tipo_mime: str) -> bool:
+    return tipo_mime.startswith("text/") or tipo_mime in ("application/json", "application/xml")
+
+
+def _generar_contenido(nombre: str, tamano_bytes: int, tipo_mime: str, semilla: int) -> bytes:
+    """Genera `tamano_bytes` bytes deterministas: líneas de texto para tipos de texto, bytes pseudoaleatorios para el resto."""
+    if _es_tipo_texto(tipo_mime):
+        linea = f"{nombre};linea de datos sintetica;semilla={semilla}\n".encode("utf-8")
+        repeticiones, resto = divmod(tamano_bytes, len(linea))
+        return linea * repeticiones + linea[:resto]
+    cabecera = _CABECERAS_POR_TIPO.get(tipo_mime, b"")[:tamano_bytes]
+    return cabecera + random.Random(semilla).randbytes(tamano_bytes - len(cabecera))
+
+
+def generar_archivo_sintetico(nombre: str, tamano_bytes: int, tipo_mime: Optional[str] = None, semilla: int = 0) -> Dict[str, Any]:
+    """
+    Devuelve un `FilePayload` sintético del tamaño y tipo indicados, generándolo solo la primera vez.
+
+    Args:
+        nombre (str): Nombre del archivo tal como lo verá la página (ej: 'grande.pdf').
+        tamano_bytes (int): Tamaño exacto del contenido en bytes.
+        tipo_mime (Optional[str]): Tipo MIME. Si es `None`, se deduce de la extensión del nombre.
+        semilla (int): Semilla del contenido, para obtener archivos distintos con la misma especificación.
+
+    Returns:
+        Dict[str, Any]: {"name": str, "mimeType": str, "buffer": bytes}.
+
+    Raises:
+        ValueError: Si el tamaño es negativo.
+    """
+    global _bytes_en_cache
+    if tamano_bytes < 0:
+        raise ValueError(f"El tamaño del archivo sintético no puede ser negativo: {tamano_bytes}.")
+    tipo_mime = tipo_mime or mimetypes.guess_type(nombre)[0] or TIPO_MIME_POR_DEFECTO
+    clave = (nombre, tamano_bytes, tipo_mime, semilla)
+
+    with _lock_buffers:
+        buffer = _buffers.get(clave)
+        if buffer is not None:
+            _buffers.move_to_end(clave)
+            return {"name": nombre, "mimeType": tipo_mime, "buffer": buffer}
+
+    # --- Medición de rendimiento: generación del buffer (solo en la primera petición de la especificación) ---
+    start_time_generacion = time.time()
+    buffer = _generar_contenido(nombre, tamano_bytes, tipo_mime, semilla)
+    duration_generacion = time.time() - start_time_generacion
+    logger.debug(f"PERFORMANCE: Generación del archivo sintético '{nombre}' ({tamano_bytes} bytes, {tipo_mime}): {duration_generacion:.4f} segundos.")
+
+    with _lock_buffers:
+        if clave not in _buffers:
+            _buffers[clave] = buffer
+            _bytes_en_cache += len(buffer)
+            while _bytes_en_cache > MAX_BYTES_CACHE and len(_buffers) > 1:
+                _, desalojado = _buffers.popitem(last=False)
+                _bytes_en_cache -= len(desalojado)
+    return {"name": nombre, "mimeType": tipo_mime, "buffer": buffer}
+
+
+def _ruta_temporal(payload: Dict[str, Any]) -> str:
+    """Escribe el payload en el directorio temporal de la sesión (solo la primera vez) y devuelve su ruta."""
+    global _directorio_temporal
+    nombre, buffer = payload["name"], payload["buffer"]
+    tipo_mime = payload.get("mimeType") or TIPO_MIME_POR_DEFECTO
+    clave = (nombre, tipo_mime, hashlib.sha256(buffer).hexdigest())
+
+    with _lock_buffers:
+        ruta = _rutas_temporales.get(clave)
+        if ruta is not None and os.path.exists(ruta):
+            return ruta
+        if _directorio_temporal is None:
+            _directorio_temporal = tempfile.mkdtemp(prefix="archivos_sinteticos_")
+            atexit.register(shutil.rmtree, _directorio_temporal, ignore_errors=True)
+        # Un subdirectorio por contenido: el archivo conserva su nombre, que es el que ve la página.
+        subdirectorio = os.path.join(_directorio_temporal, clave[2][:16])
+        os.makedirs(subdirectorio, exist_ok=True)
+        ruta = os.path.join(subdirectorio, os.path.basename(nombre))
+
+        start_time_escritura = time.time()
+        with open(ruta, "wb") as archivo:
+            archivo.write(buffer)
+        duration_escritura = time.time() - start_time_escritura
+        logger.debug(f"PERFORMANCE: Escritura del archivo temporal '{ruta}' ({len(buffer)} bytes): {duration_escritura:.4f} segundos.")
+        _rutas_temporales[clave] = ruta
+    return ruta
+
+
+def preparar_para_set_input_files(archivos: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], str]]:
+    """
+    Adapta una lista de `FilePayload` al límite de 50 MB por buffer de `set_input_files`.
+
+    Los payloads de hasta `LIMITE_BUFFER_PLAYWRIGHT` bytes se devuelven sin cambios; los mayores se sustituyen
+    por la ruta de un archivo temporal con el mismo nombre y contenido. Como Playwright no admite mezclar
+    buffers y rutas en una misma llamada, si algún payload supera el límite se convierten todos a rutas.
+    Con rutas, el tipo MIME lo deduce el navegador de la extensión del nombre.
+
+    Args:
+        archivos (List[Dict[str, Any]]): Payloads con la forma {"name", "mimeType", "buffer"}.
+
+    Returns:
+        List[Union[Dict[str, Any], str]]: Los mismos payloads, o sus rutas temporales si alguno supera el límite.
+    """
+    if all(len(archivo["buffer"]) <= LIMITE_BUFFER_PLAYWRIGHT for archivo in archivos):
+        return list(archivos)
+    logger.info(f"\nAlgún archivo supera el límite de {LIMITE_BUFFER_PLAYWRIGHT} bytes por buffer de Playwright: se adjuntará desde un archivo temporal.")
+    return [_ruta_temporal(archivo) for archivo in archivos]
+
+
+def limpiar_cache() -> None:
+    """Libera los buffers generados y borra los archivos temporales escritos para los payloads grandes."""
+    global _bytes_en_cache
+    with _lock_buffers:
+        _buffers.clear()
+        _bytes_en_cache = 0
+        for ruta in _rutas_temporales.values():
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+        _rutas_temporales.clear()
@@ -0,0 +1,223 @@
+"""
+Gestor de descargas que dispara varias descargas seguidas y las espera en paralelo.
+
+El navegador descarga los archivos de forma concurrente: `disparar()` solo espera a que cada descarga
+se inicie (no a que termine), así que N descargas tardan aproximadamente lo que la más lenta. Cada archivo
+terminado se verifica en un hilo aparte (hash sha256 leído por bloques y tamaño, sin cargarlo en memoria)
+mientras se espera al resto. Las descargas con contenido idéntico (mismo hash) se guardan una sola vez.
+
+Las métricas de cada descarga (bytes, segundos, MB/s, hash) se registran en el log y en
+`METRICAS_DESCARGAS_FILE` (JSON Lines).
+
+Nota: la API síncrona de Playwright no es segura entre hilos; los hilos solo leen archivos ya descargados
+y todas las llamadas a Playwright (`path()`, `save_as()`) se hacen desde el hilo principal.
+"""
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
+
+from playwright.sync_api import Page, Locator, Download, Error
+
+from utils.config import LOGGER_DIR, METRICAS_DESCARGAS_FILE
+from utils.escritores_datos import anexar_lineas_json
+from utils.hash_archivos import hash_archivo
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='gestor_descargas',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+# Hilos dedicados a calcular hashes de archivos descargados.
+MAX_HILOS_VERIFICACION = 4
+
+
+class ResultadoDescarga:
+    """Resultado y métricas de una descarga."""
+
+    __slots__ = ("nombre", "ruta", "bytes", "sha256", "segundos", "duplicado_de", "errores")
+
+    def __init__(self, nombre: str):
+        self.nombre = nombre
+        self.ruta: Optional[str] = None
+        self.bytes = 0
+        self.sha256: Optional[str] = None
+        self.segundos = 0.0
+        # Ruta del archivo ya guardado con el mismo contenido, si la descarga es un duplicado.
+        self.duplicado_de: Optional[str] = None
+        self.errores: List[str] = []
+
+    @property
+    def exitosa(self) -> bool:
+        return self.ruta is not None and not self.errores
+
+    @property
+    def mb_por_segundo(self) -> float:
+        return (self.bytes / (1024 * 1024)) / self.segundos if self.segundos > 0 else 0.0
+
+    def como_diccionario(self) -> Dict[str, Any]:
+        return {
+            "nombre": self.nombre,
+            "ruta": self.ruta,
+            "bytes": self.bytes,
+            "sha256": self.sha256,
+            "segundos": round(self.segundos, 4),
+            "mb_por_segundo": round(self.mb_por_segundo, 4),
+            "duplicado_de": self.duplicado_de,
+            "errores": self.errores,
+        }
+
+
+def _medir_archivo(ruta: str) -> Tuple[int, str]:
+    """Tamaño y sha256 de un archivo, leído por bloques (se ejecuta en un hilo de verificación)."""
+    return os.path.getsize(ruta), hash_archivo(ruta)
+
+
+class GestorDescargas:
+    """
+    Dispara y espera descargas de una página, verificando su integridad y eliminando duplicados.
+
+    Uso:
+        gestor = GestorDescargas(page, directorio_descargas)
+        gestor.disparar([locator_a, locator_b, locator_c])
+        resultados = gestor.esperar_todas(sha256_esperados={"informe.pdf": "ab12..."})
+    """
+
+    def __init__(self, page: Page, directorio_descargas: str, ruta_metricas: Optional[str] = METRICAS_DESCARGAS_FILE):
+        self.page = page
+        self.directorio_descargas = directorio_descargas
+        self.ruta_metricas = ruta_metricas
+        self._pendientes: List[Tuple[Download, float]] = []
+        # sha256 -> ruta del primer archivo guardado con ese contenido.
+        self._rutas_por_hash: Dict[str, str] = {}
+        # Rutas ya escritas por este gestor, para no sobrescribir un archivo con otro del mismo nombre.
+        self._rutas_guardadas: Set[str] = set()
+
+    def disparar(self, selectores: List[Union[str, Locator]], tiempo: Union[int, float] = 30.0) -> int:
+        """
+        Hace clic en cada selector y espera solo a que su descarga se inicie.
+
+        Args:
+            selectores (List[Union[str, Locator]]): Elementos que inician una descarga al hacer clic.
+            tiempo (Union[int, float]): Segundos máximos para que cada descarga se inicie.
+
+        Returns:
+            int: Número de descargas iniciadas y pendientes de esperar.
+
+        Raises:
+            TimeoutError: Si alguna descarga no se inicia a tiempo.
+        """
+        for selector in selectores:
+            locator = self.page.locator(selector) if isinstance(selector, str) else selector
+            inicio = time.time()
+            with self.page.expect_download(timeout=tiempo * 1000) as download_info:
+                locator.click()
+            self._pendientes.append((download_info.value, inicio))
+            logger.debug(f"\nDescarga iniciada desde '{selector}': '{download_info.value.suggested_filename}'.")
+        return len(self._pendientes)
+
+    def esperar_todas(self, sha256_esperados: Optional[Dict[str, str]] = None, tamanos_esperados: Optional[Dict[str, int]] = None) -> List[ResultadoDescarga]:
+        """
+        Espera a que terminen las descargas pendientes, las verifica y guarda en `directorio_descargas`.
+
+        Args:
+            sha256_esperados (Optional[Dict[str, str]]): Nombre sugerido del archivo -> sha256 esperado.
+            tamanos_esperados (Optional[Dict[str, int]]): Nombre sugerido del archivo -> tamaño esperado en bytes.
+
+        Returns:
+            List[ResultadoDescarga]: Un resultado por descarga, en el orden en que se dispararon.
+        """
+        sha256_esperados = sha256_esperados or {}
+        tamanos_esperados = tamanos_esperados or {}
+        pendientes, self._pendientes = self._pendientes, []
+        os.makedirs(self.directorio_descargas, exist_ok=True)
+
+        # --- Medición de rendimiento: espera y verificación del lote completo ---
+        start_time_lote = time.time()
+        verificaciones: List[Tuple[Download, ResultadoDescarga, Optional[Future]]] = []
+        with ThreadPoolExecutor(max_workers=MAX_HILOS_VERIFICACION) as hilos:
+            # 1. Esperar cada descarga (el navegador las completa en paralelo) y verificar en segundo plano.
+            for download, inicio in pendientes:
+                resultado = ResultadoDescarga(download.suggested_filename)
+                try:
+                    ruta_temporal = download.path()  # Bloquea hasta que la descarga termina.
+                    fallo = download.failure()
+                except Error as e:
+                    ruta_temporal, fallo = None, str(e)
+                # Cota superior si la descarga terminó mientras se esperaba a una anterior.
+                resultado.segundos = time.time() - inicio
+                if fallo or ruta_temporal is None:
+                    resultado.errores.append(f"La descarga falló: {fallo}")
+                    verificaciones.append((download, resultado, None))
+                    continue
+                verificaciones.append((download, resultado, hilos.submit(_medir_archivo, str(ruta_temporal))))
+
+            # 2. Comprobar integridad, eliminar duplicados y guardar (llamadas a Playwright en el hilo principal).
+            for download, resultado, verificacion in verificaciones:
+                if verificacion is None:
+                    continue
+                try:
+                    resultado.bytes, resultado.sha256 = verificacion.result()
+                except OSError as e:
+                    resultado.errores.append(f"No se pudo leer el archivo descargado para verificarlo: {e}")
+                    continue
+                self._comprobar(resultado, sha256_esperados.get(resultado.nombre), tamanos_esperados.get(resultado.nombre))
+                try:
+                    self._guardar(download, resultado)
+                except (Error, OSError) as e:
+                    resultado.errores.append(f"No se pudo guardar el archivo descargado: {e}")
+
+        duration_lote = time.time() - start_time_lote
+        resultados = [resultado for _, resultado, _ in verificaciones]
+        for resultado in resultados:
+            self._registrar(resultado)
+        total_bytes = sum(resultado.bytes for resultado in resultados)
+        logger.info(f"PERFORMANCE: Espera y verificación de {len(resultados)} descargas ({total_bytes} bytes): {duration_lote:.4f} segundos.")
+        return resultados
+
+    def _comprobar(self, resultado: ResultadoDescarga, sha256_esperado: Optional[str], tamano_esperado: Optional[int]) -> None:
+        if resultado.bytes == 0:
+            resultado.errores.append("El archivo descargado está vacío.")
+        if tamano_esperado is not None and resultado.bytes != tamano_esperado:
+            resultado.errores.append(f"Tamaño {resultado.bytes} bytes, se esperaban {tamano_esperado}.")
+        if sha256_esperado is not None and resultado.sha256 != sha256_esperado.lower():
+            resultado.errores.append(f"sha256 {resultado.sha256} no coincide con el esperado {sha256_esperado}.")
+
+    def _guardar(self, download: Download, resultado: ResultadoDescarga) -> None:
+        """
+        Guarda el archivo salvo que ya exista uno con el mismo contenido (en ese caso se reutiliza su ruta).
+        Si el nombre sugerido ya se usó para otro contenido, el archivo se guarda como '<nombre>_<sha256[:12]><ext>'.
+        """
+        existente = self._rutas_por_hash.get(resultado.sha256)
+        if existente is not None:
+            resultado.ruta = existente
+            resultado.duplicado_de = existente
+            logger.info(f"\nℹ️ '{resultado.nombre}' tiene el mismo contenido que '{existente}'. No se guarda otra copia.")
+            return
+        ruta_destino = os.path.join(self.directorio_descargas, resultado.nombre)
+        if ruta_destino in self._rutas_guardadas:
+            # Mismo nombre sugerido pero distinto contenido: se distingue con el prefijo del hash en lugar de
+            # sobrescribir el archivo al que ya apunta `_rutas_por_hash`.
+            base, extension = os.path.splitext(resultado.nombre)
+            ruta_destino = os.path.join(self.directorio_descargas, f"{base}_{resultado.sha256[:12]}{extension}")
+            logger.info(f"\nℹ️ Ya se guardó otro '{resultado.nombre}' con contenido distinto. Esta descarga se guarda como '{ruta_destino}'.")
+        download.save_as(ruta_destino)
+        resultado.ruta = ruta_destino
+        self._rutas_por_hash[resultado.sha256] = ruta_destino
+        self._rutas_guardadas.add(ruta_destino)
+
+    def _registrar(self, resultado: ResultadoDescarga) -> None:
+        if resultado.errores:
+            logger.error(f"\n❌ Descarga '{resultado.nombre}' no válida: {'; '.join(resultado.errores)}")
+        else:
+            logger.info(f"\n✅ Descarga '{resultado.nombre}' verificada (sha256: {resultado.sha256}).")
+        logger.info(f"PERFORMANCE: Descarga '{resultado.nombre}': {resultado.bytes} bytes en {resultado.segundos:.4f} segundos ({resultado.mb_por_segundo:.2f} MB/s).")
+        if self.ruta_metricas:
+            try:
+                anexar_lineas_json(self.ruta_metricas, [resultado.como_diccionario()])
+            except OSError as e:
+                logger.warning(f"\n⚠️ No se pudieron guardar las métricas de la descarga '{resultado.nombre}'. Detalles: {e}")
@@ -0,0 +1,279 @@
+"""
+Grabación y reproducción de tráfico HAR para ejecutar las suites de UI contra una copia local del entorno.
+
+Modos (opción `--har` o variable de entorno `HAR_MODO`):
+- 'grabar': cada contexto graba sus respuestas con `context.route_from_har(update=True)` en un archivo propio
+  del test (subdirectorio `SUBDIRECTORIO_PARTES`), que Playwright escribe al cerrar el contexto. Si el test pasa, la parte se
+  publica como grabación junto a un manifiesto ('<nombre>.json') con la fecha, la BASE_URL y el ambiente; si
+  falla, solo se borra su propia parte.
+- 'reproducir': las respuestas se sirven desde el HAR sin salir a la red. Con `--har-estricto` las solicitudes
+  que no están en la grabación se abortan (`not_found="abort"`); sin él, salen a la red (`"fallback"`).
+- sin modo: no se intercepta nada.
+
+Por defecto hay una grabación por test (nodeid) y dispositivo. Los tests que comparten un mismo flujo de
+páginas pueden compartir grabación con el marcador `@pytest.mark.har("home")`: cada test graba su parte y,
+al terminar la sesión, el proceso controlador (nunca los workers de xdist, que podrían escribir a la vez)
+fusiona las partes del flujo en un único HAR con las entradas de todos ellos.
+
+Una grabación está obsoleta si tiene más de `--har-max-dias` días o si se grabó contra otra BASE_URL. En
+modo reproducir, una grabación obsoleta o inexistente genera una advertencia y la prueba va a la red; con
+`--har-estricto` la prueba falla. La reproducción con el perfil 'benchmark' mide el coste del propio
+framework sin la latencia del servidor.
+"""
+import os
+import re
+import glob
+import json
+import shutil
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+import pytest
+from playwright.sync_api import BrowserContext
+
+from utils.config import LOGGER_DIR, HAR_DIR, BASE_URL, AMBIENTE
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='grabacion_har',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+VARIABLE_ENTORNO_MODO = "HAR_MODO"
+VARIABLE_ENTORNO_ESTRICTO = "HAR_ESTRICTO"
+VARIABLE_ENTORNO_MAX_DIAS = "HAR_MAX_DIAS"
+MODOS_HAR = ("grabar", "reproducir")
+NOMBRE_MARCADOR = "har"
+MAX_DIAS_POR_DEFECTO = 7
+# Partes grabadas por cada test antes de publicarse (tests sueltos) o fusionarse (flujos compartidos).
+SUBDIRECTORIO_PARTES = "_partes"
+
+
+def _nombre_archivo(texto: str) -> str:
+    """Convierte un nodeid o nombre de flujo en un nombre de archivo válido."""
+    return re.sub(r"[^\w.-]+", "_", texto).strip("_")
+
+
+def modo_har() -> Optional[str]:
+    """Modo HAR activo ('grabar', 'reproducir') o `None` si no se graba ni reproduce."""
+    modo = (os.getenv(VARIABLE_ENTORNO_MODO) or "").strip().lower()
+    if not modo:
+        return None
+    if modo not in MODOS_HAR:
+        raise ValueError(f"\nEl modo HAR '{modo}' no existe. Modos disponibles: {MODOS_HAR}.")
+    return modo
+
+
+def leer_manifiesto(ruta_har: str) -> Optional[Dict[str, Any]]:
+    """Lee el manifiesto de una grabación, o `None` si no existe o no se puede leer."""
+    ruta_manifiesto = os.path.splitext(ruta_har)[0] + ".json"
+    try:
+        with open(ruta_manifiesto, 'r', encoding='utf-8') as archivo:
+            return json.load(archivo)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def motivo_obsolescencia(ruta_har: str, max_dias: int = MAX_DIAS_POR_DEFECTO) -> Optional[str]:
+    """
+    Comprueba si una grabación se puede reproducir.
+
+    Returns:
+        Optional[str]: El motivo por el que la grabación no sirve (inexistente, antigua o de otra BASE_URL),
+                       o `None` si está vigente.
+    """
+    if not os.path.exists(ruta_har):
+        return f"no existe la grabación '{ruta_har}'"
+    manifiesto = leer_manifiesto(ruta_har) or {}
+    grabado = manifiesto.get("grabado")
+    fecha = datetime.fromisoformat(grabado) if grabado else datetime.fromtimestamp(os.path.getmtime(ruta_har))
+    if datetime.now() - fecha > timedelta(days=max_dias):
+        return f"la grabación es del {fecha:%Y-%m-%d} (más de {max_dias} días)"
+    if manifiesto.get("base_url") and manifiesto["base_url"] != BASE_URL:
+        return f"la grabación es de '{manifiesto['base_url']}' y la BASE_URL actual es '{BASE_URL}'"
+    return None
+
+
+def _escribir_manifiesto(ruta_har: str) -> None:
+    manifiesto = {"grabado": datetime.now().isoformat(timespec="seconds"), "base_url": BASE_URL, "ambiente": AMBIENTE}
+    with open(os.path.splitext(ruta_har)[0] + ".json", 'w', encoding='utf-8') as archivo:
+        json.dump(manifiesto, archivo, indent=2)
+
+
+def fusionar_partes_har(partes: List[str], ruta_destino: str) -> int:
+    """
+    Fusiona varios HAR (grabados con el contenido embebido) en uno solo y lo escribe de forma atómica.
+    Las entradas repetidas (mismo método, URL y cuerpo de la solicitud) se guardan una sola vez.
+
+    Returns:
+        int: Número de entradas del HAR resultante.
+    """
+    base: Optional[Dict[str, Any]] = None
+    entradas: List[Dict[str, Any]] = []
+    paginas: Dict[str, Dict[str, Any]] = {}
+    vistas = set()
+    for ruta in sorted(partes):
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            har = json.load(archivo)
+        log = har.get("log", {})
+        if base is None:
+            base = har
+        for pagina in log.get("pages", []):
+            paginas.setdefault(pagina.get("id"), pagina)
+        for entrada in log.get("entries", []):
+            solicitud = entrada.get("request", {})
+            clave = (solicitud.get("method"), solicitud.get("url"), (solicitud.get("postData") or {}).get("text"))
+            if clave not in vistas:
+                vistas.add(clave)
+                entradas.append(entrada)
+    if base is None:
+        return 0
+    base["log"]["entries"] = entradas
+    base["log"]["pages"] = list(paginas.values())
+    ruta_temporal = f"{ruta_destino}.{os.getpid()}.tmp"
+    with open(ruta_temporal, 'w', encoding='utf-8') as archivo:
+        json.dump(base, archivo)
+    os.replace(ruta_temporal, ruta_destino)
+    return len(entradas)
+
+
+class GrabacionHar:
+    """Grabación o reproducción HAR de un contexto (un test o flujo en un dispositivo)."""
+
+    def __init__(self, nombre: str, modo: str, estricto: bool = False, max_dias: int = MAX_DIAS_POR_DEFECTO,
+                 directorio: str = HAR_DIR, parte: Optional[str] = None, flujo: bool = False):
+        self.nombre = _nombre_archivo(nombre)
+        self.modo = modo
+        self.estricto = estricto
+        self.max_dias = max_dias
+        self.flujo = flujo
+        self.ruta = os.path.join(directorio, f"{self.nombre}.har")
+        # Archivo propio del test en el que se graba (único por test y proceso aunque varios tests compartan flujo).
+        # Las partes de un flujo van en un subdirectorio con su nombre, que es lo que se fusiona al final.
+        nombre_parte = f"{_nombre_archivo(parte or nombre)}.{os.getpid()}.har"
+        directorio_partes = os.path.join(directorio, SUBDIRECTORIO_PARTES, self.nombre) if flujo else os.path.join(directorio, SUBDIRECTORIO_PARTES)
+        self.ruta_parte = os.path.join(directorio_partes, nombre_parte)
+
+    def aplicar(self, context: BrowserContext) -> None:
+        """
+        Registra la grabación o la reproducción en el contexto. Debe llamarse antes de aplicar el perfil
+        de red, para que este se evalúe primero (Playwright evalúa antes las rutas registradas después).
+
+        Raises:
+            pytest.fail.Exception: En modo reproducir estricto, si la grabación no existe o está obsoleta.
+        """
+        if self.modo == "grabar":
+            os.makedirs(os.path.dirname(self.ruta_parte), exist_ok=True)
+            context.route_from_har(self.ruta_parte, update=True, update_content="embed", update_mode="minimal")
+            logger.debug(f"\nGrabando el tráfico del contexto en '{self.ruta_parte}'.")
+            return
+
+        motivo = motivo_obsolescencia(self.ruta, self.max_dias)
+        if motivo:
+            if self.estricto:
+                pytest.fail(f"Reproducción HAR estricta imposible: {motivo}. Vuelve a grabar con '--har grabar'.")
+            logger.warning(f"\n⚠️ No se reproduce la grabación HAR '{self.nombre}' ({motivo}). El test usará la red.")
+            return
+        context.route_from_har(self.ruta, not_found="abort" if self.estricto else "fallback")
+        logger.debug(f"\nReproduciendo el tráfico del contexto desde '{self.ruta}' (estricto: {self.estricto}).")
+
+    def finalizar(self, fallido: bool) -> None:
+        """
+        Tras cerrar el contexto (momento en que Playwright escribe el HAR) decide qué hacer con la parte
+        grabada por este test: si falló se descarta (solo la suya); si pasó, un test suelto la publica como
+        su grabación y un flujo compartido la deja para la fusión del final de la sesión.
+        """
+        if self.modo != "grabar" or not os.path.exists(self.ruta_parte):
+            return
+        if fallido:
+            os.remove(self.ruta_parte)
+            logger.warning(f"\n⚠️ Parte de la grabación HAR '{self.nombre}' descartada porque el test falló.")
+            return
+        if self.flujo:
+            logger.debug(f"\nParte de la grabación HAR del flujo '{self.nombre}' lista para fusionar: '{self.ruta_parte}'.")
+            return
+        os.replace(self.ruta_parte, self.ruta)
+        _escribir_manifiesto(self.ruta)
+        logger.info(f"\nGrabación HAR guardada: '{self.ruta}' ({os.path.getsize(self.ruta)} bytes).")
+
+
+def fusionar_flujos_pendientes(directorio: str = HAR_DIR) -> None:
+    """Fusiona las partes de cada flujo compartido en su grabación y elimina las partes ya fusionadas."""
+    for directorio_flujo in sorted(glob.glob(os.path.join(directorio, SUBDIRECTORIO_PARTES, "*"))):
+        if not os.path.isdir(directorio_flujo):
+            continue
+        partes = glob.glob(os.path.join(directorio_flujo, "*.har"))
+        nombre = os.path.basename(directorio_flujo)
+        if partes:
+            ruta_destino = os.path.join(directorio, f"{nombre}.har")
+            try:
+                entradas = fusionar_partes_har(partes, ruta_destino)
+                _escribir_manifiesto(ruta_destino)
+                logger.info(f"\nGrabación HAR del flujo '{nombre}': {len(partes)} partes fusionadas ({entradas} entradas) en '{ruta_destino}'.")
+            except (OSError, json.JSONDecodeError, KeyError) as e:
+                logger.error(f"\n❌ No se pudieron fusionar las partes HAR del flujo '{nombre}'. Se conservan en '{directorio_flujo}'. Detalles: {e}")
+                continue
+        shutil.rmtree(directorio_flujo, ignore_errors=True)
+
+
+def crear_grabacion_har(nodeid: str, id_dispositivo: str, marcador: Optional[pytest.Mark] = None) -> Optional[GrabacionHar]:
+    """
+    Crea la grabación HAR del test según el modo activo, o `None` si no hay modo HAR.
+
+    Args:
+        nodeid (str): Nodeid del test (incluye la parametrización del dispositivo).
+        id_dispositivo (str): Id del navegador/dispositivo, usado con los flujos compartidos.
+        marcador (Optional[pytest.Mark]): Marcador `har` del test, si lo tiene.
+    """
+    modo = modo_har()
+    if modo is None:
+        return None
+    flujo = marcador is not None and bool(marcador.args)
+    nombre = f"{marcador.args[0]}__{id_dispositivo}" if flujo else nodeid
+    return GrabacionHar(
+        nombre,
+        modo,
+        estricto=os.getenv(VARIABLE_ENTORNO_ESTRICTO) == "1",
+        max_dias=int(os.getenv(VARIABLE_ENTORNO_MAX_DIAS) or MAX_DIAS_POR_DEFECTO),
+        parte=nodeid,
+        flujo=flujo,
+    )
+
+
+# --- Hooks del plugin ---
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("grabacion_har", "Grabación y reproducción HAR")
+    group.addoption("--har", action="store", default=None, choices=list(MODOS_HAR),
+                    help=f"Graba el tráfico de cada test en HAR o lo reproduce sin red. También: variable {VARIABLE_ENTORNO_MODO}.")
+    group.addoption("--har-estricto", action="store_true", default=False,
+                    help="En modo reproducir, aborta las solicitudes que no están grabadas y falla si la grabación falta o está obsoleta.")
+    group.addoption("--har-max-dias", action="store", type=int, default=None,
+                    help=f"Antigüedad máxima (días) de una grabación reproducible. Por defecto, {MAX_DIAS_POR_DEFECTO}.")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        f"{NOMBRE_MARCADOR}(flujo): comparte la grabación HAR 'flujo' entre los tests que recorren las mismas páginas."
+    )
+    # Las opciones se propagan por variables de entorno para que las hereden los workers de xdist.
+    if config.getoption("--har"):
+        os.environ[VARIABLE_ENTORNO_MODO] = config.getoption("--har")
+    if config.getoption("--har-estricto"):
+        os.environ[VARIABLE_ENTORNO_ESTRICTO] = "1"
+    if config.getoption("--har-max-dias") is not None:
+        os.environ[VARIABLE_ENTORNO_MAX_DIAS] = str(config.getoption("--har-max-dias"))
+    modo = modo_har()
+    if modo:
+        logger.info(f"\nModo HAR activo: '{modo}' (estricto: {os.getenv(VARIABLE_ENTORNO_ESTRICTO) == '1'}).")
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    # Solo el proceso controlador (o la ejecución sin xdist) fusiona: los workers ya cerraron sus contextos.
+    if hasattr(session.config, "workerinput") or modo_har() != "grabar":
+        return
+    fusionar_flujos_pendientes()
@@ -0,0 +1,54 @@
+"""
+Cálculo del hash de contenido de archivos, leyendo por bloques para no cargar el archivo completo en memoria.
+
+Los resultados se memorizan por proceso con la firma del archivo (mtime en ns + tamaño), de modo que
+consultar el hash de un archivo que no ha cambiado no vuelve a leerlo.
+"""
+import os
+import hashlib
+import threading
+from typing import Dict, Tuple, Union
+
+# Tamaño de bloque de lectura (1 MiB).
+TAMANO_BLOQUE_HASH = 1024 * 1024
+
+_hashes: Dict[Tuple[str, str], Tuple[Tuple[int, int], str]] = {}
+_lock_hashes = threading.Lock()
+
+
+def hash_bytes(contenido: Union[bytes, bytearray, memoryview], algoritmo: str = "sha256") -> str:
+    """Devuelve el hash hexadecimal de un contenido en memoria."""
+    return hashlib.new(algoritmo, contenido).hexdigest()
+
+
+def hash_archivo(ruta: str, algoritmo: str = "sha256", tamano_bloque: int = TAMANO_BLOQUE_HASH) -> str:
+    """
+    Devuelve el hash hexadecimal del contenido del archivo, reutilizando el último cálculo si el archivo no cambió.
+
+    Args:
+        ruta (str): Ruta del archivo.
+        algoritmo (str): Algoritmo de `hashlib` (por defecto 'sha256').
+        tamano_bloque (int): Bytes leídos en cada iteración.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+    """
+    ruta = os.path.abspath(ruta)
+    estado = os.stat(ruta)
+    firma = (estado.st_mtime_ns, estado.st_size)
+    clave = (ruta, algoritmo)
+
+    with _lock_hashes:
+        entrada = _hashes.get(clave)
+        if entrada is not None and entrada[0] == firma:
+            return entrada[1]
+
+    calculador = hashlib.new(algoritmo)
+    with open(ruta, 'rb') as archivo:
+        for bloque in iter(lambda: archivo.read(tamano_bloque), b''):
+            calculador.update(bloque)
+    resumen = calculador.hexdigest()
+
+    with _lock_hashes:
+        _hashes[clave] = (firma, resumen)
+    return resumen
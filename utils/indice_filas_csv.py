@@ -0,0 +1,179 @@
+"""
+Índice de desplazamientos (byte offset) de las filas de un archivo CSV para acceso aleatorio.
+
+El índice se construye en una sola pasada sobre el archivo mapeado en memoria (`mmap`), buscando los
+saltos de línea que no están dentro de un campo entre comillas. Con él, leer la fila N es un `seek`
+directo a su posición y el número de filas es la longitud del índice.
+
+Los índices se guardan en una caché del proceso y se invalidan cuando cambia la firma del archivo
+(mtime en ns + tamaño). Opcionalmente (variable de entorno `INDICE_CSV_PERSISTENTE`) el índice se
+persiste junto al archivo como `<archivo>.idx`, para reutilizarlo entre ejecuciones y workers.
+"""
+import io
+import os
+import csv
+import mmap
+import time
+import array
+import struct
+import logging
+import threading
+from typing import Dict, List, Tuple, Optional
+
+from utils.config import LOGGER_DIR
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='indice_filas_csv',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+VARIABLE_ENTORNO_PERSISTENTE = "INDICE_CSV_PERSISTENTE"
+EXTENSION_INDICE = ".idx"
+# Cabecera del archivo .idx: mtime en ns y tamaño del CSV indexado (enteros sin signo de 64 bits).
+_CABECERA_INDICE = struct.Struct("<QQ")
+
+
+def indice_persistente_activo() -> bool:
+    """Indica si los índices deben persistirse junto al CSV (variable de entorno `INDICE_CSV_PERSISTENTE`)."""
+    return os.getenv(VARIABLE_ENTORNO_PERSISTENTE, "").strip().lower() in ("1", "true", "si", "sí", "yes")
+
+
+def _firma_archivo(ruta: str) -> Tuple[int, int]:
+    estado = os.stat(ruta)
+    return estado.st_mtime_ns, estado.st_size
+
+
+class IndiceFilasCSV:
+    """Posición en bytes del inicio de cada fila física de un CSV (la fila 0 es el encabezado, si existe)."""
+
+    def __init__(self, ruta: str, firma: Tuple[int, int], desplazamientos: "array.array"):
+        self.ruta = ruta
+        self.firma = firma
+        self.desplazamientos = desplazamientos
+
+    @property
+    def num_filas(self) -> int:
+        """Número de filas físicas del archivo (O(1))."""
+        return len(self.desplazamientos)
+
+    def leer_fila(self, indice_fila: int, delimiter: str = ',') -> Optional[List[str]]:
+        """
+        Lee y parsea una fila física (basada en 0) saltando directamente a su posición en el archivo.
+
+        Returns:
+            Optional[List[str]]: Los campos de la fila, o `None` si el índice está fuera de rango.
+        """
+        if not (0 <= indice_fila < self.num_filas):
+            return None
+        inicio = self.desplazamientos[indice_fila]
+        fin = self.desplazamientos[indice_fila + 1] if indice_fila + 1 < self.num_filas else self.firma[1]
+        with open(self.ruta, 'rb') as archivo:
+            archivo.seek(inicio)
+            contenido = archivo.read(fin - inicio).decode('utf-8')
+        return next(csv.reader(io.StringIO(contenido, newline=''), delimiter=delimiter), [])
+
+
+def construir_desplazamientos(ruta: str) -> "array.array":
+    """
+    Recorre el archivo una vez con `mmap` y devuelve la posición de inicio de cada fila.
+    Un salto de línea solo termina una fila si hay un número par de comillas acumuladas desde el inicio
+    de la fila (las comillas escapadas "" no alteran la paridad).
+    """
+    desplazamientos = array.array('Q')
+    if os.path.getsize(ruta) == 0:
+        return desplazamientos
+
+    with open(ruta, 'rb') as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as datos:
+        tamano = len(datos)
+        desplazamientos.append(0)
+        posicion = 0
+        dentro_de_comillas = False
+        while True:
+            salto = datos.find(b'\n', posicion)
+            if salto == -1:
+                break
+            if datos[posicion:salto].count(b'"') % 2:
+                dentro_de_comillas = not dentro_de_comillas
+            posicion = salto + 1
+            if not dentro_de_comillas and posicion < tamano:
+                desplazamientos.append(posicion)
+    return desplazamientos
+
+
+def _ruta_indice(ruta: str) -> str:
+    return f"{ruta}{EXTENSION_INDICE}"
+
+
+def _cargar_indice_persistido(ruta: str, firma: Tuple[int, int]) -> Optional["array.array"]:
+    """Carga el archivo .idx si existe y corresponde a la versión actual del CSV."""
+    ruta_indice = _ruta_indice(ruta)
+    if not os.path.exists(ruta_indice):
+        return None
+    try:
+        with open(ruta_indice, 'rb') as archivo:
+            if _CABECERA_INDICE.unpack(archivo.read(_CABECERA_INDICE.size)) != firma:
+                logger.debug(f"\nEl índice persistido '{ruta_indice}' está desactualizado. Se reconstruirá.")
+                return None
+            desplazamientos = array.array('Q')
+            desplazamientos.frombytes(archivo.read())
+            return desplazamientos
+    except (OSError, struct.error, ValueError) as e:
+        logger.warning(f"\n⚠️ No se pudo leer el índice persistido '{ruta_indice}'. Se reconstruirá. Detalles: {e}")
+        return None
+
+
+def _persistir_indice(ruta: str, firma: Tuple[int, int], desplazamientos: "array.array") -> None:
+    """Escribe el índice junto al CSV de forma atómica."""
+    ruta_indice = _ruta_indice(ruta)
+    ruta_temporal = f"{ruta_indice}.{os.getpid()}.tmp"
+    try:
+        with open(ruta_temporal, 'wb') as archivo:
+            archivo.write(_CABECERA_INDICE.pack(*firma))
+            desplazamientos.tofile(archivo)
+        os.replace(ruta_temporal, ruta_indice)
+    except OSError as e:
+        logger.warning(f"\n⚠️ No se pudo persistir el índice '{ruta_indice}'. Detalles: {e}")
+
+
+_indices: Dict[str, IndiceFilasCSV] = {}
+_lock_indices = threading.Lock()
+
+
+def obtener_indice_csv(ruta: str, persistir: Optional[bool] = None) -> IndiceFilasCSV:
+    """
+    Devuelve el índice de filas del CSV, construyéndolo solo si no existe o si el archivo cambió.
+
+    Args:
+        ruta (str): Ruta del archivo CSV.
+        persistir (Optional[bool]): Si es `True`, usa/escribe el archivo `<ruta>.idx`. Si es `None`,
+                                    se decide con la variable de entorno `INDICE_CSV_PERSISTENTE`.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+    """
+    ruta = os.path.abspath(ruta)
+    firma = _firma_archivo(ruta)
+    persistir = indice_persistente_activo() if persistir is None else persistir
+
+    with _lock_indices:
+        indice = _indices.get(ruta)
+        if indice is not None and indice.firma == firma:
+            return indice
+
+    desplazamientos = _cargar_indice_persistido(ruta, firma) if persistir else None
+    if desplazamientos is None:
+        # --- Medición de rendimiento: construcción del índice (una pasada sobre el archivo) ---
+        start_time_indice = time.time()
+        desplazamientos = construir_desplazamientos(ruta)
+        duration_indice = time.time() - start_time_indice
+        logger.info(f"PERFORMANCE: Construcción del índice de filas de '{ruta}' ({len(desplazamientos)} filas): {duration_indice:.4f} segundos.")
+        if persistir:
+            _persistir_indice(ruta, firma, desplazamientos)
+
+    indice = IndiceFilasCSV(ruta, firma, desplazamientos)
+    with _lock_indices:
+        _indices[ruta] = indice
+    return indice
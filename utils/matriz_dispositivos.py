@@ -0,0 +1,153 @@
+"""
+Matriz de ejecución navegador/dispositivo y pool de navegadores reutilizables.
+
+La matriz se declara por configuración en lugar de comentar/descomentar entradas en conftest.py:
+
+- Por defecto se usa `MATRIZ_POR_DEFECTO`.
+- La variable de entorno `MATRIZ_DISPOSITIVOS` permite sobrescribirla con:
+    * La ruta a un archivo JSON con una lista de entradas ({"browser", "resolution", "device"}).
+    * Un JSON en línea con esa misma lista.
+    * Una lista corta separada por comas: "webkit:1920x1080,webkit:Pixel 5,chromium:iPhone 12".
+      Una entrada con solo el motor ("webkit") usa `RESOLUCION_POR_DEFECTO`.
+
+Todas las entradas de un mismo motor (chromium, firefox, webkit) comparten un único proceso de
+navegador por worker; cada dispositivo solo cuesta un contexto nuevo.
+"""
+import os
+import re
+import json
+import time
+import logging
+from typing import Dict, List, Any, Optional
+
+from playwright.sync_api import Playwright, Browser
+
+from utils.config import LOGGER_DIR
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='matriz_dispositivos',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+MOTORES_SOPORTADOS = ("chromium", "firefox", "webkit")
+
+MATRIZ_POR_DEFECTO: List[Dict[str, Any]] = [
+    # Resoluciones de escritorio
+    {"browser": "webkit", "resolution": {"width": 1920, "height": 1080}, "device": None},
+    # Emulación de dispositivos móviles
+    {"browser": "webkit", "device": "Pixel 5", "resolution": None},
+    {"browser": "webkit", "device": "iPhone 12", "resolution": None},
+]
+
+# Resolución usada por las entradas que solo indican el motor (ej: "webkit").
+RESOLUCION_POR_DEFECTO: Dict[str, int] = {"width": 1920, "height": 1080}
+
+_PATRON_RESOLUCION = re.compile(r"^(?P<width>\d+)x(?P<height>\d+)$")
+
+
+def _entrada_desde_texto(texto: str) -> Dict[str, Any]:
+    """Convierte una entrada corta 'motor:dispositivo' o 'motor:ANCHOxALTO' en una entrada de la matriz."""
+    motor, _, destino = texto.strip().partition(":")
+    destino = destino.strip()
+    resolucion = _PATRON_RESOLUCION.match(destino)
+    if resolucion:
+        return {"browser": motor.strip(), "resolution": {"width": int(resolucion["width"]), "height": int(resolucion["height"])}, "device": None}
+    return {"browser": motor.strip(), "device": destino or None, "resolution": None}
+
+
+def _validar_entrada(entrada: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normaliza una entrada de la matriz y valida el motor declarado. Una entrada sin dispositivo ni
+    resolución (ej: "webkit") recibe `RESOLUCION_POR_DEFECTO`.
+    """
+    normalizada = {
+        "browser": entrada.get("browser"),
+        "resolution": entrada.get("resolution"),
+        "device": entrada.get("device"),
+    }
+    if normalizada["browser"] not in MOTORES_SOPORTADOS:
+        raise ValueError(f"\nEl tipo de navegador '{normalizada['browser']}' no es compatible. Motores soportados: {MOTORES_SOPORTADOS}.")
+    if not normalizada["device"] and not normalizada["resolution"]:
+        normalizada["resolution"] = dict(RESOLUCION_POR_DEFECTO)
+    return normalizada
+
+
+def cargar_matriz_dispositivos(valor: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Obtiene la matriz de ejecución declarada por configuración, agrupada por motor de navegador
+    (las entradas del mismo motor quedan contiguas, manteniendo su orden relativo).
+
+    Args:
+        valor (Optional[str]): Definición de la matriz. Si es `None`, se lee de la variable de
+                               entorno `MATRIZ_DISPOSITIVOS`; si tampoco existe, se usa `MATRIZ_POR_DEFECTO`.
+
+    Returns:
+        List[Dict[str, Any]]: Lista de entradas {"browser", "resolution", "device"}.
+    """
+    valor = os.getenv("MATRIZ_DISPOSITIVOS") if valor is None else valor
+
+    if not valor or not valor.strip():
+        entradas = MATRIZ_POR_DEFECTO
+    elif os.path.isfile(valor):
+        with open(valor, 'r', encoding='utf-8') as archivo:
+            entradas = json.load(archivo)
+    elif valor.strip().startswith("["):
+        entradas = json.loads(valor)
+    else:
+        entradas = [_entrada_desde_texto(parte) for parte in valor.split(",") if parte.strip()]
+
+    matriz = [_validar_entrada(entrada) for entrada in entradas]
+    matriz.sort(key=lambda entrada: MOTORES_SOPORTADOS.index(entrada["browser"]))
+    logger.debug(f"\nMatriz de ejecución cargada ({len(matriz)} entradas): {matriz}")
+    return matriz
+
+
+class PoolNavegadores:
+    """
+    Mantiene un único proceso de navegador por motor durante la sesión del worker.
+    Los navegadores se lanzan de forma perezosa la primera vez que una entrada de la matriz los necesita.
+    """
+
+    def __init__(self, playwright: Playwright, opciones_lanzamiento: Optional[Dict[str, Any]] = None):
+        self.playwright = playwright
+        self.opciones_lanzamiento = opciones_lanzamiento or {}
+        self._navegadores: Dict[str, Browser] = {}
+
+    def obtener(self, motor: str) -> Browser:
+        """
+        Devuelve el navegador del motor indicado, lanzándolo si aún no existe o si se desconectó.
+
+        Args:
+            motor (str): 'chromium', 'firefox' o 'webkit'.
+
+        Returns:
+            Browser: La instancia compartida del navegador.
+        """
+        navegador = self._navegadores.get(motor)
+        if navegador is not None and navegador.is_connected():
+            return navegador
+
+        if motor not in MOTORES_SOPORTADOS:
+            raise ValueError(f"\nEl tipo de navegador '{motor}' no es compatible.")
+
+        # --- Medición de rendimiento: lanzamiento del navegador (una vez por motor y worker) ---
+        start_time_launch = time.time()
+        navegador = getattr(self.playwright, motor).launch(**self.opciones_lanzamiento)
+        duration_launch = time.time() - start_time_launch
+        logger.info(f"PERFORMANCE: Lanzamiento del navegador '{motor}' (compartido por la matriz): {duration_launch:.4f} segundos.")
+
+        self._navegadores[motor] = navegador
+        return navegador
+
+    def cerrar_todos(self) -> None:
+        """Cierra todos los navegadores lanzados por el pool."""
+        for motor, navegador in self._navegadores.items():
+            try:
+                navegador.close()
+                logger.debug(f"\nNavegador '{motor}' cerrado.")
+            except Exception as e:
+                logger.warning(f"\n⚠️ Error al cerrar el navegador '{motor}': {e}")
+        self._navegadores.clear()
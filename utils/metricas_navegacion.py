@@ -0,0 +1,131 @@
+"""
+Métricas de rendimiento de la aplicación medidas por el propio navegador tras cada navegación.
+
+Se leen con un script que registra `PerformanceObserver` con `buffered: true` (recibe también las entradas
+anteriores a su registro) y consulta la API de Navigation/Resource Timing:
+- TTFB, DOMContentLoaded y load (Navigation Timing, en ms desde el inicio de la navegación),
+- FCP (entradas 'paint'), LCP ('largest-contentful-paint') y CLS (suma de 'layout-shift' sin interacción),
+- resumen de recursos (número, bytes transferidos y los más lentos).
+
+LCP y CLS solo existen en Chromium; en Firefox y WebKit se registran como `null`. Con la estrategia de espera
+'domcontentloaded' el evento load puede no haber terminado todavía, en cuyo caso `load_ms` también es `null`.
+
+Cada medición se guarda como una línea JSON (por URL, dispositivo y perfil de ejecución) en
+`METRICAS_NAVEGACION_FILE`, con un archivo por worker de xdist, para comparar el rendimiento entre builds.
+"""
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from playwright.sync_api import Page
+
+from utils.config import LOGGER_DIR, METRICAS_NAVEGACION_FILE
+from utils.escritores_datos import EscritorJSONL, ruta_por_worker
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='metricas_navegacion',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+SCRIPT_METRICAS_NAVEGACION = """
+async () => {
+    const soportados = PerformanceObserver.supportedEntryTypes || [];
+    const observar = (tipo) => new Promise((resolver) => {
+        if (!soportados.includes(tipo)) { resolver(null); return; }
+        const entradas = [];
+        const observador = new PerformanceObserver((lista) => entradas.push(...lista.getEntries()));
+        observador.observe({type: tipo, buffered: true});
+        // Las entradas almacenadas (buffered) se entregan en una tarea posterior.
+        setTimeout(() => { entradas.push(...observador.takeRecords()); observador.disconnect(); resolver(entradas); }, 0);
+    });
+    const [pintados, lcp, desplazamientos] = await Promise.all(
+        [observar('paint'), observar('largest-contentful-paint'), observar('layout-shift')]);
+    const nav = performance.getEntriesByType('navigation')[0];
+    const recursos = performance.getEntriesByType('resource');
+    const fcp = pintados ? pintados.find(e => e.name === 'first-contentful-paint') : null;
+    return {
+        ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+        dom_content_loaded_ms: nav && nav.domContentLoadedEventEnd > 0 ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        load_ms: nav && nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+        fcp_ms: fcp ? fcp.startTime : null,
+        lcp_ms: lcp && lcp.length ? lcp[lcp.length - 1].startTime : null,
+        cls: desplazamientos ? desplazamientos.filter(e => !e.hadRecentInput).reduce((s, e) => s + e.value, 0) : null,
+        recursos: {
+            total: recursos.length,
+            bytes_transferidos: recursos.reduce((s, r) => s + (r.transferSize || 0), 0),
+            mas_lentos: recursos.slice().sort((a, b) => b.duration - a.duration).slice(0, 5).map(r => (
+                {url: r.name, tipo: r.initiatorType, duracion_ms: r.duration, bytes: r.transferSize || 0})),
+        },
+    };
+}
+"""
+
+_escritor: Optional[EscritorJSONL] = None
+_lock_escritor = threading.Lock()
+
+
+def _obtener_escritor() -> EscritorJSONL:
+    """Escritor JSON Lines del proceso (uno por worker de xdist), creado en la primera medición."""
+    global _escritor
+    with _lock_escritor:
+        if _escritor is None:
+            _escritor = EscritorJSONL(ruta_por_worker(METRICAS_NAVEGACION_FILE))
+        return _escritor
+
+
+def perfil_dispositivo(page: Page) -> str:
+    """Identifica el dispositivo emulado por motor y viewport (ej: 'chromium-390x844')."""
+    navegador = page.context.browser
+    motor = navegador.browser_type.name if navegador is not None else "desconocido"
+    viewport = page.viewport_size
+    return f"{motor}-{viewport['width']}x{viewport['height']}" if viewport else motor
+
+
+def capturar_metricas(page: Page, url: str, perfil_ejecucion: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Lee las métricas de rendimiento de la página actual y las guarda en el archivo de métricas.
+
+    Args:
+        page (Page): Página recién navegada.
+        url (str): URL solicitada (la URL final tras redirecciones se guarda aparte).
+        perfil_ejecucion (Optional[str]): Nombre del perfil de ejecución activo, para agrupar las mediciones.
+
+    Returns:
+        Optional[Dict[str, Any]]: El registro guardado, o `None` si no se pudieron leer las métricas
+                                  (la medición nunca hace fallar la navegación).
+    """
+    try:
+        start_time_metricas = time.time()
+        metricas = page.evaluate(SCRIPT_METRICAS_NAVEGACION)
+        duration_metricas = time.time() - start_time_metricas
+    except Exception as e:
+        logger.warning(f"\n⚠️ No se pudieron leer las métricas de navegación de '{url}'. Detalles: {e}")
+        return None
+
+    registro = {
+        "marca_tiempo": datetime.now().isoformat(timespec="seconds"),
+        "url": url,
+        "url_final": page.url,
+        "dispositivo": perfil_dispositivo(page),
+        "perfil": perfil_ejecucion,
+        **metricas,
+    }
+    try:
+        _obtener_escritor().escribir(registro)
+    except OSError as e:
+        logger.warning(f"\n⚠️ No se pudieron guardar las métricas de navegación de '{url}'. Detalles: {e}")
+
+    def formato(valor: Optional[float], plantilla: str = "{:.1f} ms") -> str:
+        return "n/d" if valor is None else plantilla.format(valor)
+
+    logger.info(f"PERFORMANCE: Métricas del navegador para '{url}' ({registro['dispositivo']}): TTFB {formato(metricas['ttfb_ms'])}, "
+                f"DOMContentLoaded {formato(metricas['dom_content_loaded_ms'])}, load {formato(metricas['load_ms'])}, "
+                f"FCP {formato(metricas['fcp_ms'])}, LCP {formato(metricas['lcp_ms'])}, CLS {formato(metricas['cls'], '{:.3f}')}, "
+                f"{metricas['recursos']['total']} recursos ({metricas['recursos']['bytes_transferidos']} bytes). "
+                f"Lectura: {duration_metricas:.4f} segundos.")
+    return registro
@@ -0,0 +1,114 @@
+"""
+Plugin de Pytest que parametriza tests a partir de archivos de datos (CSV/Excel) durante la recolección,
+sin necesitar `BasePage` ni navegador.
+
+Uso:
+    @pytest.mark.fuente_datos("usuarios.xlsx", hoja="Hoja1", id_columna="email")
+    def test_registro(set_up_Registro, datos):
+        ...
+
+El marcador se expande en `pytest.mark.parametrize("datos", [registro, ...])`, con un registro (dict) por
+fila. Las rutas relativas se resuelven contra `SOURCE_FILES_DIR_DATA_SOURCE`. Cada archivo se lee una sola
+vez por sesión (memo del proceso) a través de la caché columnar de `utils/fuente_datos.py`, de modo que
+los workers de xdist no vuelven a parsear el Excel o el CSV.
+
+Los ids de los tests son estables: el valor de `id_columna` si se indica, o '<archivo>-fila<N>'.
+"""
+import os
+import re
+import time
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+
+import pytest
+
+from utils.config import LOGGER_DIR, SOURCE_FILES_DIR_DATA_SOURCE
+from utils.fuente_datos import cargar_registros
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='parametrizacion_datos',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+NOMBRE_MARCADOR = "fuente_datos"
+ARGUMENTO_POR_DEFECTO = "datos"
+
+# Registros por (ruta absoluta, hoja, separador), leídos una vez por sesión.
+_registros_sesion: Dict[Tuple[str, Optional[str], str], List[Dict[str, Any]]] = {}
+
+
+def resolver_ruta_fuente(archivo: str) -> str:
+    """Resuelve un nombre de archivo relativo contra el directorio de fuentes de datos de los tests."""
+    return archivo if os.path.isabs(archivo) else os.path.join(SOURCE_FILES_DIR_DATA_SOURCE, archivo)
+
+
+def registros_de_sesion(archivo: str, hoja: Optional[str] = None, delimiter: str = ',') -> List[Dict[str, Any]]:
+    """
+    Devuelve los registros del archivo, leyéndolo solo la primera vez que se pide en la sesión.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        ValueError: Si la extensión no está soportada o la hoja no existe.
+    """
+    ruta = os.path.abspath(resolver_ruta_fuente(archivo))
+    clave = (ruta, hoja, delimiter)
+    registros = _registros_sesion.get(clave)
+    if registros is None:
+        registros = cargar_registros(ruta, hoja=hoja, delimiter=delimiter)
+        _registros_sesion[clave] = registros
+    return registros
+
+
+def _id_legible(valor: Any) -> str:
+    """Convierte un valor en un fragmento de id sin espacios ni caracteres que dificulten usar `-k`."""
+    return re.sub(r"[^\w.@-]+", "_", str(valor)).strip("_") or "vacio"
+
+
+def generar_ids(registros: List[Dict[str, Any]], archivo: str, id_columna: Optional[str] = None) -> List[str]:
+    """
+    Genera un id estable por registro: el valor de `id_columna` (si existe en el registro y no está vacío)
+    o '<archivo>-fila<N>', con N basado en 1 sobre las filas de datos.
+    """
+    base = _id_legible(os.path.splitext(os.path.basename(archivo))[0])
+    ids = []
+    for numero_fila, registro in enumerate(registros, start=1):
+        valor = registro.get(id_columna) if id_columna else None
+        ids.append(_id_legible(valor) if valor not in (None, "") else f"{base}-fila{numero_fila}")
+    return ids
+
+
+# --- Hooks del plugin ---
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        f"{NOMBRE_MARCADOR}(archivo, hoja=None, argumento='{ARGUMENTO_POR_DEFECTO}', id_columna=None, delimiter=','): "
+        "parametriza el test con un registro (dict) por fila del archivo CSV/Excel indicado."
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    for marcador in metafunc.definition.iter_markers(name=NOMBRE_MARCADOR):
+        if not marcador.args:
+            raise pytest.UsageError(f"El marcador '{NOMBRE_MARCADOR}' de '{metafunc.definition.nodeid}' necesita el nombre del archivo.")
+        archivo = marcador.args[0]
+        hoja = marcador.kwargs.get("hoja")
+        argumento = marcador.kwargs.get("argumento", ARGUMENTO_POR_DEFECTO)
+        id_columna = marcador.kwargs.get("id_columna")
+        delimiter = marcador.kwargs.get("delimiter", ',')
+
+        # --- Medición de rendimiento: obtención de los registros (memo de sesión o caché columnar) ---
+        start_time_parametrizacion = time.time()
+        try:
+            registros = registros_de_sesion(archivo, hoja=hoja, delimiter=delimiter)
+        except Exception as e:
+            logger.critical(f"\n❌ No se pudo cargar la fuente de datos '{archivo}' (hoja: '{hoja}') para '{metafunc.definition.nodeid}'. Detalles: {e}")
+            raise
+        duration_parametrizacion = time.time() - start_time_parametrizacion
+        logger.debug(f"PERFORMANCE: Parametrización de '{metafunc.definition.nodeid}' con '{archivo}' ({len(registros)} registros): {duration_parametrizacion:.4f} segundos.")
+
+        # Cada test recibe su propia copia de los registros, para que uno no altere los datos de otro.
+        metafunc.parametrize(argumento, [dict(registro) for registro in registros], ids=generar_ids(registros, archivo, id_columna))
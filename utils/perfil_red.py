@@ -0,0 +1,372 @@
+"""
+Perfiles de red declarativos que bloquean o simulan recursos que las pruebas funcionales no necesitan
+(analítica de terceros, fuentes, anuncios, imágenes a tamaño completo).
+
+El perfil se aplica al crear el contexto en `playwright_page` con una única ruta `context.route("**/*")`:
+- 'bloquear': la solicitud se aborta (`route.abort()`), no sale a la red.
+- 'simular': se responde localmente con un cuerpo mínimo según el tipo de recurso (PNG de 1x1 para
+  imágenes, script/hoja de estilos vacíos, etc.). Las respuestas simuladas llevan la cabecera
+  `CABECERA_SIMULADA` para que las aserciones puedan distinguirlas de una carga real.
+- el resto de solicitudes sigue su curso con `route.fallback()`, de modo que otras rutas del contexto
+  (grabación HAR, caché de recursos) siguen aplicándose.
+
+El perfil activo sale de la clave 'perfil_red' del perfil de ejecución, y se puede sobrescribir con
+`--perfil-red` o la variable de entorno `PERFIL_RED`. Los tests que sí necesitan ciertos recursos
+(p. ej. los que usan `verificar_carga_exitosa_imagen`) los permiten con el marcador:
+
+    @pytest.mark.permitir_recursos("image", urls=("*/img/*",))
+
+Sin argumentos, el marcador desactiva el perfil de red para ese test.
+
+Al terminar cada test se registran las solicitudes evitadas por tipo de recurso y una estimación de los
+bytes ahorrados. El tamaño de cada URL se aprende de las respuestas reales de cualquier contexto (cabecera
+Content-Length o, si falta, la longitud del cuerpo) y se guarda en `TAMANOS_RECURSOS_FILE`. Un recurso que
+el perfil bloquea o simula nunca se descarga, así que su tamaño solo se conoce si alguna ejecución lo cargó
+(perfil 'completo' o marcador `permitir_recursos`): la estimación es parcial y las solicitudes sin tamaño
+conocido se cuentan aparte.
+"""
+import os
+import re
+import json
+import base64
+import fnmatch
+import logging
+import weakref
+import threading
+from collections import Counter
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+import pytest
+from playwright.sync_api import BrowserContext, Route, Request, Response, Error
+
+from utils.config import LOGGER_DIR, TAMANOS_RECURSOS_FILE
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='perfil_red',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+VARIABLE_ENTORNO_PERFIL_RED = "PERFIL_RED"
+NOMBRE_MARCADOR = "permitir_recursos"
+CABECERA_SIMULADA = "x-perfil-red"
+
+# Dominios de analítica y publicidad más habituales. Los scripts de analítica se simulan (cuerpo vacío) en
+# lugar de abortarse para que la página no registre errores de carga; los de anuncios se bloquean.
+URLS_ANALITICA = (
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*hotjar.com/*",
+    "*segment.io/*",
+    "*connect.facebook.net/*",
+)
+URLS_ANUNCIOS = (
+    "*doubleclick.net/*",
+    "*googlesyndication.com/*",
+    "*adservice.google.*",
+    "*amazon-adsystem.com/*",
+)
+
+PERFILES_RED: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    # Sin intervención: la página carga todo lo que pide.
+    "completo": {
+        "bloquear_tipos": (),
+        "simular_tipos": (),
+        "bloquear_urls": (),
+        "simular_urls": (),
+        "permitir_urls": (),
+    },
+    # Pruebas funcionales: sin fuentes, multimedia, anuncios ni analítica, e imágenes simuladas.
+    "funcional": {
+        "bloquear_tipos": ("font", "media"),
+        "simular_tipos": ("image",),
+        "bloquear_urls": URLS_ANUNCIOS,
+        "simular_urls": URLS_ANALITICA,
+        "permitir_urls": (),
+    },
+}
+
+# PNG transparente de 1x1: mantiene los eventos 'load' de las imágenes y su visibilidad en el DOM.
+_PNG_1X1 = base64.b64decode("iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII=")
+
+# Respuesta simulada por tipo de recurso: (content-type, cuerpo).
+RESPUESTAS_SIMULADAS: Dict[str, Tuple[str, bytes]] = {
+    "image": ("image/png", _PNG_1X1),
+    "script": ("application/javascript", b""),
+    "stylesheet": ("text/css", b""),
+    "font": ("font/woff2", b""),
+    "xhr": ("application/json", b"{}"),
+    "fetch": ("application/json", b"{}"),
+}
+
+
+# Tipos de recurso cuyo tamaño se mide con el cuerpo de la respuesta si falta Content-Length (los que algún
+# perfil puede bloquear o simular). Para el resto basta la cabecera: leer cada cuerpo sería un roundtrip más.
+TIPOS_CON_TAMANO_ESTIMABLE = frozenset({"image", "font", "media", "script", "stylesheet"})
+
+
+# Solicitudes abortadas por algún perfil de red. Se consultan con `fue_bloqueada` (p. ej. desde utils/registro_red.py)
+# para no confundir un recurso bloqueado a propósito con un fallo de la aplicación.
+_solicitudes_bloqueadas: "weakref.WeakSet[Request]" = weakref.WeakSet()
+
+
+def fue_bloqueada(request: Request) -> bool:
+    """Indica si la solicitud fue abortada por el perfil de red."""
+    return request in _solicitudes_bloqueadas
+
+
+def _compilar_patrones(patrones: Iterable[str]) -> Optional[re.Pattern]:
+    """Une los patrones glob de URL en una sola expresión regular (o `None` si no hay patrones)."""
+    patrones = list(patrones)
+    if not patrones:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(patron)})" for patron in patrones))
+
+
+def nombre_perfil_red(perfil_ejecucion: Dict[str, Any]) -> str:
+    """Nombre del perfil de red activo: variable `PERFIL_RED` o, en su defecto, la clave 'perfil_red' del perfil de ejecución."""
+    nombre = (os.getenv(VARIABLE_ENTORNO_PERFIL_RED) or perfil_ejecucion.get("perfil_red") or "completo").strip().lower()
+    if nombre not in PERFILES_RED:
+        raise ValueError(f"\nEl perfil de red '{nombre}' no existe. Perfiles disponibles: {list(PERFILES_RED)}.")
+    return nombre
+
+
+class RegistroTamanos:
+    """
+    Tamaño en bytes de cada URL observada, persistido entre ejecuciones para estimar los bytes ahorrados
+    por los recursos que el perfil de red no descarga. Al guardar se fusiona con el contenido del archivo,
+    así que varios workers de xdist pueden escribirlo (en el peor caso se pierde alguna medición).
+    """
+
+    def __init__(self, ruta_archivo: str = TAMANOS_RECURSOS_FILE):
+        self.ruta_archivo = ruta_archivo
+        self.tamanos: Dict[str, int] = {}
+        self._nuevos: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.cargar()
+
+    def cargar(self) -> None:
+        """Carga la tabla desde disco. Un archivo inexistente o corrupto equivale a una tabla vacía."""
+        if not os.path.exists(self.ruta_archivo):
+            return
+        try:
+            with open(self.ruta_archivo, 'r', encoding='utf-8') as archivo:
+                self.tamanos = json.load(archivo)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"\n⚠️ No se pudo leer la tabla de tamaños de recursos '{self.ruta_archivo}'. Se parte de cero. Detalles: {e}")
+            self.tamanos = {}
+
+    def obtener(self, url: str) -> Optional[int]:
+        return self.tamanos.get(url)
+
+    def observar(self, context: BrowserContext) -> None:
+        """Aprende el tamaño de las respuestas reales del contexto (las simuladas por el perfil se ignoran)."""
+        context.on("response", self._on_response)
+
+    def _on_response(self, response: Response) -> None:
+        """
+        Usa la cabecera Content-Length; si falta (respuestas comprimidas por chunks, servidas desde la caché de
+        recursos o desde un HAR), mide el cuerpo una sola vez por URL para los tipos de `TIPOS_CON_TAMANO_ESTIMABLE`.
+        """
+        encabezados = response.headers
+        if CABECERA_SIMULADA in encabezados or response.status != 200:
+            return
+        longitud = encabezados.get("content-length")
+        if longitud and longitud.isdigit():
+            tamano = int(longitud)
+        elif response.request.resource_type in TIPOS_CON_TAMANO_ESTIMABLE and response.url not in self.tamanos:
+            try:
+                tamano = len(response.body())
+            except Error as e:
+                logger.debug(f"\nNo se pudo medir el cuerpo de '{response.url}' para la tabla de tamaños. Detalles: {e}")
+                return
+        else:
+            return
+        with self._lock:
+            self.tamanos[response.url] = tamano
+            self._nuevos[response.url] = tamano
+
+    def guardar(self) -> None:
+        """Fusiona las mediciones nuevas con las del archivo y lo reescribe de forma atómica."""
+        with self._lock:
+            if not self._nuevos:
+                return
+            nuevos, self._nuevos = self._nuevos, {}
+        existentes: Dict[str, int] = {}
+        if os.path.exists(self.ruta_archivo):
+            try:
+                with open(self.ruta_archivo, 'r', encoding='utf-8') as archivo:
+                    existentes = json.load(archivo)
+            except (OSError, json.JSONDecodeError):
+                existentes = {}
+        existentes.update(nuevos)
+        ruta_temporal = f"{self.ruta_archivo}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.ruta_archivo), exist_ok=True)
+            with open(ruta_temporal, 'w', encoding='utf-8') as archivo:
+                json.dump(existentes, archivo)
+            os.replace(ruta_temporal, self.ruta_archivo)
+            logger.debug(f"\nTabla de tamaños de recursos guardada: {len(existentes)} URL en '{self.ruta_archivo}'.")
+        except OSError as e:
+            logger.warning(f"\n⚠️ No se pudo guardar la tabla de tamaños de recursos '{self.ruta_archivo}'. Detalles: {e}")
+
+
+class BloqueadorRecursos:
+    """
+    Aplica un perfil de red a un contexto y contabiliza las solicitudes evitadas.
+
+    Una sola ruta atiende todas las solicitudes: los tipos de recurso se comparan con conjuntos y los
+    patrones de URL de cada categoría están precompilados en una única expresión regular.
+    """
+
+    def __init__(self, nombre_perfil: str, permitir_tipos: Iterable[str] = (), permitir_urls: Iterable[str] = (),
+                 tamanos: Optional[RegistroTamanos] = None):
+        perfil = PERFILES_RED[nombre_perfil]
+        permitidos = set(permitir_tipos)
+        self.nombre_perfil = nombre_perfil
+        self.bloquear_tipos = set(perfil["bloquear_tipos"]) - permitidos
+        self.simular_tipos = set(perfil["simular_tipos"]) - permitidos
+        self._bloquear_urls = _compilar_patrones(perfil["bloquear_urls"])
+        self._simular_urls = _compilar_patrones(perfil["simular_urls"])
+        self._permitir_urls = _compilar_patrones(tuple(perfil["permitir_urls"]) + tuple(permitir_urls))
+        self.tamanos = tamanos
+        self.bloqueadas: Counter = Counter()
+        self.simuladas: Counter = Counter()
+        self.bytes_ahorrados = 0
+        self.con_tamano_conocido = 0
+        self.sin_tamano_conocido = 0
+
+    @property
+    def activo(self) -> bool:
+        """Indica si el perfil intercepta algo (el perfil 'completo' no necesita ruta)."""
+        return bool(self.bloquear_tipos or self.simular_tipos or self._bloquear_urls or self._simular_urls)
+
+    def aplicar(self, context: BrowserContext) -> "BloqueadorRecursos":
+        """Registra la ruta del perfil en el contexto (solo si el perfil intercepta algo)."""
+        if self.activo:
+            context.route("**/*", self._manejar_ruta)
+        return self
+
+    def _decidir(self, url: str, tipo: str) -> Optional[str]:
+        """Devuelve 'bloquear', 'simular' o `None` (dejar pasar) para una solicitud."""
+        if self._permitir_urls and self._permitir_urls.match(url):
+            return None
+        if tipo in self.bloquear_tipos or (self._bloquear_urls and self._bloquear_urls.match(url)):
+            return "bloquear"
+        if tipo in self.simular_tipos or (self._simular_urls and self._simular_urls.match(url)):
+            return "simular"
+        return None
+
+    def _contabilizar(self, url: str) -> None:
+        tamano = self.tamanos.obtener(url) if self.tamanos is not None else None
+        if tamano is None:
+            self.sin_tamano_conocido += 1
+        else:
+            self.con_tamano_conocido += 1
+            self.bytes_ahorrados += tamano
+
+    def _manejar_ruta(self, route: Route) -> None:
+        request = route.request
+        tipo = request.resource_type
+        decision = self._decidir(request.url, tipo)
+        if decision is None:
+            route.fallback()
+            return
+        self._contabilizar(request.url)
+        if decision == "bloquear":
+            self.bloqueadas[tipo] += 1
+            _solicitudes_bloqueadas.add(request)
+            route.abort("blockedbyclient")
+            return
+        self.simuladas[tipo] += 1
+        content_type, cuerpo = RESPUESTAS_SIMULADAS.get(tipo, ("text/plain", b""))
+        route.fulfill(status=200, content_type=content_type, body=cuerpo, headers={CABECERA_SIMULADA: self.nombre_perfil})
+
+    def resumen(self) -> Dict[str, Any]:
+        """
+        Solicitudes evitadas por tipo de recurso y bytes ahorrados estimados. La estimación solo suma las
+        `con_tamano_conocido` solicitudes; es un mínimo si `sin_tamano_conocido` es mayor que cero.
+        """
+        return {
+            "perfil_red": self.nombre_perfil,
+            "bloqueadas": dict(self.bloqueadas),
+            "simuladas": dict(self.simuladas),
+            "solicitudes_evitadas": sum(self.bloqueadas.values()) + sum(self.simuladas.values()),
+            "bytes_ahorrados_estimados": self.bytes_ahorrados,
+            "con_tamano_conocido": self.con_tamano_conocido,
+            "sin_tamano_conocido": self.sin_tamano_conocido,
+        }
+
+
+_tamanos: Optional[RegistroTamanos] = None
+
+
+def obtener_registro_tamanos() -> RegistroTamanos:
+    """Tabla de tamaños del proceso (una por worker de xdist), cargada la primera vez que se necesita."""
+    global _tamanos
+    if _tamanos is None:
+        _tamanos = RegistroTamanos()
+    return _tamanos
+
+
+def aplicar_perfil_red(context: BrowserContext, perfil_ejecucion: Dict[str, Any], marcador: Optional[pytest.Mark] = None) -> Optional[BloqueadorRecursos]:
+    """
+    Aplica al contexto el perfil de red activo, teniendo en cuenta el marcador `permitir_recursos` del test.
+
+    Args:
+        context (BrowserContext): Contexto recién creado, antes de abrir páginas.
+        perfil_ejecucion (Dict[str, Any]): Perfil de ejecución activo.
+        marcador (Optional[pytest.Mark]): Marcador `permitir_recursos` del test, si lo tiene.
+
+    Returns:
+        Optional[BloqueadorRecursos]: El bloqueador aplicado, o `None` si el perfil no intercepta nada.
+                                      En ambos casos el contexto se usa para aprender tamaños de recursos.
+    """
+    tamanos = obtener_registro_tamanos()
+    nombre = nombre_perfil_red(perfil_ejecucion)
+    if marcador is not None and not marcador.args and not marcador.kwargs.get("urls"):
+        nombre = "completo"
+
+    bloqueador = BloqueadorRecursos(
+        nombre,
+        permitir_tipos=marcador.args if marcador is not None else (),
+        permitir_urls=marcador.kwargs.get("urls", ()) if marcador is not None else (),
+        tamanos=tamanos,
+    )
+    tamanos.observar(context)
+    if not bloqueador.activo:
+        return None
+    return bloqueador.aplicar(context)
+
+
+# --- Hooks del plugin ---
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("perfil_red", "Perfil de red del framework")
+    group.addoption(
+        "--perfil-red",
+        action="store",
+        default=None,
+        choices=list(PERFILES_RED),
+        help=f"Perfil de red (recursos bloqueados o simulados). Por defecto, la variable de entorno "
+             f"{VARIABLE_ENTORNO_PERFIL_RED} o la clave 'perfil_red' del perfil de ejecución."
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        f"{NOMBRE_MARCADOR}(*tipos, urls=()): permite los tipos de recurso y patrones de URL indicados aunque el perfil "
+        "de red los bloquee o simule. Sin argumentos, desactiva el perfil de red para el test."
+    )
+    # Igual que '--perfil': se propaga por variable de entorno para que la hereden los workers de xdist.
+    nombre = config.getoption("--perfil-red")
+    if nombre:
+        os.environ[VARIABLE_ENTORNO_PERFIL_RED] = nombre
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    if _tamanos is not None:
+        _tamanos.guardar()
@@ -0,0 +1,176 @@
+"""
+Perfilador del coste de los selectores declarados en las clases de localizadores.
+
+Carga una página, resuelve todos los localizadores de una clase y mide para cada uno:
+- número de coincidencias y tiempo de resolución (`count()`),
+- nodos del DOM examinados (estimación mediante un script inyectado: candidatos del primer tramo del
+  selector y, si hay filtros por texto, los descendientes cuyo texto se evalúa),
+- ambigüedad: selectores que devuelven varias coincidencias o que dependen de `.nth()`.
+
+Soporta clases con localizadores registrados con `@locator_cacheado` (ej: `HomeLocatorsPage`) y clases
+de constantes con diccionarios {"nombre", "locator"} (ej: `ObstaculosLocators`).
+
+Uso desde línea de comandos:
+    python -m utils.perfilador_selectores [url]
+"""
+import re
+import ast
+import sys
+import json
+import time
+import logging
+from typing import Dict, List, Any, Optional, Tuple
+
+from playwright.sync_api import Page, Locator, sync_playwright
+
+from utils.config import LOGGER_DIR, BASE_URL, PERFILADO_SELECTORES_FILE
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='perfilador_selectores',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+# El repr de un Locator es "<Locator frame=... selector='...'>", con el selector como literal de Python.
+_PATRON_SELECTOR = re.compile(r"selector=(?P<selector>(?P<comilla>['\"]).*(?P=comilla))>$")
+
+# Motores de Playwright que no pueden acotar candidatos con querySelectorAll y recorren todo el documento.
+_MOTORES_DOCUMENTO_COMPLETO = ("internal:role=", "internal:text=", "internal:label=", "internal:attr=",
+                               "internal:testid=", "text=", "xpath=", "//")
+
+# Estima los nodos que el motor de selectores examina: candidatos del primer tramo y, si el tramo
+# siguiente filtra por texto, todos sus descendientes (el texto de cada candidato se recalcula).
+_SCRIPT_NODOS_EXAMINADOS = """
+({primero, documentoCompleto, filtraTexto}) => {
+    const candidatos = documentoCompleto ? document.querySelectorAll('*') : document.querySelectorAll(primero);
+    let examinados = candidatos.length;
+    if (filtraTexto) {
+        for (const nodo of candidatos) examinados += nodo.getElementsByTagName('*').length;
+    }
+    return examinados;
+}
+"""
+
+
+def selector_de(locator: Locator) -> str:
+    """Devuelve la cadena de selector interna de un `Locator` (ej: 'div >> internal:has-text=... >> nth=2')."""
+    coincidencia = _PATRON_SELECTOR.search(repr(locator))
+    return ast.literal_eval(coincidencia.group("selector")) if coincidencia else repr(locator)
+
+
+def localizadores_de_clase(page: Page, clase_locators: type) -> List[Tuple[str, Locator]]:
+    """
+    Obtiene (nombre, Locator) de todos los localizadores declarados en una clase.
+
+    - Clases con registro de `@locator_cacheado`: se instancian con la página y se construye cada localizador.
+    - Clases de constantes: cada atributo dict con clave "locator" se resuelve con `page.locator()`.
+    """
+    registro = getattr(clase_locators, "_registro_locators", None)
+    if registro:
+        instancia = clase_locators(page)
+        return [(nombre, descriptor.construir(instancia)) for nombre, descriptor in registro.items()]
+
+    localizadores: List[Tuple[str, Locator]] = []
+    for nombre, valor in vars(clase_locators).items():
+        if isinstance(valor, dict) and "locator" in valor:
+            localizadores.append((nombre, page.locator(valor["locator"])))
+    return localizadores
+
+
+def _nodos_examinados(page: Page, selector: str) -> Optional[int]:
+    """Estima, con un script inyectado, cuántos nodos del DOM examina el selector."""
+    tramos = [tramo.strip() for tramo in selector.split(">>")]
+    primero = tramos[0][len("css="):] if tramos[0].startswith("css=") else tramos[0]
+    documento_completo = primero.startswith(_MOTORES_DOCUMENTO_COMPLETO)
+    filtra_texto = any(tramo.startswith(("internal:has-text=", "internal:has-not-text=")) for tramo in tramos[1:])
+    try:
+        return page.evaluate(_SCRIPT_NODOS_EXAMINADOS, {"primero": primero, "documentoCompleto": documento_completo, "filtraTexto": filtra_texto})
+    except Exception as e:
+        logger.debug(f"\nNo se pudieron estimar los nodos examinados para '{selector}': {e}")
+        return None
+
+
+def perfilar_localizadores(page: Page, clase_locators: type) -> List[Dict[str, Any]]:
+    """
+    Resuelve y mide cada localizador de la clase indicada sobre la página ya cargada.
+
+    Returns:
+        List[Dict[str, Any]]: Una entrada por localizador con 'clase', 'locator', 'selector', 'coincidencias',
+                              'segundos', 'nodos_examinados', 'usa_nth' y 'ambiguo'.
+    """
+    resultados: List[Dict[str, Any]] = []
+    for nombre, locator in localizadores_de_clase(page, clase_locators):
+        selector = selector_de(locator)
+        try:
+            start_time_resolucion = time.time()
+            coincidencias = locator.count()
+            duration_resolucion = time.time() - start_time_resolucion
+        except Exception as e:
+            logger.error(f"\n❌ Error al resolver el localizador '{clase_locators.__name__}.{nombre}' ({selector}). Detalles: {e}")
+            continue
+
+        usa_nth = "nth=" in selector
+        resultados.append({
+            "clase": clase_locators.__name__,
+            "locator": nombre,
+            "selector": selector,
+            "coincidencias": coincidencias,
+            "segundos": round(duration_resolucion, 4),
+            "nodos_examinados": _nodos_examinados(page, selector),
+            "usa_nth": usa_nth,
+            # Un selector es ambiguo si devuelve varios elementos o si solo es único gracias a .nth().
+            "ambiguo": usa_nth or coincidencias > 1,
+        })
+    return resultados
+
+
+def generar_informe(page: Page, clases_locators: List[type], ruta_informe: str = PERFILADO_SELECTORES_FILE) -> List[Dict[str, Any]]:
+    """
+    Perfila varias clases de localizadores y genera un informe ordenado de mayor a menor coste
+    (tiempo de resolución y, a igualdad, nodos examinados). El informe se registra en el log y se guarda en JSON.
+
+    Args:
+        page (Page): Página ya cargada sobre la que se resuelven los localizadores.
+        clases_locators (List[type]): Clases de localizadores a perfilar.
+        ruta_informe (str): Ruta del archivo JSON del informe.
+
+    Returns:
+        List[Dict[str, Any]]: Las entradas del informe, con su posición en el ranking ('rango').
+    """
+    informe: List[Dict[str, Any]] = []
+    for clase_locators in clases_locators:
+        informe.extend(perfilar_localizadores(page, clase_locators))
+
+    informe.sort(key=lambda entrada: (-entrada["segundos"], -(entrada["nodos_examinados"] or 0)))
+    for rango, entrada in enumerate(informe, start=1):
+        entrada["rango"] = rango
+        aviso = " ⚠️ AMBIGUO" if entrada["ambiguo"] else ""
+        logger.info(f"PERFORMANCE: #{rango} {entrada['clase']}.{entrada['locator']}: {entrada['segundos']:.4f} segundos, "
+                    f"{entrada['coincidencias']} coincidencias, {entrada['nodos_examinados']} nodos examinados.{aviso}")
+
+    try:
+        with open(ruta_informe, 'w', encoding='utf-8') as archivo:
+            json.dump({"url": page.url, "localizadores": informe}, archivo, indent=2, ensure_ascii=False)
+        logger.info(f"\n✅ Informe de perfilado de selectores guardado en '{ruta_informe}'.")
+    except OSError as e:
+        logger.error(f"\n❌ No se pudo guardar el informe de perfilado '{ruta_informe}'. Detalles: {e}", exc_info=True)
+    return informe
+
+
+def main(url: Optional[str] = None) -> None:
+    from locators.locator_home import HomeLocatorsPage
+    from locators.locator_obstaculoPantalla import ObstaculosLocators
+
+    url = url or BASE_URL
+    with sync_playwright() as p:
+        navegador = p.chromium.launch(headless=True)
+        page = navegador.new_page()
+        page.goto(url, wait_until="load")
+        generar_informe(page, [HomeLocatorsPage, ObstaculosLocators])
+        navegador.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,144 @@
+"""
+Perfiles de ejecución con nombre (debug, ci, benchmark).
+
+Cada perfil agrupa las opciones que antes estaban fijas en el código (headless=False, slow_mo=500,
+resaltado de elementos, capturas en cada paso, esperas fijas, video y tracing). El perfil activo se
+selecciona con la opción de línea de comandos `--perfil` o con la variable de entorno
+`PERFIL_EJECUCION`; si no se indica ninguno se usa `PERFIL_POR_DEFECTO` ("ci").
+
+Claves de cada perfil:
+    headless (bool): Lanza el navegador sin interfaz gráfica.
+    slow_mo (int): Milisegundos de retardo que Playwright añade a cada operación.
+    resaltar (Union[bool, str]): Si las acciones resaltan el elemento sobre el que actúan. También acepta un modo
+                                 de `BasePage.MODOS_RESALTADO` ('siempre', 'nunca', 'en_captura').
+    capturas (str): Política de capturas de pantalla: 'siempre' (cada paso), 'fallos' (solo al fallar un test)
+                    o 'nunca'.
+    factor_esperas (float): Multiplicador aplicado a las pausas visuales de `BasePage.esperar_fijo`. 0 las elimina;
+                            las pausas funcionales (`funcional=True`) no se escalan.
+    video (bool): Graba video de cada contexto.
+    tracing (str): Política de tracing de Playwright: 'siempre', 'fallos' (se conserva solo si el test falla) o 'nunca'.
+    metricas_navegacion (bool): Si `ir_a_url` captura por defecto las métricas del navegador (utils/metricas_navegacion.py).
+    esperar_hasta (str): Estrategia de espera por defecto de las navegaciones ('commit', 'domcontentloaded', 'load',
+                         'networkidle' o 'visible:<selector>' para esperar a que un elemento sea visible).
+                         Ver `NavigationActions.ESTRATEGIAS_ESPERA`. go_back/go_forward esperan a 'load' salvo que
+                         la llamada indique otra estrategia.
+    perfil_red (str): Perfil de red aplicado a cada contexto ('completo' o 'funcional'). Ver utils/perfil_red.py.
+    cache_recursos (str): Caché de recursos estáticos compartida entre contextos del worker: 'nunca', 'memoria'
+                          o 'disco'. Ver utils/cache_recursos.py.
+"""
+import os
+import logging
+from typing import Dict, Any, Optional
+
+import pytest
+
+from utils.config import LOGGER_DIR
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='perfiles_ejecucion',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+VARIABLE_ENTORNO_PERFIL = "PERFIL_EJECUCION"
+PERFIL_POR_DEFECTO = "ci"
+
+POLITICAS_EVIDENCIA = ("siempre", "fallos", "nunca")
+
+PERFILES_EJECUCION: Dict[str, Dict[str, Any]] = {
+    # Depuración local: navegador visible, ralentizado y con todas las evidencias.
+    "debug": {
+        "headless": False,
+        "slow_mo": 500,
+        "resaltar": True,
+        "capturas": "siempre",
+        "factor_esperas": 1.0,
+        "video": True,
+        "tracing": "siempre",
+        "metricas_navegacion": False,
+        "esperar_hasta": "domcontentloaded",
+        "perfil_red": "completo",
+        "cache_recursos": "nunca",
+    },
+    # Integración continua: sin interfaz ni retardos artificiales; evidencias solo de los fallos.
+    "ci": {
+        "headless": True,
+        "slow_mo": 0,
+        "resaltar": False,
+        "capturas": "fallos",
+        "factor_esperas": 0.0,
+        "video": False,
+        "tracing": "fallos",
+        "metricas_navegacion": False,
+        "esperar_hasta": "domcontentloaded",
+        "perfil_red": "funcional",
+        "cache_recursos": "memoria",
+    },
+    # Medición de latencia real de la aplicación: se elimina todo retardo y toda evidencia.
+    "benchmark": {
+        "headless": True,
+        "slow_mo": 0,
+        "resaltar": False,
+        "capturas": "nunca",
+        "factor_esperas": 0.0,
+        "video": False,
+        "tracing": "nunca",
+        "metricas_navegacion": True,
+        "esperar_hasta": "load",
+        "perfil_red": "completo",
+        "cache_recursos": "nunca",
+    },
+}
+
+
+def obtener_perfil(nombre: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Devuelve una copia del perfil de ejecución indicado (o del activo si no se indica nombre).
+
+    Args:
+        nombre (Optional[str]): Nombre del perfil. Si es `None`, se usa la variable de entorno
+                                `PERFIL_EJECUCION` o, en su defecto, `PERFIL_POR_DEFECTO`.
+
+    Returns:
+        Dict[str, Any]: Las opciones del perfil, incluida la clave 'nombre'.
+
+    Raises:
+        ValueError: Si el perfil no existe.
+    """
+    nombre = (nombre or os.getenv(VARIABLE_ENTORNO_PERFIL) or PERFIL_POR_DEFECTO).strip().lower()
+    if nombre not in PERFILES_EJECUCION:
+        raise ValueError(f"\nEl perfil de ejecución '{nombre}' no existe. Perfiles disponibles: {list(PERFILES_EJECUCION)}.")
+    perfil = dict(PERFILES_EJECUCION[nombre])
+    perfil["nombre"] = nombre
+    return perfil
+
+
+def opciones_lanzamiento(perfil: Dict[str, Any]) -> Dict[str, Any]:
+    """Opciones de `browser_type.launch()` derivadas del perfil."""
+    return {"headless": perfil["headless"], "slow_mo": perfil["slow_mo"]}
+
+
+# --- Hooks del plugin ---
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("perfiles_ejecucion", "Perfiles de ejecución del framework")
+    group.addoption(
+        "--perfil",
+        action="store",
+        default=None,
+        choices=list(PERFILES_EJECUCION),
+        help=f"Perfil de ejecución (headless, slow_mo, resaltado, capturas, esperas y evidencias). "
+             f"Por defecto, la variable de entorno {VARIABLE_ENTORNO_PERFIL} o '{PERFIL_POR_DEFECTO}'."
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # La opción de línea de comandos tiene prioridad y se propaga por variable de entorno para que
+    # BasePage y los workers de xdist (que heredan el entorno) usen el mismo perfil.
+    nombre = config.getoption("--perfil")
+    if nombre:
+        os.environ[VARIABLE_ENTORNO_PERFIL] = nombre
+    perfil = obtener_perfil()
+    logger.info(f"\nPerfil de ejecución activo: '{perfil['nombre']}' -> {perfil}")
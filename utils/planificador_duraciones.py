@@ -0,0 +1,272 @@
+"""
+Plugin de Pytest para planificar la distribución de xdist según la duración histórica de cada test.
+
+Registra la duración real (setup + call + teardown) de cada test en un archivo de historial local
+y, en ejecuciones posteriores con `--planificar-por-duracion`, reparte los tests entre los workers
+ordenándolos de mayor a menor duración (LPT) y agrupándolos por navegador/dispositivo para que
+los tests que comparten parametrización se ejecuten en el mismo worker.
+"""
+import os
+import re
+import json
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from utils.config import LOGGER_DIR, HISTORIAL_DURACIONES_FILE
+from utils.logger import setup_logger
+
+logger = setup_logger(
+    name='planificador_duraciones',
+    console_level=logging.INFO,
+    file_level=logging.DEBUG,
+    log_dir=LOGGER_DIR
+)
+
+# Duración (en segundos) asumida para tests que aún no tienen historial.
+DURACION_POR_DEFECTO = 5.0
+# Peso de la última medición en la media móvil exponencial del historial.
+FACTOR_SUAVIZADO = 0.5
+
+# Extrae el id navegador/dispositivo de un nodeid (ej: 'test_home.py::test_x[webkit-Pixel 5]' -> 'webkit-Pixel 5'),
+# aunque el test tenga otras parametrizaciones (ej: '[webkit-Pixel 5-fila3]').
+_PATRON_DISPOSITIVO = re.compile(r"[\[-](?P<param>(?:chromium|firefox|webkit)-[^-\]]+)")
+
+
+class HistorialDuraciones:
+    """
+    Historial persistente de duraciones por test (nodeid) almacenado en un archivo JSON.
+    Cada entrada guarda una media móvil exponencial de la duración y el número de ejecuciones.
+    """
+
+    def __init__(self, ruta_archivo: str = HISTORIAL_DURACIONES_FILE):
+        self.ruta_archivo = ruta_archivo
+        self.duraciones: Dict[str, Dict[str, float]] = {}
+        self._duraciones_sesion: Dict[str, float] = {}
+        self.cargar()
+
+    def cargar(self) -> None:
+        """Carga el historial desde disco. Un archivo inexistente o corrupto equivale a un historial vacío."""
+        if not os.path.exists(self.ruta_archivo):
+            logger.debug(f"\nNo existe historial de duraciones en '{self.ruta_archivo}'. Se parte de cero.")
+            return
+        try:
+            with open(self.ruta_archivo, 'r', encoding='utf-8') as archivo:
+                self.duraciones = json.load(archivo)
+            logger.debug(f"\nHistorial de duraciones cargado: {len(self.duraciones)} tests desde '{self.ruta_archivo}'.")
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"\n⚠️ No se pudo leer el historial de duraciones '{self.ruta_archivo}'. Se ignorará. Detalles: {e}")
+            self.duraciones = {}
+
+    def registrar(self, nodeid: str, duracion: float) -> None:
+        """Acumula la duración de una fase (setup, call o teardown) del test en la sesión actual."""
+        self._duraciones_sesion[nodeid] = self._duraciones_sesion.get(nodeid, 0.0) + duracion
+
+    def guardar(self) -> None:
+        """Fusiona las duraciones de la sesión con el historial y lo escribe de forma atómica."""
+        if not self._duraciones_sesion:
+            return
+
+        for nodeid, duracion in self._duraciones_sesion.items():
+            previa = self.duraciones.get(nodeid)
+            if previa:
+                media = FACTOR_SUAVIZADO * duracion + (1 - FACTOR_SUAVIZADO) * previa["duracion"]
+                self.duraciones[nodeid] = {"duracion": round(media, 4), "ejecuciones": previa["ejecuciones"] + 1}
+            else:
+                self.duraciones[nodeid] = {"duracion": round(duracion, 4), "ejecuciones": 1}
+
+        try:
+            os.makedirs(os.path.dirname(self.ruta_archivo), exist_ok=True)
+            ruta_temporal = f"{self.ruta_archivo}.{os.getpid()}.tmp"
+            with open(ruta_temporal, 'w', encoding='utf-8') as archivo:
+                json.dump(self.duraciones, archivo, indent=2, sort_keys=True)
+            os.replace(ruta_temporal, self.ruta_archivo)
+            logger.info(f"\n✅ Historial de duraciones actualizado con {len(self._duraciones_sesion)} tests en '{self.ruta_archivo}'.")
+        except OSError as e:
+            logger.error(f"\n❌ No se pudo guardar el historial de duraciones '{self.ruta_archivo}'. Detalles: {e}", exc_info=True)
+
+    def duracion_de(self, nodeid: str) -> Optional[float]:
+        """Devuelve la duración histórica de un test o `None` si no hay registro."""
+        entrada = self.duraciones.get(nodeid)
+        return entrada["duracion"] if entrada else None
+
+    def estimar(self, nodeids: List[str]) -> Dict[str, float]:
+        """
+        Estima la duración de cada test. Los tests sin historial reciben la mediana de los conocidos
+        (o `DURACION_POR_DEFECTO` si no hay ninguno), para no dejarlos siempre al final de la cola.
+        """
+        conocidas = sorted(d for d in (self.duracion_de(n) for n in nodeids) if d is not None)
+        respaldo = conocidas[len(conocidas) // 2] if conocidas else DURACION_POR_DEFECTO
+        return {nodeid: (self.duracion_de(nodeid) or respaldo) for nodeid in nodeids}
+
+
+def grupo_de_test(nodeid: str) -> str:
+    """
+    Determina el grupo de afinidad de un test: el id de parametrización del navegador/dispositivo
+    (ej: 'webkit-iPhone 12'). Los tests sin parametrización se agrupan por módulo.
+    """
+    coincidencia = _PATRON_DISPOSITIVO.search(nodeid)
+    if coincidencia:
+        return coincidencia.group("param")
+    return nodeid.split("::", 1)[0]
+
+
+def repartir_en_unidades(duraciones: Dict[str, float], num_workers: int) -> "OrderedDict[str, List[str]]":
+    """
+    Construye las unidades de trabajo para xdist a partir de las duraciones estimadas.
+
+    1. Agrupa los tests por navegador/dispositivo (afinidad para reutilizar el navegador).
+    2. Divide los grupos más pesados que la carga ideal por worker (total / num_workers) en
+       sub-bloques equilibrados, para que ningún grupo alargue por sí solo el makespan.
+    3. Ordena las unidades de mayor a menor duración: xdist las entrega a medida que los workers
+       quedan libres, lo que equivale a una planificación LPT (Longest Processing Time first).
+
+    Returns:
+        OrderedDict[str, List[str]]: Nombre de la unidad -> nodeids (ordenados de mayor a menor duración).
+    """
+    grupos: Dict[str, List[str]] = OrderedDict()
+    for nodeid in duraciones:
+        grupos.setdefault(grupo_de_test(nodeid), []).append(nodeid)
+
+    total = sum(duraciones.values())
+    carga_ideal = total / max(num_workers, 1)
+
+    unidades: Dict[str, List[str]] = {}
+    for grupo, nodeids in grupos.items():
+        nodeids.sort(key=lambda n: -duraciones[n])
+        duracion_grupo = sum(duraciones[n] for n in nodeids)
+        num_bloques = min(len(nodeids), max(1, int(-(-duracion_grupo // carga_ideal)))) if carga_ideal > 0 else 1
+
+        if num_bloques == 1:
+            unidades[grupo] = nodeids
+            continue
+
+        # Reparto LPT del grupo en 'num_bloques' sub-bloques: cada test va al bloque menos cargado.
+        bloques: List[List[str]] = [[] for _ in range(num_bloques)]
+        cargas = [0.0] * num_bloques
+        for nodeid in nodeids:
+            indice = cargas.index(min(cargas))
+            bloques[indice].append(nodeid)
+            cargas[indice] += duraciones[nodeid]
+        for indice, bloque in enumerate(bloques):
+            unidades[f"{grupo}::bloque{indice}"] = bloque
+
+    ordenadas = sorted(unidades.items(), key=lambda item: -sum(duraciones[n] for n in item[1]))
+    return OrderedDict(ordenadas)
+
+
+class PlanificadorPorDuracion(LoadScopeScheduling):
+    """
+    Planificador de xdist que reparte unidades de trabajo construidas con `repartir_en_unidades`.
+    Reutiliza la maquinaria de `LoadScopeScheduling` (asignación dinámica por unidad) y solo
+    sustituye la forma de agrupar y ordenar la cola de trabajo.
+    """
+
+    def __init__(self, config: pytest.Config, historial: HistorialDuraciones, log=None):
+        super().__init__(config, log)
+        self.historial = historial
+        self._unidad_por_nodeid: Dict[str, str] = {}
+
+    def _split_scope(self, nodeid: str) -> str:
+        return self._unidad_por_nodeid.get(nodeid, grupo_de_test(nodeid))
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        # La distribución inicial ya se hizo: solo se reprograma (ej: un worker nuevo tras una caída).
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        # --- Medición de rendimiento: construcción del plan ---
+        start_time_plan = time.time()
+        duraciones = self.historial.estimar(self.collection)
+        unidades = repartir_en_unidades(duraciones, len(self.nodes))
+        for unidad, nodeids in unidades.items():
+            self.workqueue[unidad] = {nodeid: False for nodeid in nodeids}
+            for nodeid in nodeids:
+                self._unidad_por_nodeid[nodeid] = unidad
+        duration_plan = time.time() - start_time_plan
+
+        estimado_por_unidad = {unidad: round(sum(duraciones[n] for n in nodeids), 2) for unidad, nodeids in unidades.items()}
+        logger.info(f"PERFORMANCE: Plan de distribución por duración construido en {duration_plan:.4f} segundos. "
+                    f"{len(self.collection)} tests en {len(unidades)} unidades para {len(self.nodes)} workers.")
+        logger.debug(f"\nDuración estimada por unidad (s): {estimado_por_unidad}")
+
+        # Evita tener más workers que unidades de trabajo.
+        extra_nodes = len(self.nodes) - len(self.workqueue)
+        for _ in range(max(extra_nodes, 0)):
+            unused_node, _assigned = self.assigned_work.popitem()
+            unused_node.shutdown()
+
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+
+        if not self.workqueue:
+            for node in self.nodes:
+                node.shutdown()
+
+
+# --- Hooks del plugin ---
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("planificador_duraciones", "Planificación de xdist por duración histórica")
+    group.addoption(
+        "--planificar-por-duracion",
+        action="store_true",
+        default=False,
+        help="Distribuye los tests entre workers de xdist según su duración histórica (mayor primero) "
+             "y agrupados por navegador/dispositivo."
+    )
+    group.addoption(
+        "--historial-duraciones",
+        action="store",
+        default=HISTORIAL_DURACIONES_FILE,
+        help="Ruta del archivo JSON donde se registran las duraciones de los tests."
+    )
+
+
+class RegistradorDuraciones:
+    """
+    Plugin que acumula la duración de cada test durante la sesión y actualiza el historial al final.
+    Solo el proceso controlador (o la ejecución sin xdist) escribe el archivo: los reportes de los
+    workers también llegan al controlador, lo que evita escrituras concurrentes.
+    """
+
+    def __init__(self, historial: HistorialDuraciones):
+        self.historial = historial
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        self.historial.registrar(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        self.historial.guardar()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config._historial_duraciones = HistorialDuraciones(config.getoption("--historial-duraciones"))
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(RegistradorDuraciones(config._historial_duraciones), "registrador_duraciones")
+
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log):
+    if not config.getoption("--planificar-por-duracion"):
+        return None
+    logger.info("\nUsando el planificador de xdist por duración histórica (LPT + afinidad por dispositivo).")
+    return PlanificadorPorDuracion(config, config._historial_duraciones, log)
@@ -0,0 +1,175 @@
+"""
+Registro de la actividad de red de una página, expuesto como `BasePage.red`.
+
+Se suscribe a los eventos 'request', 'response', 'requestfinished' y 'requestfailed' de la página y guarda
+un `RegistroSolicitud` (con `__slots__`) por solicitud en un búfer circular (`deque` con `maxlen`), de modo
+que la memoria es constante aunque el test cargue muchas páginas. Los manejadores solo copian referencias
+y toman `time.perf_counter()`; nada se consulta al navegador hasta que un test lo pide.
+
+Consultas habituales:
+    base_page.red.fallidas()                       # 4xx/5xx y solicitudes que no obtuvieron respuesta por un error
+    base_page.red.mas_lentas(5)
+    base_page.red.respuestas("**/api/**")          # patrón glob o expresión regular compilada
+    with base_page.red.paso_sin_errores("login"):  # falla si en el bloque hubo algún 4xx/5xx o error de red
+        ...
+
+No cuentan como fallos las solicitudes abortadas por el perfil de red (utils/perfil_red.py) ni las que el
+navegador cancela al abandonar la página (net::ERR_ABORTED y equivalentes): ambas se marcan como `cancelada`.
+"""
+import re
+import time
+import fnmatch
+import itertools
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional, Pattern, Union
+
+from playwright.sync_api import Page, Request, Response
+
+from utils.perfil_red import fue_bloqueada
+
+CAPACIDAD_POR_DEFECTO = 1000
+# Textos de error con los que Chromium, Firefox y WebKit informan de una solicitud cancelada por el propio
+# navegador (navegación a otra página, recarga, imagen sustituida...), que no es un fallo de la aplicación.
+ERRORES_CANCELACION = ("net::ERR_ABORTED", "net::ERR_BLOCKED_BY_CLIENT", "NS_BINDING_ABORTED", "cancelled")
+
+
+class RegistroSolicitud:
+    """Una solicitud de red observada por el registrador."""
+
+    __slots__ = ("secuencia", "url", "metodo", "tipo", "inicio", "fin", "status", "respuesta", "error", "cancelada")
+
+    def __init__(self, secuencia: int, request: Request):
+        self.secuencia = secuencia
+        self.url = request.url
+        self.metodo = request.method
+        self.tipo = request.resource_type
+        self.inicio = time.perf_counter()
+        self.fin: Optional[float] = None
+        self.status: Optional[int] = None
+        self.respuesta: Optional[Response] = None
+        self.error: Optional[str] = None
+        self.cancelada = False
+
+    @property
+    def duracion_ms(self) -> Optional[float]:
+        """Milisegundos desde la solicitud hasta que terminó (o falló); `None` si sigue en curso."""
+        return None if self.fin is None else (self.fin - self.inicio) * 1000
+
+    @property
+    def fallida(self) -> bool:
+        """Una solicitud con respuesta 4xx/5xx o que falló por un error de red (no por bloqueo o cancelación)."""
+        return (self.error is not None and not self.cancelada) or (self.status is not None and self.status >= 400)
+
+    def __repr__(self) -> str:
+        estado = f"cancelada: {self.error}" if self.cancelada else (self.error or self.status)
+        duracion = "en curso" if self.duracion_ms is None else f"{self.duracion_ms:.1f} ms"
+        return f"<{self.metodo} {self.url} [{self.tipo}] -> {estado} ({duracion})>"
+
+
+def _compilar_patron(patron: Union[str, Pattern]) -> Pattern:
+    """Acepta un glob de URL ('**/api/**', '*.png') o una expresión regular ya compilada."""
+    return patron if isinstance(patron, re.Pattern) else re.compile(fnmatch.translate(patron))
+
+
+class RegistradorRed:
+    """Registrador de la actividad de red de una página con búfer circular de `capacidad` solicitudes."""
+
+    def __init__(self, page: Page, capacidad: int = CAPACIDAD_POR_DEFECTO):
+        self.page = page
+        self._registros: Deque[RegistroSolicitud] = deque(maxlen=capacidad)
+        # Solicitudes en curso: Playwright reutiliza el mismo objeto Request en todos sus eventos.
+        self._en_curso: Dict[Request, RegistroSolicitud] = {}
+        self._secuencia = itertools.count()
+        page.on("request", self._on_request)
+        page.on("response", self._on_response)
+        page.on("requestfinished", self._on_request_finished)
+        page.on("requestfailed", self._on_request_failed)
+
+    # --- Manejadores de eventos ---
+
+    def _on_request(self, request: Request) -> None:
+        registro = RegistroSolicitud(next(self._secuencia), request)
+        self._registros.append(registro)
+        self._en_curso[request] = registro
+
+    def _on_response(self, response: Response) -> None:
+        registro = self._en_curso.get(response.request)
+        if registro is not None:
+            registro.status = response.status
+            registro.respuesta = response
+
+    def _on_request_finished(self, request: Request) -> None:
+        registro = self._en_curso.pop(request, None)
+        if registro is not None:
+            registro.fin = time.perf_counter()
+
+    def _on_request_failed(self, request: Request) -> None:
+        registro = self._en_curso.pop(request, None)
+        if registro is not None:
+            registro.fin = time.perf_counter()
+            registro.error = request.failure or "fallida"
+            registro.cancelada = fue_bloqueada(request) or any(texto in registro.error for texto in ERRORES_CANCELACION)
+
+    # --- Consultas ---
+
+    @property
+    def registros(self) -> List[RegistroSolicitud]:
+        """Copia de los registros actuales, de la más antigua a la más reciente."""
+        return list(self._registros)
+
+    def limpiar(self) -> None:
+        """Vacía el registro (las solicitudes en curso se siguen completando, pero ya no se listan)."""
+        self._registros.clear()
+        self._en_curso.clear()
+
+    def marca(self) -> int:
+        """Secuencia de la próxima solicitud: permite consultar solo lo ocurrido a partir de este punto."""
+        return self._registros[-1].secuencia + 1 if self._registros else 0
+
+    def _desde(self, desde: int) -> Iterator[RegistroSolicitud]:
+        return (registro for registro in self._registros if registro.secuencia >= desde)
+
+    def fallidas(self, desde: int = 0) -> List[RegistroSolicitud]:
+        """Solicitudes con respuesta 4xx/5xx o con un error de red (sin contar bloqueos ni cancelaciones)."""
+        return [registro for registro in self._desde(desde) if registro.fallida]
+
+    def mas_lentas(self, n: int = 5, desde: int = 0) -> List[RegistroSolicitud]:
+        """Las `n` solicitudes terminadas más lentas, de mayor a menor duración."""
+        terminadas = [registro for registro in self._desde(desde) if registro.fin is not None]
+        return sorted(terminadas, key=lambda registro: registro.fin - registro.inicio, reverse=True)[:n]
+
+    def respuestas(self, patron: Union[str, Pattern], tipo: Optional[str] = None, desde: int = 0) -> List[RegistroSolicitud]:
+        """Solicitudes con respuesta cuya URL coincide con el patrón (y, opcionalmente, con el tipo de recurso)."""
+        regex = _compilar_patron(patron)
+        return [registro for registro in self._desde(desde)
+                if registro.status is not None and (tipo is None or registro.tipo == tipo) and regex.match(registro.url)]
+
+    def ultima_respuesta(self, url: str, tipo: Optional[str] = None) -> Optional[RegistroSolicitud]:
+        """La respuesta más reciente para exactamente esa URL, o `None` si no se ha registrado."""
+        for registro in reversed(self._registros):
+            if registro.url == url and registro.status is not None and (tipo is None or registro.tipo == tipo):
+                return registro
+        return None
+
+    # --- Aserciones ---
+
+    def afirmar_sin_errores(self, desde: int = 0, descripcion: str = "la página") -> None:
+        """
+        Falla si alguna solicitud registrada desde `desde` terminó con 4xx/5xx o con un error de red.
+        Las solicitudes bloqueadas por el perfil de red o canceladas por el navegador no cuentan.
+
+        Raises:
+            AssertionError: Con la lista de solicitudes fallidas.
+        """
+        fallidas = self.fallidas(desde)
+        if fallidas:
+            detalle = "\n".join(f"  - {registro!r}" for registro in fallidas)
+            raise AssertionError(f"\n❌ FALLO: {len(fallidas)} solicitudes de red fallidas durante {descripcion}:\n{detalle}")
+
+    @contextmanager
+    def paso_sin_errores(self, nombre: str = "el paso") -> Iterator["RegistradorRed"]:
+        """Bloque `with` que falla al salir si alguna solicitud iniciada dentro terminó con 4xx/5xx o error de red."""
+        desde = self.marca()
+        yield self
+        self.afirmar_sin_errores(desde, descripcion=f"'{nombre}'")